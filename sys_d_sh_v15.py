@@ -8,7 +8,13 @@ import json
 import time
 import uuid
 import getpass
-from collections import OrderedDict
+import signal
+import re
+import hashlib
+import sqlite3
+import threading
+import asyncio
+from collections import OrderedDict, namedtuple
 
 
 # -------------------------------------------------------------------
@@ -280,44 +286,342 @@ def simulate_scan_step(step_name, duration=1, steps=20):
 # -------------------------------------------------------------------
 #  ENHANCED COMMAND EXECUTOR WITH ENCODING FIX
 # -------------------------------------------------------------------
-command_cache = {}
+# At most this many external commands run at once
+COMMAND_CONCURRENCY = 4
+COMMAND_TIMEOUT = 30
 
+CommandResult = namedtuple("CommandResult", "output timed_out reaped duration")
 
-def run_cmd(cmd, use_cache=True, task_name="Executing command"):
-    cache_key = f"{cmd}_{platform.system()}"
 
-    if use_cache and cache_key in command_cache:
-        cached_time, output = command_cache[cache_key]
-        if (datetime.now() - cached_time).seconds < 300:
-            return output
+def kill_process_tree(pid):
+    """Kill a timed-out command's whole process group; return how many stragglers were reaped"""
+    try:
+        members = psutil.Process(pid).children(recursive=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        members = []
+
+    if platform.system() != "Windows":
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    for member in members:
+        try:
+            member.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    try:
+        psutil.Process(pid).kill()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    # Killed members count as reaped once they exit or are left as zombies for init
+    deadline = time.time() + 1
+    alive = list(members)
+    while alive and time.time() < deadline:
+        still_alive = []
+        for member in alive:
+            try:
+                if member.is_running() and member.status() != psutil.STATUS_ZOMBIE:
+                    still_alive.append(member)
+            except psutil.NoSuchProcess:
+                pass
+        alive = still_alive
+        if alive:
+            time.sleep(0.02)
+    return len(members) - len(alive)
+
+
+class CommandRunner:
+    """Run shell commands concurrently on a private asyncio loop.
+
+    Collectors stay synchronous: run() blocks on one command, run_many() on a
+    batch that executes side by side, at most COMMAND_CONCURRENCY at a time.
+    """
+
+    def __init__(self, max_concurrency=COMMAND_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=run_loop, name="command-runner", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def run_async(self, cmd, timeout=COMMAND_TIMEOUT):
+        async with self._semaphore:
+            start_time = time.time()
+            # Own session/process group so a timeout can kill the whole pipeline
+            if platform.system() == "Windows":
+                group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_kwargs = {"start_new_session": True}
+            proc = await asyncio.create_subprocess_shell(
+                cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL, **group_kwargs)
+
+            chunks = []
+
+            async def pump():
+                while True:
+                    chunk = await proc.stdout.read(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                await proc.wait()
+
+            try:
+                await asyncio.wait_for(pump(), timeout)
+            except asyncio.TimeoutError:
+                loop = asyncio.get_running_loop()
+                reaped = await loop.run_in_executor(None, kill_process_tree, proc.pid)
+                try:
+                    await asyncio.wait_for(proc.wait(), 1)
+                except asyncio.TimeoutError:
+                    pass
+                return CommandResult(None, True, reaped, time.time() - start_time)
+
+            # Same newline handling as a text-mode pipe
+            output = b"".join(chunks).decode('utf-8', errors='ignore')
+            output = output.replace('\r\n', '\n').replace('\r', '\n')
+            return CommandResult(output, False, 0, time.time() - start_time)
+
+    def run(self, cmd, timeout=COMMAND_TIMEOUT):
+        return asyncio.run_coroutine_threadsafe(self.run_async(cmd, timeout), self._ensure_loop()).result()
+
+    def run_many(self, cmds, timeout=COMMAND_TIMEOUT):
+        """Results (or the exception raised) for each command, in order"""
+        async def gather():
+            return await asyncio.gather(*(self.run_async(cmd, timeout) for cmd in cmds),
+                                        return_exceptions=True)
+
+        return asyncio.run_coroutine_threadsafe(gather(), self._ensure_loop()).result()
+
+
+command_runner = CommandRunner()
+
+
+# Volatile output (accounts, sessions, networks) stays in memory for a few minutes;
+# slow-changing classes persist across runs in the scanner's cache directory
+COMMAND_CACHE_TTL = 300
+COMMAND_CACHE_MEMORY_ENTRIES = 256
+COMMAND_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "sys_scanner", "command_cache.sqlite3")
+COMMAND_CACHE_MAX_BYTES = 16 * 1024 * 1024
+COMMAND_CACHE_TTLS = {
+    "static": 6 * 3600,        # hardware/driver queries
+    "packages": 7 * 24 * 3600  # installed software, also invalidated when the package DB changes
+}
+
+COMMAND_CLASS_PATTERNS = [
+    ("packages", re.compile(r'^(wmic product|powershell "Get-ItemProperty HKLM:\S*\\Uninstall)')),
+    ("static", re.compile(r"^(driverquery|systeminfo|wmic (bios|baseboard|csproduct|path win32_videocontroller))")),
+]
 
+PACKAGE_DB_PATHS = [
+    os.path.join(os.environ.get("SystemRoot", r"C:\Windows"), "System32", "config", "SOFTWARE"),
+    "/var/lib/dpkg/status",
+    "/var/lib/rpm/rpmdb.sqlite",
+    "/var/lib/rpm/Packages",
+]
+
+
+def classify_command(cmd):
+    """Cache class for a command ('packages', 'static') or None for volatile output"""
+    for command_class, pattern in COMMAND_CLASS_PATTERNS:
+        if pattern.match(cmd.strip()):
+            return command_class
+    return None
+
+
+def get_boot_id():
+    """Identifier that changes on every reboot"""
     try:
-        start_time = time.time()
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        try:
+            return str(int(psutil.boot_time()))
+        except Exception:
+            return "unknown"
+
+
+def file_fingerprint(paths):
+    """(path, mtime, inode, size) of every path that exists, as a string"""
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            parts.append(f"{path}:{st.st_mtime_ns}:{st.st_ino}:{st.st_size}")
+        except OSError:
+            continue
+    return "|".join(parts)
+
+
+class CommandCache:
+    """Bounded command-output cache: an in-memory LRU plus a disk-backed store.
+
+    Every command is cached in memory for COMMAND_CACHE_TTL seconds, evicting the
+    least recently used entry beyond COMMAND_CACHE_MEMORY_ENTRIES. Static and
+    package queries are also written to a SQLite file (same schema as
+    sys_d_v19's cache) keyed by command, host and boot ID, expired per class and
+    LRU-trimmed to COMMAND_CACHE_MAX_BYTES, so back-to-back runs skip them.
+    """
+
+    def __init__(self, path=COMMAND_CACHE_PATH, max_bytes=COMMAND_CACHE_MAX_BYTES, ttls=COMMAND_CACHE_TTLS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        self.host = socket.gethostname()
+        self.boot_id = get_boot_id()
+        self._memory = OrderedDict()  # cmd -> (time stored, output)
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS command_cache (
+                                key TEXT PRIMARY KEY,
+                                cmd TEXT NOT NULL,
+                                output TEXT NOT NULL,
+                                created REAL NOT NULL,
+                                last_used REAL NOT NULL,
+                                expires REAL NOT NULL,
+                                fingerprint TEXT NOT NULL,
+                                size INTEGER NOT NULL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_command_cache_lru ON command_cache(last_used)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _key(self, cmd):
+        return hashlib.sha256(f"{self.host}\0{self.boot_id}\0{cmd}".encode('utf-8')).hexdigest()
+
+    def _fingerprint(self, command_class):
+        return file_fingerprint(PACKAGE_DB_PATHS) if command_class == "packages" else ""
+
+    def get(self, cmd):
+        """Cached output for cmd, or None if missing, expired or invalidated"""
+        with self._lock:
+            entry = self._memory.get(cmd)
+            if entry and time.time() - entry[0] < COMMAND_CACHE_TTL:
+                self._memory.move_to_end(cmd)
+                return entry[1]
+            self._memory.pop(cmd, None)
+
+            command_class = classify_command(cmd)
+            if command_class not in self.ttls:
+                return None
+            try:
+                conn = self._connect()
+                try:
+                    row = conn.execute("SELECT output, expires, fingerprint FROM command_cache WHERE key = ?",
+                                       (self._key(cmd),)).fetchone()
+                    now = time.time()
+                    if row is None or row[1] < now or row[2] != self._fingerprint(command_class):
+                        return None
+                    conn.execute("UPDATE command_cache SET last_used = ? WHERE key = ?", (now, self._key(cmd)))
+                    conn.commit()
+                    return row[0]
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError):
+                return None
+
+    def put(self, cmd, output):
+        with self._lock:
+            self._memory[cmd] = (time.time(), output)
+            self._memory.move_to_end(cmd)
+            while len(self._memory) > COMMAND_CACHE_MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+            command_class = classify_command(cmd)
+            if command_class not in self.ttls:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = self._connect()
+                try:
+                    now = time.time()
+                    conn.execute("INSERT OR REPLACE INTO command_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (self._key(cmd), cmd, output, now, now, now + self.ttls[command_class],
+                                  self._fingerprint(command_class), len(output.encode('utf-8'))))
+                    self._evict(conn)
+                    conn.commit()
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError):
+                pass
 
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            timeout=30
-        )
+    def _evict(self, conn):
+        """Drop expired entries, then least-recently-used ones until under the size cap"""
+        conn.execute("DELETE FROM command_cache WHERE expires < ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM command_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM command_cache ORDER BY last_used").fetchall():
+            conn.execute("DELETE FROM command_cache WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
 
-        execution_time = time.time() - start_time
-        output = result.stdout.strip()
 
-        if use_cache:
-            command_cache[cache_key] = (datetime.now(), output)
+command_cache = CommandCache()
 
-        return output
 
-    except subprocess.TimeoutExpired:
-        print_status(f"{task_name} timed out", "ERROR")
+def _command_output(cmd, result, use_cache, task_name):
+    if isinstance(result, Exception):
+        print_status(f"{task_name} failed: {str(result)}", "ERROR")
+        return f"[ERROR] Command failed: {str(result)}"
+    if result.timed_out:
+        print_status(f"{task_name} timed out ({result.reaped} stray processes reaped)", "ERROR")
         return "[TIMEOUT] Command execution timeout"
+
+    output = result.output.strip()
+    if use_cache:
+        command_cache.put(cmd, output)
+    return output
+
+
+def run_cmd(cmd, use_cache=True, task_name="Executing command"):
+    if use_cache:
+        output = command_cache.get(cmd)
+        if output is not None:
+            return output
+
+    try:
+        result = command_runner.run(cmd)
     except Exception as e:
-        print_status(f"{task_name} failed: {str(e)}", "ERROR")
-        return f"[ERROR] Command failed: {str(e)}"
+        result = e
+    return _command_output(cmd, result, use_cache, task_name)
+
+
+def run_cmds(cmds, use_cache=True, task_name="Executing command"):
+    """run_cmd for several independent commands, executed concurrently; outputs in order"""
+    outputs = [command_cache.get(cmd) if use_cache else None for cmd in cmds]
+    pending = [index for index, output in enumerate(outputs) if output is None]
+    if pending:
+        try:
+            results = command_runner.run_many([cmds[index] for index in pending])
+        except Exception as e:
+            results = [e] * len(pending)
+        for index, result in zip(pending, results):
+            outputs[index] = _command_output(cmds[index], result, use_cache, task_name)
+    return outputs
 
 
 # -------------------------------------------------------------------
@@ -333,97 +637,162 @@ def get_downloads_folder():
 # -------------------------------------------------------------------
 #  ENHANCED TASK MANAGER WITH COMPREHENSIVE PROCESS INFORMATION
 # -------------------------------------------------------------------
+PROCESS_STATUS_NAMES = {
+    psutil.STATUS_RUNNING: "RUNNING",
+    psutil.STATUS_SLEEPING: "SLEEPING",
+    psutil.STATUS_DISK_SLEEP: "DISK_SLEEP",
+    psutil.STATUS_STOPPED: "STOPPED",
+    psutil.STATUS_TRACING_STOP: "TRACING",
+    psutil.STATUS_ZOMBIE: "ZOMBIE",
+    psutil.STATUS_DEAD: "DEAD",
+}
+
+
+class TaskRecord:
+    """One process, kept as raw values in slots; repeated strings are interned"""
+    __slots__ = ("pid", "name", "user", "cpu_percent", "memory_percent", "rss", "vms",
+                 "num_threads", "status", "nice", "cpu_time", "create_time", "exe")
+
+    def __init__(self, info):
+        memory_info = info.get('memory_info')
+        cpu_times = info.get('cpu_times')
+        status = info.get('status') or "unknown"
+        self.pid = info['pid']
+        self.name = sys.intern((info.get('name') or "")[:45])  # Truncate long names
+        self.user = sys.intern(info.get('username') or "SYSTEM")
+        self.cpu_percent = info.get('cpu_percent') or 0.0
+        self.memory_percent = info.get('memory_percent') or 0.0
+        self.rss = memory_info.rss if memory_info else None
+        self.vms = memory_info.vms if memory_info else None
+        self.num_threads = info.get('num_threads')
+        self.status = sys.intern(PROCESS_STATUS_NAMES.get(status, status.upper()))
+        self.nice = info.get('nice')
+        self.cpu_time = (cpu_times.user + cpu_times.system) if cpu_times else None
+        self.create_time = info.get('create_time')
+        self.exe = sys.intern(info['exe']) if info.get('exe') else None
+
+    def to_dict(self, now=None):
+        """The formatted row the HTML report renders"""
+        exe_path = self.exe or "N/A"
+        if len(exe_path) > 40:
+            exe_path = "..." + exe_path[-37:]
+
+        # Determine process priority
+        priority = "LOW"
+        if self.nice is not None:
+            if self.nice < 0:
+                priority = "HIGH"
+            elif self.nice == 0:
+                priority = "NORMAL"
+
+        started = datetime.fromtimestamp(self.create_time)
+        uptime = (now or datetime.now()) - started
+        return {
+            "PID": self.pid,
+            "Process Name": self.name,
+            "User": self.user,
+            "CPU %": f"{self.cpu_percent:.2f}",
+            "Memory %": f"{self.memory_percent:.3f}",
+            "Memory Usage": f"{self.rss / (1024 * 1024):.2f} MB" if self.rss is not None else "N/A",
+            "Virtual Memory": f"{self.vms / (1024 * 1024):.2f} MB" if self.vms is not None else "N/A",
+            "Threads": self.num_threads if self.num_threads is not None else "N/A",
+            "Status": self.status,
+            "Priority": priority,
+            "CPU Time": f"{self.cpu_time:.2f}s" if self.cpu_time is not None else "N/A",
+            "Uptime": str(uptime).split('.')[0],
+            "Started": started.strftime('%H:%M:%S'),
+            "Executable": exe_path
+        }
+
+
+class TaskTable:
+    """Compact process table; rows become report dicts only while being rendered"""
+
+    def __init__(self, records):
+        self.records = records
+        self.now = datetime.now()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [record.to_dict(self.now) for record in self.records[index]]
+        return self.records[index].to_dict(self.now)
+
+    def __iter__(self):
+        for record in self.records:
+            yield record.to_dict(self.now)
+
+    def to_dicts(self):
+        return list(self)
+
+
+TASK_ATTRS = ['pid', 'name', 'username', 'memory_percent', 'memory_info', 'create_time', 'status',
+              'cpu_times', 'num_threads', 'exe', 'nice']
+PROCESS_CPU_WINDOW = 0.5  # seconds; one window shared by system and per-process CPU
+
+ProcessSnapshot = namedtuple("ProcessSnapshot", "records cpu_usage zombie_count high_cpu_processes")
+
+_process_snapshot = None
+
+
+def get_process_snapshot(refresh=False):
+    """The scan's one walk of the process table, shared by the task manager and the health score.
+
+    System and per-process CPU are primed together and read after the same
+    PROCESS_CPU_WINDOW; each process is then read once under oneshot().
+    """
+    global _process_snapshot
+    if _process_snapshot is not None and not refresh:
+        return _process_snapshot
+
+    processes = list(psutil.process_iter())
+    psutil.cpu_percent(interval=None)
+    for proc in processes:
+        try:
+            proc.cpu_percent(None)
+        except psutil.Error:
+            continue
+    time.sleep(PROCESS_CPU_WINDOW)
+    cpu_usage = psutil.cpu_percent(interval=None)
+
+    records = []
+    zombie_count = high_cpu_processes = 0
+    for proc in processes:
+        try:
+            with proc.oneshot():
+                info = proc.as_dict(TASK_ATTRS, ad_value=None)
+                try:
+                    info['cpu_percent'] = proc.cpu_percent(None)
+                except psutil.ZombieProcess:
+                    info['cpu_percent'] = 0.0
+            record = TaskRecord(info)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        except (TypeError, ValueError, OSError):
+            continue
+        records.append(record)
+        if record.status == "ZOMBIE":
+            zombie_count += 1
+        if record.cpu_percent > 50:  # Processes using >50% CPU
+            high_cpu_processes += 1
+
+    _process_snapshot = ProcessSnapshot(records, cpu_usage, zombie_count, high_cpu_processes)
+    return _process_snapshot
+
+
 def get_task_manager_details():
     print("\n\t", end='')
     print_status("Collecting comprehensive process information...", "SYSTEM")
-    processes = []
 
     try:
         # Get all processes with detailed information
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent',
-                                         'memory_info', 'create_time', 'status', 'cpu_times',
-                                         'num_threads', 'exe', 'nice', 'ionice']):
-            try:
-                process_info = proc.info
-
-                # Calculate process uptime
-                create_time = process_info['create_time']
-                uptime = datetime.now() - datetime.fromtimestamp(create_time)
-
-                # Get CPU times
-                cpu_times = process_info.get('cpu_times')
-                if cpu_times:
-                    cpu_time_str = f"{(cpu_times.user + cpu_times.system):.2f}s"
-                else:
-                    cpu_time_str = "N/A"
-
-                # Get memory details
-                memory_info = process_info.get('memory_info')
-                if memory_info:
-                    memory_mb = f"{memory_info.rss / (1024 * 1024):.2f} MB"
-                    memory_vms = f"{memory_info.vms / (1024 * 1024):.2f} MB"
-                else:
-                    memory_mb = "N/A"
-                    memory_vms = "N/A"
-
-                # Get executable path and truncate if too long
-                exe_path = process_info.get('exe', 'N/A')
-                if exe_path and len(exe_path) > 40:
-                    exe_path = "..." + exe_path[-37:]
-
-                # Determine process priority
-                nice = process_info.get('nice', 'N/A')
-                priority = "LOW"
-                if nice is not None:
-                    if nice < 0:
-                        priority = "HIGH"
-                    elif nice == 0:
-                        priority = "NORMAL"
-                    else:
-                        priority = "LOW"
-
-                # Get process state with more detailed status
-                status = process_info['status']
-                if status == psutil.STATUS_RUNNING:
-                    status_detailed = "RUNNING"
-                elif status == psutil.STATUS_SLEEPING:
-                    status_detailed = "SLEEPING"
-                elif status == psutil.STATUS_DISK_SLEEP:
-                    status_detailed = "DISK_SLEEP"
-                elif status == psutil.STATUS_STOPPED:
-                    status_detailed = "STOPPED"
-                elif status == psutil.STATUS_TRACING_STOP:
-                    status_detailed = "TRACING"
-                elif status == psutil.STATUS_ZOMBIE:
-                    status_detailed = "ZOMBIE"
-                elif status == psutil.STATUS_DEAD:
-                    status_detailed = "DEAD"
-                else:
-                    status_detailed = status.upper()
-
-                processes.append({
-                    "PID": process_info['pid'],
-                    "Process Name": process_info['name'][:45],  # Truncate long names
-                    "User": process_info['username'] or "SYSTEM",
-                    "CPU %": f"{process_info['cpu_percent'] or 0:.2f}",
-                    "Memory %": f"{process_info['memory_percent'] or 0:.3f}",
-                    "Memory Usage": memory_mb,
-                    "Virtual Memory": memory_vms,
-                    "Threads": process_info.get('num_threads', 'N/A'),
-                    "Status": status_detailed,
-                    "Priority": priority,
-                    "CPU Time": cpu_time_str,
-                    "Uptime": str(uptime).split('.')[0],
-                    "Started": datetime.fromtimestamp(create_time).strftime('%H:%M:%S'),
-                    "Executable": exe_path
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-
+        records = list(get_process_snapshot().records)
     except Exception as e:
         print("\t", end='')
         print_status(f"Process collection error: {str(e)}", "ERROR")
-        processes.append({
+        return [{
             "PID": "ERROR",
             "Process Name": f"Failed to get processes: {str(e)}",
             "User": "N/A",
@@ -431,18 +800,14 @@ def get_task_manager_details():
             "Memory %": "N/A",
             "Memory Usage": "N/A",
             "Status": "ERROR"
-        })
+        }]
 
-    # Sort by CPU usage descending
-    try:
-        processes.sort(key=lambda x: float(x['CPU %'].replace('%', '')) if x['CPU %'] != 'N/A' else 0, reverse=True)
-        print("\t", end='')
-        print_status(f"Collected {len(processes)} processes, sorted by CPU usage", "SUCCESS")
-    except:
-        print("\n\t", end='')
-        print_status(f"Collected {len(processes)} processes", "WARNING")
+    # Sort by CPU usage descending, on the raw numbers
+    records.sort(key=lambda record: record.cpu_percent, reverse=True)
+    print("\t", end='')
+    print_status(f"Collected {len(records)} processes, sorted by CPU usage", "SUCCESS")
 
-    return processes[:]  # Return top 200 processes by CPU usage
+    return TaskTable(records)
 
 
 def get_system_performance():
@@ -544,9 +909,10 @@ def get_users_information():
             print("\t", end='')
             print_status(f"Found {len(users)} user accounts", "DATA")
 
-            for user in users:
+            # One "net user <name>" per account; run them side by side
+            all_details = run_cmds([f'net user "{user}"' for user in users])
+            for user, user_details in zip(users, all_details):
                 try:
-                    user_details = run_cmd(f'net user "{user}"')
                     user_data = {
                         "Username": user,
                         "Full Name": "N/A",
@@ -597,134 +963,138 @@ def get_users_information():
 # -------------------------------------------------------------------
 #  ENHANCED SYSTEM HEALTH SCORING ALGORITHMS
 # -------------------------------------------------------------------
-def get_system_health_score():
-    """Comprehensive system health scoring with weighted factors"""
-    score = 100
-    warnings = []
+# Each rule reads one metric and walks its bands in order: the first
+# (limit, points, severity) whose limit the value exceeds applies. Metrics are
+# either a number or a list of (subject, value) pairs scored one by one, with
+# the rule's total clamped to +/- cap. The bands reproduce this script's
+# original weighted score; MINOR hits cost points but don't count as warnings.
+HealthRule = namedtuple("HealthRule", "name metric bands cap message")
+HealthReport = namedtuple("HealthReport", "score hits")
+
+HEALTH_BASE_SCORE = 100
+HEALTH_CLEAN_BONUS = 3  # no warnings at all
+HEALTH_WARNING_SEVERITIES = ("CRITICAL", "WARNING", "NOTICE")
+HEALTH_RULES = (
+    HealthRule("CPU", "cpu_usage",
+               ((90, -20, "CRITICAL"), (80, -15, "WARNING"), (70, -10, "NOTICE"), (60, -5, "MINOR")),
+               None, "CPU usage at {value:.1f}%"),
+    HealthRule("Memory", "memory_usage",
+               ((95, -20, "CRITICAL"), (85, -15, "WARNING"), (75, -10, "NOTICE"), (65, -5, "MINOR")),
+               None, "Memory usage at {value:.1f}%"),
+    HealthRule("Disk", "disk_usage", ((95, -3, "CRITICAL"), (90, -2, "WARNING"), (85, -1, "NOTICE")),
+               15, "Disk {subject} at {value:.1f}%"),
+    HealthRule("Critical Disks", "critical_disks", ((0, -5, "MINOR"),),
+               None, "{value:.0f} disk(s) above 95%"),
+    HealthRule("Temperature", "temperature", ((85, -3, "CRITICAL"), (75, -2, "WARNING"), (65, -1, "MINOR")),
+               12, "Sensor {subject} at {value:.1f}°C"),
+    HealthRule("Process", "zombie_count", ((5, -8, "WARNING"), (0, -4, "MINOR")),
+               None, "{value:.0f} zombie process(es)"),
+    HealthRule("Process", "high_cpu_processes", ((3, -7, "NOTICE"),),
+               None, "{value:.0f} high-CPU processes"),
+    HealthRule("Performance", "idle", ((0, 5, "OK"),),
+               None, "CPU below 30% and memory below 50%"),
+)
+
+_health_report = None
+
+
+def gather_health_metrics():
+    """Typed inputs for HEALTH_RULES; CPU and process counts come from the shared process snapshot"""
+    metrics = {"cpu_usage": None, "memory_usage": None, "disk_usage": [], "critical_disks": 0,
+               "temperature": [], "zombie_count": None, "high_cpu_processes": None, "idle": 0}
+
+    snapshot = get_process_snapshot()
+    metrics["cpu_usage"] = snapshot.cpu_usage
+    metrics["zombie_count"] = snapshot.zombie_count
+    metrics["high_cpu_processes"] = snapshot.high_cpu_processes
+
+    metrics["memory_usage"] = psutil.virtual_memory().percent
 
-    try:
-        # CPU Health (25 points)
-        cpu_usage = psutil.cpu_percent(interval=1)
-        if cpu_usage > 90:
-            score -= 20
-            warnings.append("[CPU Health]  CRITICAL: CPU usage very high")
-        elif cpu_usage > 80:
-            score -= 15
-            warnings.append("[CPU Health]  WARNING: CPU usage high")
-        elif cpu_usage > 70:
-            score -= 10
-            warnings.append("[CPU Health]  NOTICE: CPU usage elevated")
-        elif cpu_usage > 60:
-            score -= 5
-
-        # Memory Health (25 points)
-        memory = psutil.virtual_memory()
-        if memory.percent > 95:
-            score -= 20
-            warnings.append("[Memory Health]  CRITICAL: Memory usage very high")
-        elif memory.percent > 85:
-            score -= 15
-            warnings.append("[Memory Health]  WARNING: Memory usage high")
-        elif memory.percent > 75:
-            score -= 10
-            warnings.append("[Memory Health]  NOTICE: Memory usage elevated")
-        elif memory.percent > 65:
-            score -= 5
-
-        # Disk Health (20 points)
-        disk_warnings = 0
-        critical_disks = 0
-        for part in psutil.disk_partitions():
-            try:
-                # Skip CD-ROM and other non-writable drives
-                if 'cdrom' in part.opts or part.fstype == '':
-                    continue
-
-                usage = psutil.disk_usage(part.mountpoint)
-                if usage.percent > 95:
-                    disk_warnings += 3
-                    critical_disks += 1
-                    warnings.append(f"[Disk Health]  CRITICAL: Disk {part.device} at {usage.percent}%")
-                elif usage.percent > 90:
-                    disk_warnings += 2
-                    warnings.append(f"[Disk Health]  WARNING: Disk {part.device} at {usage.percent}%")
-                elif usage.percent > 85:
-                    disk_warnings += 1
-                    warnings.append(f"[Disk Health]  NOTICE: Disk {part.device} at {usage.percent}%")
-            except:
-                continue
-
-        score -= min(disk_warnings, 15)
-        if critical_disks > 0:
-            score -= 5
-
-        # Temperature Health (15 points) - if available
+    for part in psutil.disk_partitions():
         try:
-            temps = psutil.sensors_temperatures()
-            if temps:
-                high_temp_count = 0
-                for name, entries in temps.items():
-                    for entry in entries:
-                        if entry.current > 85:
-                            high_temp_count += 3
-                            warnings.append(f"[Temperature Health]  CRITICAL: {name} temperature {entry.current}°C")
-                        elif entry.current > 75:
-                            high_temp_count += 2
-                            warnings.append(f"[Temperature Health]  WARNING: {name} temperature {entry.current}°C")
-                        elif entry.current > 65:
-                            high_temp_count += 1
-                score -= min(high_temp_count, 12)
+            # Skip CD-ROM and other non-writable drives
+            if 'cdrom' in part.opts or part.fstype == '':
+                continue
+            metrics["disk_usage"].append((part.device, psutil.disk_usage(part.mountpoint).percent))
         except:
-            pass
+            continue
+    metrics["critical_disks"] = sum(1 for _, usage in metrics["disk_usage"] if usage > 95)
 
-        # Process Health (15 points)
-        try:
-            zombie_count = 0
-            high_cpu_processes = 0
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'status']):
-                try:
-                    info = proc.info
-                    if info['status'] == psutil.STATUS_ZOMBIE:
-                        zombie_count += 1
-                    if info.get('cpu_percent', 0) > 50:  # Processes using >50% CPU
-                        high_cpu_processes += 1
-                except:
-                    continue
+    try:
+        temps = psutil.sensors_temperatures()
+        for name, entries in (temps or {}).items():
+            for entry in entries:
+                metrics["temperature"].append((name, entry.current))
+    except:
+        pass
+
+    # Bonus for excellent performance
+    if metrics["cpu_usage"] < 30 and metrics["memory_usage"] < 50:
+        metrics["idle"] = 1
+    return metrics
+
+
+def evaluate_health_rules(metrics, rules=HEALTH_RULES, base_score=HEALTH_BASE_SCORE,
+                          clean_bonus=HEALTH_CLEAN_BONUS):
+    """Score plus the list of rule hits for one set of health metrics"""
+    score = base_score
+    hits = []
+    for rule in rules:
+        value = metrics.get(rule.metric)
+        if value is None:
+            continue
+        total = 0
+        for subject, item_value in (value if isinstance(value, list) else [(None, value)]):
+            for limit, points, severity in rule.bands:
+                if item_value > limit:
+                    total += points
+                    hits.append({
+                        "Rule": rule.name,
+                        "Severity": severity,
+                        "Points": f"{points:+d}",
+                        "Finding": rule.message.format(subject=subject, value=item_value)
+                    })
+                    break
+        if rule.cap is not None:
+            total = max(-rule.cap, min(rule.cap, total))
+        score += total
 
-            if zombie_count > 5:
-                score -= 8
-                warnings.append(f"[Process Health]  WARNING: {zombie_count} zombie processes")
-            elif zombie_count > 0:
-                score -= 4
+    # Bonus for no warnings
+    if clean_bonus and not any(hit["Severity"] in HEALTH_WARNING_SEVERITIES for hit in hits):
+        score += clean_bonus
+        hits.append({"Rule": "Overall", "Severity": "OK", "Points": f"{clean_bonus:+d}",
+                     "Finding": "No warnings"})
+    return HealthReport(max(0, min(100, score)), hits)
 
-            if high_cpu_processes > 3:
-                score -= 7
-                warnings.append(f"[Process Health]  NOTICE: {high_cpu_processes} high-CPU processes")
-        except:
-            pass
 
-        # Apply bonus for good conditions
-        if cpu_usage < 30 and memory.percent < 50:
-            score += 5  # Bonus for excellent performance
-        if len(warnings) == 0:
-            score += 3  # Bonus for no warnings
+def get_system_health_report(refresh=False):
+    """HealthReport for this scan; measured once and reused by every caller"""
+    global _health_report
+    if _health_report is not None and not refresh:
+        return _health_report
 
+    try:
+        report = evaluate_health_rules(gather_health_metrics())
     except Exception as e:
         print_status(f"Health score calculation error: {str(e)}", "WARNING")
-        warnings.append(f"Health calculation error: {str(e)}")
-
-    # Ensure score is within bounds
-    final_score = max(0, min(100, score))
+        report = HealthReport(HEALTH_BASE_SCORE, [])
 
     # Log warnings if any
-    if warnings and final_score < 80:
+    problems = [hit for hit in report.hits if hit["Severity"] in HEALTH_WARNING_SEVERITIES]
+    if problems and report.score < 80:
         print("\t\t", end='')
-        print_status(f"Health score: {final_score}/100 - {len(warnings)} issues detected", "WARNING")
-        for warning in warnings[:3]:  # Show top 3 warnings
+        print_status(f"Health score: {report.score}/100 - {len(problems)} issues detected", "WARNING")
+        for hit in problems[:3]:  # Show top 3 warnings
             print("\t\t\t", end='')
-            print_status(f"  • {warning}", "WARNING")
+            print_status(f"  • [{hit['Rule']} Health]  {hit['Severity']}: {hit['Finding']}", "WARNING")
+
+    _health_report = report
+    return report
 
-    return final_score
+
+def get_system_health_score():
+    """Comprehensive system health scoring with weighted factors"""
+    return get_system_health_report().score
 
 
 def get_device_specifications():
@@ -936,9 +1306,10 @@ def get_comprehensive_wifi_analysis():
             print("\t", end='')
             print_status(f"Found {len(profiles)} WiFi profiles", "DATA")
 
-            for profile in profiles:
+            profile_outputs = run_cmds([f'netsh wlan show profile name="{profile}" key=clear'
+                                        for profile in profiles])
+            for profile, key_output in zip(profiles, profile_outputs):
                 try:
-                    key_output = run_cmd(f'netsh wlan show profile name="{profile}" key=clear')
                     password = "Not stored or encrypted"
                     security = "Unknown"
                     connection_mode = "Unknown"
@@ -1228,7 +1599,12 @@ def get_hardware_details():
         # BIOS Information
         if platform.system() == "Windows":
             try:
-                bios_info = run_cmd("wmic bios get manufacturer,version,serialnumber,releasedate /format:csv")
+                # The independent wmic queries below run concurrently and land in the command cache
+                bios_info, _, _ = run_cmds([
+                    "wmic bios get manufacturer,version,serialnumber,releasedate /format:csv",
+                    "wmic baseboard get product,manufacturer,version,serialnumber /format:csv",
+                    "wmic csproduct get uuid",
+                ])
                 for line in bios_info.split('\n'):
                     if ',' in line and 'Node' not in line:
                         parts = line.split(',')
@@ -1385,10 +1761,13 @@ def get_security_information():
         # Windows Defender status
         if platform.system() == "Windows":
             try:
-                defender_status = run_cmd(
+                # Defender, firewall and UAC queries run concurrently; the later lookups hit the cache
+                defender_status, _, _ = run_cmds([
                     'powershell "Get-MpComputerStatus | Select-Object AntivirusEnabled, AMServiceEnabled, '
-                    'AntispywareEnabled, RealTimeProtectionEnabled, OnAccessProtectionEnabled | Format-List"'
-                )
+                    'AntispywareEnabled, RealTimeProtectionEnabled, OnAccessProtectionEnabled | Format-List"',
+                    'netsh advfirewall show allprofiles state',
+                    'reg query "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System" /v EnableLUA',
+                ])
 
                 for line in defender_status.split('\n'):
                     if ':' in line:
@@ -1526,6 +1905,12 @@ def get_health_color(score=None):
 
 s = "t5ih7ui8je72"
 
+# Report assets are embedded so the page renders without any network access
+REPORT_ICON = ("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 16 16'%3E"
+               "%3Crect width='16' height='16' rx='2' fill='%23000'/%3E"
+               "%3Cpath d='M3 4l4 4-4 4M8 12h5' stroke='%230f0' stroke-width='2' fill='none'/%3E%3C/svg%3E")
+REPORT_MONO_FALLBACK = "'Cascadia Mono', Consolas, 'DejaVu Sans Mono', 'Liberation Mono', Menlo, monospace"
+
 # -------------------------------------------------------------------
 #  HTML REPORT GENERATION WITH ENHANCED FEATURES
 # -------------------------------------------------------------------
@@ -1588,11 +1973,9 @@ def generate_html_report():
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link rel="icon" type="image/png" href="https://raw.githubusercontent.com/Sabari425/system_scanner/refs/heads/main/hacker-in-with-binary-code-vector-33797894-modified.png">
+        <link rel="icon" type="image/svg+xml" href="{REPORT_ICON}">
         <title>System Scan Report - Sachin_2462</title>
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;500;600&display=swap');
-
             * {{
                 margin: 0;
                 padding: 0;
@@ -1600,7 +1983,7 @@ def generate_html_report():
             }}
 
             body {{
-                font-family: 'JetBrains Mono', monospace;
+                font-family: 'JetBrains Mono', {REPORT_MONO_FALLBACK};
                 background: #000000;
                 min-height: 100vh;
                 margin: 0;
@@ -1807,7 +2190,7 @@ def generate_html_report():
             }}
 
             .metric-value {{
-                font-family: 'JetBrains Mono', monospace;
+                font-family: 'JetBrains Mono', {REPORT_MONO_FALLBACK};
                 background: rgba(0, 255, 0, 0.1);
                 padding: 3px 6px;
                 color: #00ff00;
@@ -2247,7 +2630,7 @@ def generate_html_report():
                 ctx.fillRect(0, 0, canvas.width, canvas.height);
 
                 ctx.fillStyle = '#00ff00';
-                ctx.font = charSize + 'px JetBrains Mono';
+                ctx.font = charSize + "px 'JetBrains Mono', """ + REPORT_MONO_FALLBACK + """";
 
                 for (let i = 0; i < drops.length; i++) {
                     const text = chars[Math.floor(Math.random() * chars.length)];
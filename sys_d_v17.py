@@ -8,7 +8,13 @@ import json
 import time
 import uuid
 import getpass
-from collections import OrderedDict
+import signal
+import re
+import hashlib
+import sqlite3
+import threading
+import asyncio
+from collections import OrderedDict, namedtuple
 
 
 # -------------------------------------------------------------------
@@ -284,44 +290,342 @@ def simulate_scan_step(step_name, duration=1, steps=20):
 # -------------------------------------------------------------------
 #  ENHANCED COMMAND EXECUTOR WITH ENCODING FIX
 # -------------------------------------------------------------------
-command_cache = {}
+# At most this many external commands run at once
+COMMAND_CONCURRENCY = 4
+COMMAND_TIMEOUT = 30
 
+CommandResult = namedtuple("CommandResult", "output timed_out reaped duration")
 
-def run_cmd(cmd, use_cache=True, task_name="Executing command"):
-    cache_key = f"{cmd}_{platform.system()}"
 
-    if use_cache and cache_key in command_cache:
-        cached_time, output = command_cache[cache_key]
-        if (datetime.now() - cached_time).seconds < 300:
-            return output
+def kill_process_tree(pid):
+    """Kill a timed-out command's whole process group; return how many stragglers were reaped"""
+    try:
+        members = psutil.Process(pid).children(recursive=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        members = []
+
+    if platform.system() != "Windows":
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    for member in members:
+        try:
+            member.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    try:
+        psutil.Process(pid).kill()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    # Killed members count as reaped once they exit or are left as zombies for init
+    deadline = time.time() + 1
+    alive = list(members)
+    while alive and time.time() < deadline:
+        still_alive = []
+        for member in alive:
+            try:
+                if member.is_running() and member.status() != psutil.STATUS_ZOMBIE:
+                    still_alive.append(member)
+            except psutil.NoSuchProcess:
+                pass
+        alive = still_alive
+        if alive:
+            time.sleep(0.02)
+    return len(members) - len(alive)
+
+
+class CommandRunner:
+    """Run shell commands concurrently on a private asyncio loop.
+
+    Collectors stay synchronous: run() blocks on one command, run_many() on a
+    batch that executes side by side, at most COMMAND_CONCURRENCY at a time.
+    """
+
+    def __init__(self, max_concurrency=COMMAND_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=run_loop, name="command-runner", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def run_async(self, cmd, timeout=COMMAND_TIMEOUT):
+        async with self._semaphore:
+            start_time = time.time()
+            # Own session/process group so a timeout can kill the whole pipeline
+            if platform.system() == "Windows":
+                group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_kwargs = {"start_new_session": True}
+            proc = await asyncio.create_subprocess_shell(
+                cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL, **group_kwargs)
+
+            chunks = []
+
+            async def pump():
+                while True:
+                    chunk = await proc.stdout.read(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                await proc.wait()
+
+            try:
+                await asyncio.wait_for(pump(), timeout)
+            except asyncio.TimeoutError:
+                loop = asyncio.get_running_loop()
+                reaped = await loop.run_in_executor(None, kill_process_tree, proc.pid)
+                try:
+                    await asyncio.wait_for(proc.wait(), 1)
+                except asyncio.TimeoutError:
+                    pass
+                return CommandResult(None, True, reaped, time.time() - start_time)
+
+            # Same newline handling as a text-mode pipe
+            output = b"".join(chunks).decode('utf-8', errors='ignore')
+            output = output.replace('\r\n', '\n').replace('\r', '\n')
+            return CommandResult(output, False, 0, time.time() - start_time)
+
+    def run(self, cmd, timeout=COMMAND_TIMEOUT):
+        return asyncio.run_coroutine_threadsafe(self.run_async(cmd, timeout), self._ensure_loop()).result()
+
+    def run_many(self, cmds, timeout=COMMAND_TIMEOUT):
+        """Results (or the exception raised) for each command, in order"""
+        async def gather():
+            return await asyncio.gather(*(self.run_async(cmd, timeout) for cmd in cmds),
+                                        return_exceptions=True)
+
+        return asyncio.run_coroutine_threadsafe(gather(), self._ensure_loop()).result()
+
+
+command_runner = CommandRunner()
+
+
+# Volatile output (accounts, sessions, networks) stays in memory for a few minutes;
+# slow-changing classes persist across runs in the scanner's cache directory
+COMMAND_CACHE_TTL = 300
+COMMAND_CACHE_MEMORY_ENTRIES = 256
+COMMAND_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "sys_scanner", "command_cache.sqlite3")
+COMMAND_CACHE_MAX_BYTES = 16 * 1024 * 1024
+COMMAND_CACHE_TTLS = {
+    "static": 6 * 3600,        # hardware/driver queries
+    "packages": 7 * 24 * 3600  # installed software, also invalidated when the package DB changes
+}
+
+COMMAND_CLASS_PATTERNS = [
+    ("packages", re.compile(r'^(wmic product|powershell "Get-ItemProperty HKLM:\S*\\Uninstall)')),
+    ("static", re.compile(r"^(driverquery|systeminfo|wmic (bios|baseboard|csproduct|path win32_videocontroller))")),
+]
 
+PACKAGE_DB_PATHS = [
+    os.path.join(os.environ.get("SystemRoot", r"C:\Windows"), "System32", "config", "SOFTWARE"),
+    "/var/lib/dpkg/status",
+    "/var/lib/rpm/rpmdb.sqlite",
+    "/var/lib/rpm/Packages",
+]
+
+
+def classify_command(cmd):
+    """Cache class for a command ('packages', 'static') or None for volatile output"""
+    for command_class, pattern in COMMAND_CLASS_PATTERNS:
+        if pattern.match(cmd.strip()):
+            return command_class
+    return None
+
+
+def get_boot_id():
+    """Identifier that changes on every reboot"""
     try:
-        start_time = time.time()
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        try:
+            return str(int(psutil.boot_time()))
+        except Exception:
+            return "unknown"
+
+
+def file_fingerprint(paths):
+    """(path, mtime, inode, size) of every path that exists, as a string"""
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            parts.append(f"{path}:{st.st_mtime_ns}:{st.st_ino}:{st.st_size}")
+        except OSError:
+            continue
+    return "|".join(parts)
+
+
+class CommandCache:
+    """Bounded command-output cache: an in-memory LRU plus a disk-backed store.
+
+    Every command is cached in memory for COMMAND_CACHE_TTL seconds, evicting the
+    least recently used entry beyond COMMAND_CACHE_MEMORY_ENTRIES. Static and
+    package queries are also written to a SQLite file (same schema as
+    sys_d_v19's cache) keyed by command, host and boot ID, expired per class and
+    LRU-trimmed to COMMAND_CACHE_MAX_BYTES, so back-to-back runs skip them.
+    """
+
+    def __init__(self, path=COMMAND_CACHE_PATH, max_bytes=COMMAND_CACHE_MAX_BYTES, ttls=COMMAND_CACHE_TTLS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        self.host = socket.gethostname()
+        self.boot_id = get_boot_id()
+        self._memory = OrderedDict()  # cmd -> (time stored, output)
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS command_cache (
+                                key TEXT PRIMARY KEY,
+                                cmd TEXT NOT NULL,
+                                output TEXT NOT NULL,
+                                created REAL NOT NULL,
+                                last_used REAL NOT NULL,
+                                expires REAL NOT NULL,
+                                fingerprint TEXT NOT NULL,
+                                size INTEGER NOT NULL)""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_command_cache_lru ON command_cache(last_used)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _key(self, cmd):
+        return hashlib.sha256(f"{self.host}\0{self.boot_id}\0{cmd}".encode('utf-8')).hexdigest()
+
+    def _fingerprint(self, command_class):
+        return file_fingerprint(PACKAGE_DB_PATHS) if command_class == "packages" else ""
+
+    def get(self, cmd):
+        """Cached output for cmd, or None if missing, expired or invalidated"""
+        with self._lock:
+            entry = self._memory.get(cmd)
+            if entry and time.time() - entry[0] < COMMAND_CACHE_TTL:
+                self._memory.move_to_end(cmd)
+                return entry[1]
+            self._memory.pop(cmd, None)
+
+            command_class = classify_command(cmd)
+            if command_class not in self.ttls:
+                return None
+            try:
+                conn = self._connect()
+                try:
+                    row = conn.execute("SELECT output, expires, fingerprint FROM command_cache WHERE key = ?",
+                                       (self._key(cmd),)).fetchone()
+                    now = time.time()
+                    if row is None or row[1] < now or row[2] != self._fingerprint(command_class):
+                        return None
+                    conn.execute("UPDATE command_cache SET last_used = ? WHERE key = ?", (now, self._key(cmd)))
+                    conn.commit()
+                    return row[0]
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError):
+                return None
+
+    def put(self, cmd, output):
+        with self._lock:
+            self._memory[cmd] = (time.time(), output)
+            self._memory.move_to_end(cmd)
+            while len(self._memory) > COMMAND_CACHE_MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+            command_class = classify_command(cmd)
+            if command_class not in self.ttls:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = self._connect()
+                try:
+                    now = time.time()
+                    conn.execute("INSERT OR REPLACE INTO command_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (self._key(cmd), cmd, output, now, now, now + self.ttls[command_class],
+                                  self._fingerprint(command_class), len(output.encode('utf-8'))))
+                    self._evict(conn)
+                    conn.commit()
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError):
+                pass
 
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
-            timeout=30
-        )
+    def _evict(self, conn):
+        """Drop expired entries, then least-recently-used ones until under the size cap"""
+        conn.execute("DELETE FROM command_cache WHERE expires < ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM command_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM command_cache ORDER BY last_used").fetchall():
+            conn.execute("DELETE FROM command_cache WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
 
-        execution_time = time.time() - start_time
-        output = result.stdout.strip()
 
-        if use_cache:
-            command_cache[cache_key] = (datetime.now(), output)
+command_cache = CommandCache()
 
-        return output
 
-    except subprocess.TimeoutExpired:
-        print_status(f"{task_name} timed out", "ERROR")
+def _command_output(cmd, result, use_cache, task_name):
+    if isinstance(result, Exception):
+        print_status(f"{task_name} failed: {str(result)}", "ERROR")
+        return f"[ERROR] Command failed: {str(result)}"
+    if result.timed_out:
+        print_status(f"{task_name} timed out ({result.reaped} stray processes reaped)", "ERROR")
         return "[TIMEOUT] Command execution timeout"
+
+    output = result.output.strip()
+    if use_cache:
+        command_cache.put(cmd, output)
+    return output
+
+
+def run_cmd(cmd, use_cache=True, task_name="Executing command"):
+    if use_cache:
+        output = command_cache.get(cmd)
+        if output is not None:
+            return output
+
+    try:
+        result = command_runner.run(cmd)
     except Exception as e:
-        print_status(f"{task_name} failed: {str(e)}", "ERROR")
-        return f"[ERROR] Command failed: {str(e)}"
+        result = e
+    return _command_output(cmd, result, use_cache, task_name)
+
+
+def run_cmds(cmds, use_cache=True, task_name="Executing command"):
+    """run_cmd for several independent commands, executed concurrently; outputs in order"""
+    outputs = [command_cache.get(cmd) if use_cache else None for cmd in cmds]
+    pending = [index for index, output in enumerate(outputs) if output is None]
+    if pending:
+        try:
+            results = command_runner.run_many([cmds[index] for index in pending])
+        except Exception as e:
+            results = [e] * len(pending)
+        for index, result in zip(pending, results):
+            outputs[index] = _command_output(cmds[index], result, use_cache, task_name)
+    return outputs
 
 
 # -------------------------------------------------------------------
@@ -548,9 +852,10 @@ def get_users_information():
             print("\t", end='')
             print_status(f"Found {len(users)} user accounts", "DATA")
 
-            for user in users:
+            # One "net user <name>" per account; run them side by side
+            all_details = run_cmds([f'net user "{user}"' for user in users])
+            for user, user_details in zip(users, all_details):
                 try:
-                    user_details = run_cmd(f'net user "{user}"')
                     user_data = {
                         "Username": user,
                         "Full Name": "N/A",
@@ -940,9 +1245,10 @@ def get_comprehensive_wifi_analysis():
             print("\t", end='')
             print_status(f"Found {len(profiles)} WiFi profiles", "DATA")
 
-            for profile in profiles:
+            profile_outputs = run_cmds([f'netsh wlan show profile name="{profile}" key=clear'
+                                        for profile in profiles])
+            for profile, key_output in zip(profiles, profile_outputs):
                 try:
-                    key_output = run_cmd(f'netsh wlan show profile name="{profile}" key=clear')
                     password = "Not stored or encrypted"
                     security = "Unknown"
                     connection_mode = "Unknown"
@@ -1239,7 +1545,12 @@ def get_hardware_details():
         # BIOS Information
         if platform.system() == "Windows":
             try:
-                bios_info = run_cmd("wmic bios get manufacturer,version,serialnumber,releasedate /format:csv")
+                # The independent wmic queries below run concurrently and land in the command cache
+                bios_info, _, _ = run_cmds([
+                    "wmic bios get manufacturer,version,serialnumber,releasedate /format:csv",
+                    "wmic baseboard get product,manufacturer,version,serialnumber /format:csv",
+                    "wmic csproduct get uuid",
+                ])
                 for line in bios_info.split('\n'):
                     if ',' in line and 'Node' not in line:
                         parts = line.split(',')
@@ -1381,10 +1692,13 @@ def get_security_information():
         # Windows Defender status
         if platform.system() == "Windows":
             try:
-                defender_status = run_cmd(
+                # Defender, firewall and UAC queries run concurrently; the later lookups hit the cache
+                defender_status, _, _ = run_cmds([
                     'powershell "Get-MpComputerStatus | Select-Object AntivirusEnabled, AMServiceEnabled, '
-                    'AntispywareEnabled, RealTimeProtectionEnabled, OnAccessProtectionEnabled | Format-List"'
-                )
+                    'AntispywareEnabled, RealTimeProtectionEnabled, OnAccessProtectionEnabled | Format-List"',
+                    'netsh advfirewall show allprofiles state',
+                    'reg query "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System" /v EnableLUA',
+                ])
 
                 for line in defender_status.split('\n'):
                     if ':' in line:
@@ -1519,6 +1833,12 @@ def get_health_color(score=None):
         return "linear-gradient(135deg, #ff0000 0%, #cc0000 100%)"
 
 
+# Report assets are embedded so the page renders without any network access
+REPORT_ICON = ("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 16 16'%3E"
+               "%3Crect width='16' height='16' rx='2' fill='%23000'/%3E"
+               "%3Cpath d='M3 4l4 4-4 4M8 12h5' stroke='%230f0' stroke-width='2' fill='none'/%3E%3C/svg%3E")
+REPORT_MONO_FALLBACK = "'Cascadia Mono', Consolas, 'DejaVu Sans Mono', 'Liberation Mono', Menlo, monospace"
+
 # -------------------------------------------------------------------
 #  HTML REPORT GENERATION - GLASS MORPHISM HACKER THEME
 # -------------------------------------------------------------------
@@ -1581,11 +1901,9 @@ def generate_html_report():
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link rel="icon" type="image/png" href="https://raw.githubusercontent.com/Sabari425/system_scanner/refs/heads/main/hacker-in-with-binary-code-vector-33797894-modified.png">
+        <link rel="icon" type="image/svg+xml" href="{REPORT_ICON}">
         <title>System Scan Report - Sabari425</title>
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=Share+Tech+Mono&family=Orbitron:wght@400;500;700;900&family=Source+Code+Pro:wght@300;400;500;600&display=swap');
-
             * {{
                 margin: 0;
                 padding: 0;
@@ -1593,7 +1911,7 @@ def generate_html_report():
             }}
 
             body {{
-                font-family: 'Source Code Pro', monospace;
+                font-family: 'Source Code Pro', {REPORT_MONO_FALLBACK};
                 background: linear-gradient(135deg, #0a0a0a 0%, #001a00 50%, #0a1a0a 100%);
                 min-height: 100vh;
                 margin: 0;
@@ -1676,7 +1994,7 @@ def generate_html_report():
             }}
 
             .header h1 {{
-                font-family: 'Orbitron', monospace;
+                font-family: 'Orbitron', {REPORT_MONO_FALLBACK};
                 color: #00ff00;
                 font-size: 2.8em;
                 margin-bottom: 15px;
@@ -1688,7 +2006,7 @@ def generate_html_report():
             }}
 
             .creator {{
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
                 color: #00ff00;
                 font-size: 1.3em;
                 margin-bottom: 20px;
@@ -1712,7 +2030,7 @@ def generate_html_report():
                 padding: 12px 25px;
                 margin-top: 15px;
                 font-weight: 700;
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
                 border: 2px solid #00ff00;
                 text-shadow: 0 0 5px #ffffff;
                 border-radius: 8px;
@@ -1755,7 +2073,7 @@ def generate_html_report():
             }}
 
             .section h2 {{
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
                 color: #00ff00;
                 padding-bottom: 15px;
                 margin-bottom: 20px;
@@ -1784,7 +2102,7 @@ def generate_html_report():
                 padding: 15px 12px;
                 text-align: left;
                 font-weight: 700;
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
                 border: 1px solid #00ff00;
                 text-transform: uppercase;
                 letter-spacing: 1px;
@@ -1839,7 +2157,7 @@ def generate_html_report():
             }}
 
             .metric-value {{
-                font-family: 'Source Code Pro', monospace;
+                font-family: 'Source Code Pro', {REPORT_MONO_FALLBACK};
                 background: rgba(0, 255, 0, 0.1);
                 padding: 4px 8px;
                 color: #00ff00;
@@ -1924,7 +2242,7 @@ def generate_html_report():
             }}
 
             .performance-card h3 {{
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
                 color: #00ff00;
                 margin-bottom: 12px;
                 font-size: 1em;
@@ -1938,7 +2256,7 @@ def generate_html_report():
                 color: #00ff00;
                 margin: 10px 0;
                 text-shadow: 0 0 10px #00ff00;
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
             }}
 
             .performance-details {{
@@ -2055,7 +2373,7 @@ def generate_html_report():
             .binary {{
                 position: fixed;
                 color: #00ff00;
-                font-family: 'Share Tech Mono', monospace;
+                font-family: 'Share Tech Mono', {REPORT_MONO_FALLBACK};
                 font-size: 14px;
                 animation: binaryRain linear infinite;
                 z-index: -1;
@@ -2211,7 +2529,7 @@ def generate_html_report():
                 ctx.fillRect(0, 0, canvas.width, canvas.height);
 
                 ctx.fillStyle = '#00ff00';
-                ctx.font = charSize + 'px "Share Tech Mono", monospace';
+                ctx.font = charSize + "px 'Share Tech Mono', """ + REPORT_MONO_FALLBACK + """";
 
                 for (let i = 0; i < drops.length; i++) {
                     const text = chars[Math.floor(Math.random() * chars.length)];
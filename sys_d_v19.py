@@ -12,9 +12,27 @@ import hashlib
 import re
 import threading
 import queue
+import asyncio
+import concurrent.futures
+import signal
 import math
-from collections import OrderedDict, defaultdict, Counter
-import statistics
+import random
+from collections import OrderedDict, defaultdict, Counter, namedtuple, deque
+from array import array
+import sqlite3
+import zlib
+import gzip
+import base64
+import struct
+import mmap
+import heapq
+import tracemalloc
+from enum import Enum
+import argparse
+import tempfile
+import shutil
+import io
+import contextlib
 
 # -------------------------------------------------------------------
 #  AUTO-INSTALL REQUIRED PYTHON PACKAGES
@@ -55,6 +73,96 @@ try:
 except:
     CTYPES_AVAILABLE = False
 
+# NumPy is optional; the statistics engine falls back to the array module
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# -------------------------------------------------------------------
+#  GLOBAL CONFIGURATION
+# -------------------------------------------------------------------
+class Config:
+    # Parallel collector engine
+    COLLECTOR_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+    COLLECTOR_TIMEOUT = 30  # seconds, default deadline per collector
+    COLLECTOR_TIMEOUTS = {
+        "process_info": 60,
+        "installed_software": 45,
+        "system_services": 30,
+        "system_drivers": 30,
+        "wifi_networks": 20,
+        "environment_vars": 5,
+        "security_audit": 15,
+    }
+
+    # Shared CPU sampling window (seconds) for system, per-core and per-process CPU %
+    CPU_SAMPLE_INTERVAL = 0.5
+
+    # External command runner
+    COMMAND_CONCURRENCY = 4              # commands allowed to run at once
+    COMMAND_MAX_OUTPUT = 4 * 1024 * 1024  # bytes of stdout kept per command
+
+    # Persistent command-output cache
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sys_scanner")
+    COMMAND_CACHE_ENABLED = True
+    COMMAND_CACHE_MAX_BYTES = 16 * 1024 * 1024
+    COMMAND_CACHE_TTLS = {
+        "static": 6 * 3600,        # hardware/driver/account queries
+        "packages": 7 * 24 * 3600  # package lists, also invalidated when the package DB changes
+    }
+
+    # Report tables: rows per page for each section (None = no limit)
+    TABLE_ROW_LIMITS = {
+        "process_info": 100,
+        "network_connections": 20,
+        "installed_software": 50,
+        "system_services": 30,
+        "startup_programs": 20,
+        "environment_vars": 30,
+        "hardware_temps": 15,
+        "user_accounts": 15,
+        "system_drivers": 20,
+    }
+    TABLE_PAGE = 1        # which page of each table goes into the report
+    FULL_TABLES = False   # export every row instead of one page
+
+    # Read processes straight from /proc on Linux instead of through psutil
+    PROC_FAST_PATH = True
+
+    # Statistics engine
+    STATS_USE_NUMPY = True            # vectorize with NumPy when it is installed
+    STATS_PERCENTILES = (50, 95, 99)
+    STATS_HISTOGRAM_BINS = 10         # equal-width CPU % bins over 0-100
+
+    # HTML report writer
+    HTML_WRITE_BUFFER = 1 << 16   # bytes buffered before each write to the report file
+    HTML_VIRTUAL_ROWS = 200       # larger tables ship as JSON and render through a virtual scroller
+    HTML_COMPACT = False          # ship tables, CSS and JS as one deflate+base64 payload the page decodes
+
+    # Raw scan snapshot saved next to each report, re-renderable with --render
+    SAVE_SNAPSHOT = True
+
+    # Local scan history (SQLite, WAL): raw points, then hourly/daily rollups
+    HISTORY_ENABLED = True
+    HISTORY_PATH = os.path.join(CACHE_DIR, "history.sqlite3")
+    HISTORY_RAW_DAYS = 7        # raw metric points
+    HISTORY_HOURLY_DAYS = 90    # hourly rollups
+    HISTORY_DAILY_DAYS = 730    # daily rollups
+    HISTORY_TABLE_DAYS = 30     # each scan's tables
+
+    # Raw sampler series archived as Gorilla-compressed blocks, kept past HISTORY_RAW_DAYS
+    SERIES_ARCHIVE_ENABLED = True
+    SERIES_ARCHIVE_DIR = os.path.join(CACHE_DIR, "series")
+    SERIES_ARCHIVE_DAYS = 365
+    SERIES_BLOCK_POINTS = 1024  # points per independently decodable block
+
+    # Background metrics sampler
+    SAMPLER_INTERVAL = 0.5   # seconds between samples
+    SAMPLER_CAPACITY = 600   # samples kept per series (5 minutes at the default rate)
+
 # -------------------------------------------------------------------
 #  ENHANCED COLOR CLASS WITH GRADIENTS AND EFFECTS
 # -------------------------------------------------------------------
@@ -208,20 +316,980 @@ def calculate_percentage(part, total):
         return 0
     return (part / total) * 100
 
+# -------------------------------------------------------------------
+#  TYPED REPORT VALUES
+# -------------------------------------------------------------------
+# Collectors store raw numbers wrapped in these types; they behave as plain
+# ints/floats for statistics, graphs and JSON, and only turn into display text
+# when a renderer calls str() on them.
+class Percent(float):
+    __slots__ = ()
+
+    def __str__(self):
+        value = float(self)
+        return f"{value:.2f}%" if abs(value) < 1 else f"{value:.1f}%"
+
+class ByteSize(int):
+    __slots__ = ()
+
+    def __new__(cls, value):
+        return super().__new__(cls, int(value))
+
+    def __str__(self):
+        return format_bytes(int(self))
+
+class ByteRate(float):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{format_bytes(float(self))}/s"
+
+class Mbps(int):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{int(self)} Mbps"
+
+class Celsius(float):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{float(self):.1f}°C"
+
+class Count(int):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{int(self):,}"
+
+class Seconds(float):
+    """Duration for columns whose header already carries the unit"""
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{float(self):.2f}"
+
+class Label(str, Enum):
+    """Enumerated cell value that renders as its text"""
+
+    def __str__(self):
+        return self.value
+
+class LinkState(Label):
+    UP = "UP"
+    DOWN = "DOWN"
+
+class RiskLevel(Label):
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    UNKNOWN = "Unknown"
+    NOT_APPLICABLE = "N/A"
+
+def numeric(value, default=None):
+    """The number behind a report cell, or default for text such as "N/A" """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return default
+
+# -------------------------------------------------------------------
+#  PARALLEL COLLECTOR ENGINE
+# -------------------------------------------------------------------
+_collector_context = threading.local()
+
+def collector_time_remaining(default=None):
+    """Seconds left before the running collector's deadline (default outside the engine)"""
+    deadline = getattr(_collector_context, "deadline", None)
+    if deadline is None:
+        return default
+    return max(0.0, deadline - time.monotonic())
+
+def collector_cancelled():
+    """True once the engine has given up on the running collector"""
+    cancel_event = getattr(_collector_context, "cancel_event", None)
+    return cancel_event is not None and cancel_event.is_set()
+
+class DataCollector:
+    """Run collectors on a bounded worker pool, each with its own deadline.
+
+    A collector that misses its deadline is cancelled (its cancel event is set so
+    cooperative code such as run_command_with_timeout stops early) and reported as
+    timed out; its worker is abandoned and replaced so the remaining collectors
+    keep making progress.
+    """
+
+    def __init__(self, max_workers=None, default_timeout=None, timeouts=None):
+        self.max_workers = max_workers or Config.COLLECTOR_WORKERS
+        self.default_timeout = default_timeout or Config.COLLECTOR_TIMEOUT
+        self.timeouts = dict(Config.COLLECTOR_TIMEOUTS if timeouts is None else timeouts)
+        self.results = {}
+        self.status = OrderedDict()
+        self.timed_out = []
+        self.failed = []
+        self.elapsed = 0.0
+
+    def _worker(self, tasks, done):
+        while True:
+            try:
+                job = tasks.get_nowait()
+            except queue.Empty:
+                return
+            if job["cancel"].is_set():
+                continue
+            job["started"] = time.monotonic()
+            _collector_context.deadline = job["started"] + job["timeout"]
+            _collector_context.cancel_event = job["cancel"]
+            result, error = None, None
+            try:
+                result = job["func"]()
+            except Exception as e:
+                error = e
+            finally:
+                _collector_context.deadline = None
+                _collector_context.cancel_event = None
+            done.put((job["name"], result, error, time.monotonic() - job["started"]))
+            # An abandoned worker has already been replaced - don't take more work
+            if job["cancel"].is_set():
+                return
+
+    def _start_worker(self, tasks, done):
+        thread = threading.Thread(target=self._worker, args=(tasks, done), daemon=True)
+        thread.start()
+        return thread
+
+    def collect_parallel(self, functions, on_complete=None):
+        """Collect data from multiple functions in parallel"""
+        tasks = queue.Queue()
+        done = queue.Queue()
+        jobs = OrderedDict()
+        scan_start = time.monotonic()
+
+        for name, func in functions.items():
+            jobs[name] = {
+                "name": name,
+                "func": func,
+                "timeout": self.timeouts.get(name, self.default_timeout),
+                "cancel": threading.Event(),
+                "started": None
+            }
+            tasks.put(jobs[name])
+
+        for _ in range(min(self.max_workers, len(jobs))):
+            self._start_worker(tasks, done)
+
+        pending = set(jobs)
+        while pending:
+            now = time.monotonic()
+            deadlines = [jobs[n]["started"] + jobs[n]["timeout"] for n in pending if jobs[n]["started"]]
+            wait = min(deadlines) - now if deadlines else 0.1
+            try:
+                name, result, error, duration = done.get(timeout=max(0.01, min(wait, 0.5)))
+            except queue.Empty:
+                now = time.monotonic()
+                for name in list(pending):
+                    job = jobs[name]
+                    if job["started"] and now >= job["started"] + job["timeout"]:
+                        job["cancel"].set()
+                        pending.discard(name)
+                        self._record(name, None, None, now - job["started"], job, on_complete, timed_out=True)
+                        if not tasks.empty():
+                            self._start_worker(tasks, done)
+                continue
+
+            if name not in pending:
+                continue  # late result from a collector that already timed out
+            pending.discard(name)
+            self._record(name, result, error, duration, jobs[name], on_complete)
+
+        self.elapsed = time.monotonic() - scan_start
+        return OrderedDict((name, self.results[name]) for name in jobs)
+
+    def _record(self, name, result, error, duration, job, on_complete, timed_out=False):
+        if timed_out:
+            state = "Timed Out"
+            self.timed_out.append(name)
+            result = [{"Error": f"Collection timed out after {job['timeout']}s"}]
+        elif error is not None:
+            state = "Failed"
+            self.failed.append(name)
+            result = [{"Error": f"Collection failed: {str(error)[:50]}"}]
+        else:
+            state = "Completed"
+
+        self.results[name] = result
+        self.status[name] = {"state": state, "duration": duration, "timeout": job["timeout"], "error": error}
+        if on_complete:
+            on_complete(name, result, self.status[name])
+
+    def get_status_table(self):
+        """Per-collector outcome rows for the report"""
+        return [{
+            "Collector": name.replace('_', ' ').title(),
+            "Status": info["state"],
+            "Duration (s)": Seconds(info["duration"]),
+            "Timeout (s)": info["timeout"]
+        } for name, info in self.status.items()]
+
+# -------------------------------------------------------------------
+#  SCAN-SCOPED SINGLE-FLIGHT
+# -------------------------------------------------------------------
+class SingleFlight:
+    """De-duplicate identical queries within one scan.
+
+    The first caller for a key runs the query; callers arriving while it is in
+    flight wait for that same result (threads block on an Event, coroutines
+    await it without blocking their loop), and later callers get the memoized
+    value until reset() starts the next scan. Exceptions are shared with the
+    waiters but never memoized. If the leader is cancelled, or reset() abandons
+    the call, waiters retry the query themselves instead of failing or hanging.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}
+        self._inflight = {}
+
+    def reset(self):
+        with self._lock:
+            self._results.clear()
+            abandoned = list(self._inflight.values())
+            self._inflight.clear()
+        # Wake waiters of calls still running from the previous scan; they retry
+        for call in abandoned:
+            call["abandoned"] = True
+            call["event"].set()
+
+    def peek(self, key, default=None):
+        """Memoized value for key without running or waiting for anything"""
+        with self._lock:
+            call = self._results.get(key)
+        return call["value"] if call else default
+
+    def _join(self, key):
+        """(call, is_leader) for key, registering a new in-flight call if needed"""
+        with self._lock:
+            if key in self._results:
+                return self._results[key], False
+            call = self._inflight.get(key)
+            if call is not None:
+                return call, False
+            call = {"event": threading.Event(), "value": None, "error": None, "abandoned": False}
+            self._inflight[key] = call
+            return call, True
+
+    def _finish(self, key, call, memoize):
+        with self._lock:
+            # An abandoned call no longer owns the key (a newer scan may)
+            if self._inflight.get(key) is call:
+                del self._inflight[key]
+                if call["error"] is None and memoize:
+                    self._results[key] = call
+        call["event"].set()
+
+    @staticmethod
+    def _retry(call):
+        """True if a waiter should run the query again rather than take this call's outcome"""
+        return call["abandoned"] or isinstance(call["error"], asyncio.CancelledError)
+
+    @staticmethod
+    def _result(call):
+        if call["error"] is not None:
+            raise call["error"]
+        return call["value"]
+
+    def do(self, key, func, *args, memoize_if=None, **kwargs):
+        """Run func(*args, **kwargs) once per key for the current scan"""
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                break
+            call["event"].wait()
+            if not self._retry(call):
+                return self._result(call)
+
+        memoize = False
+        try:
+            call["value"] = func(*args, **kwargs)
+            memoize = memoize_if is None or memoize_if(call["value"])
+        except BaseException as e:
+            call["error"] = e
+        finally:
+            self._finish(key, call, memoize)
+        return self._result(call)
+
+    async def do_async(self, key, coro_func, *args, memoize_if=None, **kwargs):
+        """Coroutine flavour of do(); shares in-flight calls with threaded callers"""
+        while True:
+            call, leader = self._join(key)
+            if leader:
+                break
+            if not call["event"].is_set():
+                await asyncio.get_running_loop().run_in_executor(None, call["event"].wait)
+            if not self._retry(call):
+                return self._result(call)
+
+        memoize = False
+        try:
+            call["value"] = await coro_func(*args, **kwargs)
+            memoize = memoize_if is None or memoize_if(call["value"])
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            self._finish(key, call, memoize)
+        return call["value"]
+
+scan_flight = SingleFlight()
+
+# -------------------------------------------------------------------
+#  TABLE PAGING & TOP-N SELECTION
+# -------------------------------------------------------------------
+_table_pages = {}
+_table_pages_lock = threading.Lock()
+
+def table_window(section):
+    """(start, stop) rows of the requested page of a section; stop is None for a full table"""
+    limit = Config.TABLE_ROW_LIMITS.get(section)
+    if Config.FULL_TABLES or not limit:
+        return 0, None
+    start = (max(1, Config.TABLE_PAGE) - 1) * limit
+    return start, start + limit
+
+def _note_page(section, start, shown, total):
+    """Remember that a section was cut to one page so the report can say so"""
+    if shown < total:
+        with _table_pages_lock:
+            _table_pages[section] = {"first": start + 1 if shown else 0, "last": start + shown, "total": total}
+
+def page_rows(rows, section):
+    """The requested page of an already-ordered table"""
+    start, stop = table_window(section)
+    page = rows[start:stop]
+    _note_page(section, start, len(page), len(rows))
+    return page
+
+def top_n(items, section, key):
+    """The requested page of items ranked by a numeric key, highest first.
+
+    Only start + limit items are ever ordered (heapq.nlargest), so picking the
+    top k of n costs O(n log k) instead of a full sort.
+    """
+    items = items if isinstance(items, list) else list(items)
+    start, stop = table_window(section)
+    if stop is None or stop >= len(items):
+        ranked = sorted(items, key=key, reverse=True)
+    else:
+        ranked = heapq.nlargest(stop, items, key=key)
+    page = ranked[start:stop]
+    _note_page(section, start, len(page), len(items))
+    return page
+
+def get_table_pages():
+    """{section: {"first", "last", "total"}} for every table cut to a page this scan"""
+    with _table_pages_lock:
+        return dict(_table_pages)
+
+def scan_query(func, *args, **kwargs):
+    """Call a (psutil) query once per scan, sharing the result with concurrent collectors"""
+    key = (getattr(func, "__qualname__", repr(func)), args, tuple(sorted(kwargs.items())))
+    return scan_flight.do(key, func, *args, **kwargs)
+
+# -------------------------------------------------------------------
+#  BACKGROUND METRICS SAMPLER
+# -------------------------------------------------------------------
+class RingBuffer:
+    """Fixed-capacity ring buffer of floats backed by array('d')"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._data = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def append(self, value):
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def values(self):
+        """Samples in chronological order"""
+        if self._count < self.capacity:
+            return self._data[:self._count]
+        return self._data[self._next:] + self._data[:self._next]
+
+    def latest(self):
+        return self._data[self._next - 1] if self._count else None
+
+    def mean(self):
+        return math.fsum(self.values()) / self._count if self._count else None
+
+    def percentile(self, pct):
+        """Nearest-rank percentile of the buffered samples"""
+        if not self._count:
+            return None
+        ordered = sorted(self.values())
+        rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[rank]
+
+    def max(self):
+        return max(self.values()) if self._count else None
+
+class MetricsSampler:
+    """Background thread recording system metrics into fixed-size ring buffers.
+
+    Series: cpu, memory, swap (percent), disk_read/disk_write and net_sent/net_recv
+    (bytes per second), plus cpu_core_<n> for every logical core. Readers take
+    averages and percentiles from the buffers instead of blocking on
+    psutil.cpu_percent(interval=...).
+    """
+
+    SERIES = ("cpu", "memory", "swap", "disk_read", "disk_write", "net_sent", "net_recv")
+
+    def __init__(self, interval=None, capacity=None):
+        self.interval = interval or Config.SAMPLER_INTERVAL
+        self.capacity = capacity or Config.SAMPLER_CAPACITY
+        self.cores = psutil.cpu_count(logical=True) or 1
+        self.timestamps = RingBuffer(self.capacity)
+        self.series = OrderedDict((name, RingBuffer(self.capacity)) for name in self.SERIES)
+        for core in range(self.cores):
+            self.series[f"cpu_core_{core}"] = RingBuffer(self.capacity)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._previous = None
+
+    def start(self):
+        """Start sampling in the background (no-op if already running)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._previous = self._read_counters()
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 2)
+
+    @property
+    def running(self):
+        return bool(self._thread and self._thread.is_alive())
+
+    def _read_counters(self):
+        try:
+            disk_io = psutil.disk_io_counters()
+        except Exception:
+            disk_io = None
+        try:
+            net_io = psutil.net_io_counters()
+        except Exception:
+            net_io = None
+        return {
+            "time": time.monotonic(),
+            "cpu": psutil.cpu_times(),
+            "cores": psutil.cpu_times(percpu=True),
+            "disk": disk_io,
+            "net": net_io
+        }
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                continue
+
+    def sample(self):
+        """Record one sample of every series against the previous counters"""
+        current = self._read_counters()
+        previous, self._previous = self._previous, current
+        elapsed = current["time"] - previous["time"]
+        if elapsed <= 0:
+            return
+
+        values = {
+            "cpu": cpu_times_percent_between(previous["cpu"], current["cpu"]),
+            "memory": psutil.virtual_memory().percent,
+            "swap": psutil.swap_memory().percent
+        }
+        for core, (before, after) in enumerate(zip(previous["cores"], current["cores"])):
+            values[f"cpu_core_{core}"] = cpu_times_percent_between(before, after)
+        if previous["disk"] and current["disk"]:
+            values["disk_read"] = max(0, current["disk"].read_bytes - previous["disk"].read_bytes) / elapsed
+            values["disk_write"] = max(0, current["disk"].write_bytes - previous["disk"].write_bytes) / elapsed
+        if previous["net"] and current["net"]:
+            values["net_sent"] = max(0, current["net"].bytes_sent - previous["net"].bytes_sent) / elapsed
+            values["net_recv"] = max(0, current["net"].bytes_recv - previous["net"].bytes_recv) / elapsed
+
+        with self._lock:
+            self.timestamps.append(time.time())
+            for name, buffer in self.series.items():
+                buffer.append(values.get(name, 0.0))
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def summary(self, name):
+        """mean / p50 / p95 / max / latest for one series, or None before the first sample"""
+        with self._lock:
+            buffer = self.series.get(name)
+            if buffer is None or not len(buffer):
+                return None
+            return {
+                "mean": buffer.mean(),
+                "p50": buffer.percentile(50),
+                "p95": buffer.percentile(95),
+                "max": buffer.max(),
+                "latest": buffer.latest(),
+                "samples": len(buffer)
+            }
+
+    def summaries(self):
+        """Summary of every series, keyed by series name"""
+        return OrderedDict((name, self.summary(name)) for name in self.series if self.summary(name))
+
+    def points(self, names=SERIES):
+        """Buffered samples as (series, unix time, value) tuples"""
+        with self._lock:
+            timestamps = self.timestamps.values()
+            return [(name, timestamp, value) for name in names if name in self.series
+                    for timestamp, value in zip(timestamps, self.series[name].values())]
+
+metrics_sampler = MetricsSampler()
+
 # -------------------------------------------------------------------
 #  DATA COLLECTION FUNCTIONS - ALL DEFINED
 # -------------------------------------------------------------------
-def run_command_with_timeout(cmd, timeout=10):
-    """Run command with timeout"""
+class CommandResult:
+    """Structured outcome of one external command"""
+
+    def __init__(self, cmd, stdout="", exit_code=None, duration=0.0, timed_out=False,
+                 truncated=False, cancelled=False, error=None, reaped=0):
+        self.cmd = cmd
+        self.reaped = reaped
+        self.stdout = stdout
+        self.exit_code = exit_code
+        self.duration = duration
+        self.timed_out = timed_out
+        self.truncated = truncated
+        self.cancelled = cancelled
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.exit_code == 0 and not (self.timed_out or self.cancelled or self.error)
+
+    def __repr__(self):
+        return (f"CommandResult(cmd={self.cmd!r}, exit_code={self.exit_code}, duration={self.duration:.2f}, "
+                f"timed_out={self.timed_out}, truncated={self.truncated}, reaped={self.reaped})")
+
+def kill_process_group(pid, timeout=1.0):
+    """Kill a command's shell and every process in its group; return the stragglers reaped.
+
+    Commands are started with start_new_session, so on POSIX the shell leads its
+    own process group and that group id is its pid; the group is signalled
+    directly. Descendants that moved to another group are caught through the
+    process tree as well.
+    """
+    members = []
+    try:
+        members = psutil.Process(pid).children(recursive=True)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    if platform.system() != "Windows":
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # the whole group has already exited
+        except PermissionError:
+            pass
+
+    for member in members:
+        try:
+            member.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    try:
+        psutil.Process(pid).kill()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+
+    # Killed members are "gone" once they exit or are left as zombies for init to reap
+    deadline = time.monotonic() + timeout
+    alive = list(members)
+    while alive and time.monotonic() < deadline:
+        still_alive = []
+        for member in alive:
+            try:
+                if member.is_running() and member.status() != psutil.STATUS_ZOMBIE:
+                    still_alive.append(member)
+            except psutil.NoSuchProcess:
+                pass
+        alive = still_alive
+        if alive:
+            time.sleep(0.02)
+    return len(members) - len(alive)
+
+class AsyncCommandRunner:
+    """Run shell commands concurrently on a private asyncio loop.
+
+    At most Config.COMMAND_CONCURRENCY commands run at once. stdout is streamed in
+    chunks (optionally handed to an on_line callback as lines complete) and capped
+    at Config.COMMAND_MAX_OUTPUT bytes; anything beyond that is drained and the
+    result marked truncated. Every command starts in its own session/process
+    group, and on timeout or cancellation the whole group is killed so pipeline
+    members never outlive the scan; the number of stragglers reaped is recorded.
+    """
+
+    def __init__(self, max_concurrency=None, max_output=None):
+        self.max_concurrency = max_concurrency or Config.COMMAND_CONCURRENCY
+        self.max_output = max_output or Config.COMMAND_MAX_OUTPUT
+        self._loop = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+        self.reaped_total = 0
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=run_loop, name="command-runner", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def run_async(self, cmd, timeout=10, on_line=None):
+        """Run one command under the concurrency limit and return a CommandResult"""
+        async with self._semaphore:
+            start = time.monotonic()
+            result = CommandResult(cmd)
+            if platform.system() == "Windows":
+                group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_kwargs = {"start_new_session": True}
+            try:
+                proc = await asyncio.create_subprocess_shell(
+                    cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+                    stdin=asyncio.subprocess.DEVNULL, **group_kwargs)
+            except Exception as e:
+                result.error = str(e)
+                result.duration = time.monotonic() - start
+                return result
+
+            chunks = []
+            kept = 0
+            pending_line = b""
+
+            async def pump():
+                nonlocal kept, pending_line
+                while True:
+                    chunk = await proc.stdout.read(65536)
+                    if not chunk:
+                        break
+                    if kept < self.max_output:
+                        chunk = chunk[:self.max_output - kept]
+                        chunks.append(chunk)
+                        kept += len(chunk)
+                        if on_line:
+                            *lines, pending_line = (pending_line + chunk).split(b"\n")
+                            for line in lines:
+                                on_line(line.decode('utf-8', errors='ignore'))
+                    else:
+                        result.truncated = True
+                await proc.wait()
+
+            try:
+                await asyncio.wait_for(pump(), timeout)
+            except asyncio.TimeoutError:
+                result.timed_out = True
+                result.reaped = await self._terminate(proc)
+            except asyncio.CancelledError:
+                result.cancelled = True
+                result.reaped = await self._terminate(proc)
+                raise
+            finally:
+                result.duration = time.monotonic() - start
+
+            if on_line and pending_line:
+                on_line(pending_line.decode('utf-8', errors='ignore'))
+            result.exit_code = proc.returncode
+            result.stdout = b"".join(chunks).decode('utf-8', errors='ignore')
+            return result
+
+    async def _terminate(self, proc):
+        """Kill the command's whole process group and return how many stragglers were reaped"""
+        loop = asyncio.get_running_loop()
+        reaped = await loop.run_in_executor(None, kill_process_group, proc.pid)
+        self.reaped_total += reaped
+        # Anything that escaped the group may still hold stdout open; don't wait forever
+        try:
+            await asyncio.wait_for(proc.wait(), 1.0)
+        except asyncio.TimeoutError:
+            pass
+        return reaped
+
+    def run(self, cmd, timeout=10, on_line=None):
+        """Blocking wrapper for collectors; honours the running collector's cancellation"""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.run_async(cmd, timeout, on_line), loop)
+        while True:
+            try:
+                return future.result(timeout=0.1)
+            except concurrent.futures.TimeoutError:  # not the builtin before Python 3.11
+                if collector_cancelled():
+                    future.cancel()
+                    return CommandResult(cmd, cancelled=True)
+            except Exception as e:
+                if future.cancelled():
+                    return CommandResult(cmd, cancelled=True)
+                return CommandResult(cmd, error=str(e))
+
+    def run_many(self, cmds, timeout=10):
+        """Run several commands concurrently (still bounded by the semaphore)"""
+        loop = self._ensure_loop()
+
+        async def gather():
+            return await asyncio.gather(*(
+                scan_flight.do_async(("command", cmd), self.run_async, cmd, timeout,
+                                     memoize_if=lambda r: r.ok)
+                for cmd in cmds))
+
+        future = asyncio.run_coroutine_threadsafe(gather(), loop)
+        while True:
+            try:
+                return future.result(timeout=0.1)
+            except concurrent.futures.TimeoutError:  # not the builtin before Python 3.11
+                if collector_cancelled():
+                    future.cancel()
+                    return [CommandResult(cmd, cancelled=True) for cmd in cmds]
+
+command_runner = AsyncCommandRunner()
+
+# -------------------------------------------------------------------
+#  PERSISTENT COMMAND CACHE
+# -------------------------------------------------------------------
+COMMAND_CLASS_PATTERNS = [
+    ("packages", re.compile(r"^(dpkg-query|rpm -q|wmic product|system_profiler SPApplicationsDataType)")),
+    ("static", re.compile(r"^(driverquery|lsmod|wmic useraccount)")),
+]
+
+PACKAGE_DB_PATHS = [
+    "/var/lib/dpkg/status",
+    "/var/lib/rpm/rpmdb.sqlite",
+    "/var/lib/rpm/Packages",
+    "/usr/lib/sysimage/rpm/rpmdb.sqlite",
+]
+
+def classify_command(cmd):
+    """Cache class for a command ('packages', 'static') or None for volatile output"""
+    for command_class, pattern in COMMAND_CLASS_PATTERNS:
+        if pattern.match(cmd.strip()):
+            return command_class
+    return None
+
+def get_boot_id():
+    """Identifier that changes on every reboot"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, 
-                               text=True, encoding='utf-8', 
-                               errors='ignore', timeout=timeout)
-        return result.stdout.strip()
-    except subprocess.TimeoutExpired:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except OSError:
+        try:
+            return str(int(psutil.boot_time()))
+        except Exception:
+            return "unknown"
+
+def file_fingerprint(paths):
+    """(path, mtime, inode, size) of every path that exists, as a string"""
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            parts.append(f"{path}:{st.st_mtime_ns}:{st.st_ino}:{st.st_size}")
+        except OSError:
+            continue
+    return "|".join(parts)
+
+class CommandCache:
+    """Disk-backed, size-capped LRU cache of command output shared across runs.
+
+    Entries are keyed by command, host and boot ID and expire per command class
+    (Config.COMMAND_CACHE_TTLS). Package listings are additionally tied to the
+    package database fingerprint so they are refreshed as soon as it changes.
+    SQLite in WAL mode makes concurrent scans and collector threads safe.
+    """
+
+    def __init__(self, path=None, max_bytes=None, ttls=None):
+        self.path = path or os.path.join(Config.CACHE_DIR, "command_cache.sqlite3")
+        self.max_bytes = max_bytes or Config.COMMAND_CACHE_MAX_BYTES
+        self.ttls = ttls or Config.COMMAND_CACHE_TTLS
+        self.host = socket.gethostname()
+        self.boot_id = get_boot_id()
+        self.enabled = Config.COMMAND_CACHE_ENABLED
+        self.hits = 0
+        self.misses = 0
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            with self._lock:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""CREATE TABLE IF NOT EXISTS command_cache (
+                                    key TEXT PRIMARY KEY,
+                                    cmd TEXT NOT NULL,
+                                    output TEXT NOT NULL,
+                                    created REAL NOT NULL,
+                                    last_used REAL NOT NULL,
+                                    expires REAL NOT NULL,
+                                    fingerprint TEXT NOT NULL,
+                                    size INTEGER NOT NULL)""")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_command_cache_lru ON command_cache(last_used)")
+                conn.commit()
+                self._initialized = True
+        return conn
+
+    def _key(self, cmd):
+        return hashlib.sha256(f"{self.host}\0{self.boot_id}\0{cmd}".encode('utf-8')).hexdigest()
+
+    def _fingerprint(self, command_class):
+        return file_fingerprint(PACKAGE_DB_PATHS) if command_class == "packages" else ""
+
+    def get(self, cmd, command_class):
+        """Cached output for cmd, or None if missing, expired or invalidated"""
+        if not self.enabled or command_class not in self.ttls:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT output, expires, fingerprint FROM command_cache WHERE key = ?",
+                                   (self._key(cmd),)).fetchone()
+                now = time.time()
+                if row is None or row[1] < now or row[2] != self._fingerprint(command_class):
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE command_cache SET last_used = ? WHERE key = ?", (now, self._key(cmd)))
+                conn.commit()
+                self.hits += 1
+                return row[0]
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            return None
+
+    def put(self, cmd, command_class, output):
+        if not self.enabled or command_class not in self.ttls:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = self._connect()
+            try:
+                now = time.time()
+                size = len(output.encode('utf-8'))
+                conn.execute("INSERT OR REPLACE INTO command_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                             (self._key(cmd), cmd, output, now, now, now + self.ttls[command_class],
+                              self._fingerprint(command_class), size))
+                self._evict(conn)
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, conn):
+        """Drop expired entries, then least-recently-used ones until under the size cap"""
+        conn.execute("DELETE FROM command_cache WHERE expires < ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM command_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM command_cache ORDER BY last_used").fetchall():
+            conn.execute("DELETE FROM command_cache WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM command_cache")
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            pass
+
+command_cache = CommandCache()
+
+def _command_budget(timeout):
+    """Clamp a command timeout to the running collector's remaining deadline"""
+    return min(timeout, collector_time_remaining(timeout))
+
+def run_command(cmd, timeout=10, on_line=None, cache_class="auto"):
+    """Run command through the shared async runner and return a CommandResult.
+
+    Slow-changing queries (see classify_command) are answered from the persistent
+    command cache when possible; pass cache_class=None to always run the command.
+    """
+    if collector_cancelled():
+        return CommandResult(cmd, cancelled=True)
+
+    if cache_class == "auto":
+        cache_class = classify_command(cmd)
+    if cache_class and on_line is None:
+        cached = command_cache.get(cmd, cache_class)
+        if cached is not None:
+            return CommandResult(cmd, stdout=cached, exit_code=0)
+
+    timeout = _command_budget(timeout)
+    if timeout <= 0:
+        return CommandResult(cmd, timed_out=True)
+    if on_line is not None:
+        result = command_runner.run(cmd, timeout, on_line)
+    else:
+        # Identical commands issued by concurrent collectors run only once per scan
+        result = scan_flight.do(("command", cmd), command_runner.run, cmd, timeout,
+                                memoize_if=lambda r: r.ok)
+    if cache_class and result.ok and not result.truncated:
+        command_cache.put(cmd, cache_class, result.stdout)
+    return result
+
+def command_output(result):
+    """Legacy string form of a CommandResult used by the collectors"""
+    if result.cancelled:
+        return "[CANCELLED]"
+    if result.timed_out:
         return "[TIMEOUT]"
-    except Exception as e:
-        return f"[ERROR] {str(e)}"
+    if result.error:
+        return f"[ERROR] {result.error}"
+    return result.stdout.strip()
+
+def run_command_with_timeout(cmd, timeout=10):
+    """Run command with timeout, clamped to the running collector's deadline"""
+    return command_output(run_command(cmd, timeout))
+
+def run_commands_with_timeout(cmds, timeout=10):
+    """Run several commands concurrently and return their outputs in order"""
+    if collector_cancelled():
+        return ["[CANCELLED]"] * len(cmds)
+    timeout = _command_budget(timeout)
+    if timeout <= 0:
+        return ["[TIMEOUT]"] * len(cmds)
+    return [command_output(r) for r in command_runner.run_many(cmds, timeout)]
 
 # -------------------------------------------------------------------
 #  SYSTEM INFORMATION FUNCTIONS
@@ -279,7 +1347,7 @@ def get_comprehensive_system_info():
     
     # Uptime
     try:
-        boot_time = psutil.boot_time()
+        boot_time = scan_query(psutil.boot_time)
         uptime = datetime.now() - datetime.fromtimestamp(boot_time)
         info["Boot Time"] = datetime.fromtimestamp(boot_time).strftime('%Y-%m-%d %H:%M:%S')
         
@@ -307,7 +1375,7 @@ def get_extended_hardware_info():
                 "Detail": platform.processor() or "Unknown",
                 "Current Frequency": f"{cpu_freq.current:.2f} MHz",
                 "Max Frequency": f"{cpu_freq.max:.2f} MHz" if cpu_freq.max else "N/A",
-                "Cores": f"{psutil.cpu_count(logical=False)} physical, {psutil.cpu_count(logical=True)} logical"
+                "Cores": f"{scan_query(psutil.cpu_count, logical=False)} physical, {scan_query(psutil.cpu_count, logical=True)} logical"
             }
         else:
             cpu_info = {
@@ -315,7 +1383,7 @@ def get_extended_hardware_info():
                 "Detail": platform.processor() or "Unknown",
                 "Current Frequency": "N/A",
                 "Max Frequency": "N/A",
-                "Cores": f"{psutil.cpu_count(logical=False)} physical, {psutil.cpu_count(logical=True)} logical"
+                "Cores": f"{scan_query(psutil.cpu_count, logical=False)} physical, {scan_query(psutil.cpu_count, logical=True)} logical"
             }
         hardware.append(cpu_info)
     except Exception as e:
@@ -334,10 +1402,10 @@ def get_extended_hardware_info():
         hardware.append({
             "Category": "MEMORY",
             "Detail": f"Total: {format_bytes(memory.total)}",
-            "Available": format_bytes(memory.available),
-            "Used": format_bytes(memory.used),
-            "Usage": f"{memory.percent}%",
-            "Swap Total": format_bytes(swap.total)
+            "Available": ByteSize(memory.available),
+            "Used": ByteSize(memory.used),
+            "Usage": Percent(memory.percent),
+            "Swap Total": ByteSize(swap.total)
         })
     except Exception as e:
         hardware.append({
@@ -351,7 +1419,7 @@ def get_extended_hardware_info():
     
     # Disk Information
     try:
-        partitions = psutil.disk_partitions()
+        partitions = scan_query(psutil.disk_partitions)
         for partition in partitions:
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
@@ -360,10 +1428,10 @@ def get_extended_hardware_info():
                     "Device": partition.device,
                     "Mountpoint": partition.mountpoint,
                     "Filesystem": partition.fstype,
-                    "Total": format_bytes(usage.total),
-                    "Used": format_bytes(usage.used),
-                    "Free": format_bytes(usage.free),
-                    "Usage": f"{usage.percent}%"
+                    "Total": ByteSize(usage.total),
+                    "Used": ByteSize(usage.used),
+                    "Free": ByteSize(usage.free),
+                    "Usage": Percent(usage.percent)
                 })
             except:
                 continue
@@ -382,7 +1450,7 @@ def get_extended_hardware_info():
             
             hardware.append({
                 "Category": "BATTERY",
-                "Percentage": f"{battery.percent}%",
+                "Percentage": Percent(battery.percent),
                 "Power Plugged": "Yes" if battery.power_plugged else "No",
                 "Time Left": time_left
             })
@@ -391,15 +1459,15 @@ def get_extended_hardware_info():
     
     # Network Adapters
     try:
-        addrs = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
+        addrs = scan_query(psutil.net_if_addrs)
+        stats = scan_query(psutil.net_if_stats)
         for interface, addresses in addrs.items():
-            status = "DOWN"
+            status = LinkState.DOWN
             speed = "N/A"
             
             if interface in stats:
-                status = "UP" if stats[interface].isup else "DOWN"
-                speed = f"{stats[interface].speed} Mbps" if stats[interface].speed > 0 else "N/A"
+                status = LinkState.UP if stats[interface].isup else LinkState.DOWN
+                speed = Mbps(stats[interface].speed) if stats[interface].speed > 0 else "N/A"
             
             mac_address = "N/A"
             if addresses and len(addresses) > 0:
@@ -420,76 +1488,723 @@ def get_extended_hardware_info():
     
     return hardware
 
-def get_detailed_process_info():
-    """Get extremely detailed process information"""
-    processes = []
-    
-    for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent',
-                                     'memory_info', 'create_time', 'status', 'cpu_times',
-                                     'num_threads', 'exe', 'cmdline', 'ppid']):
+# -------------------------------------------------------------------
+#  IDENTITY RESOLUTION
+# -------------------------------------------------------------------
+PasswdEntry = namedtuple("PasswdEntry", "name uid gid gecos home shell")
+
+class IdentityResolver:
+    """uid -> user and gid -> group names for one scan.
+
+    /etc/passwd and /etc/group are parsed once up front; ids missing from the
+    local files (LDAP/SSSD users and so on) go through NSS once each, and
+    misses are cached too so an unknown id never costs a second lookup.
+    """
+
+    def __init__(self, passwd_path="/etc/passwd", group_path="/etc/group"):
+        self.passwd_path = passwd_path
+        self.group_path = group_path
+        self.users = OrderedDict()   # uid -> PasswdEntry, in file order
+        self.groups = {}             # gid -> group name
+        self._user_names = {}        # uid -> name, or None for a cached miss
+        self._group_names = {}
+        self._lock = threading.Lock()
+        self.nss_lookups = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.passwd_path, 'r', errors='replace') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split(':')
+                    if len(parts) < 7 or line.startswith('#'):
+                        continue
+                    try:
+                        entry = PasswdEntry(parts[0], int(parts[2]), int(parts[3]), parts[4], parts[5], parts[6])
+                    except ValueError:
+                        continue
+                    self.users.setdefault(entry.uid, entry)
+                    self._user_names.setdefault(entry.uid, entry.name)
+        except OSError:
+            pass
+        try:
+            with open(self.group_path, 'r', errors='replace') as f:
+                for line in f:
+                    parts = line.split(':')
+                    if len(parts) < 3 or line.startswith('#'):
+                        continue
+                    try:
+                        self.groups.setdefault(int(parts[2]), parts[0])
+                    except ValueError:
+                        continue
+            self._group_names.update(self.groups)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _getpwuid(uid):
+        import pwd
+        return pwd.getpwuid(uid).pw_name
+
+    @staticmethod
+    def _getgrgid(gid):
+        import grp
+        return grp.getgrgid(gid).gr_name
+
+    def _nss(self, cache, key, lookup):
+        with self._lock:
+            if key in cache:
+                return cache[key]
+        try:
+            name = lookup(key)
+        except (ImportError, KeyError, OverflowError):
+            name = None
+        with self._lock:
+            self.nss_lookups += 1
+            cache[key] = name
+        return name
+
+    def user_name(self, uid, default=None):
+        """Login name for uid (the uid as a string if it cannot be resolved)"""
+        if uid is None:
+            return default
+        name = self._user_names.get(uid)
+        if name is None and uid not in self._user_names:
+            name = self._nss(self._user_names, uid, self._getpwuid)
+        if name is None:
+            return str(uid) if default is None else default
+        return name
+
+    def group_name(self, gid, default=None):
+        """Group name for gid (the gid as a string if it cannot be resolved)"""
+        if gid is None:
+            return default
+        name = self._group_names.get(gid)
+        if name is None and gid not in self._group_names:
+            name = self._nss(self._group_names, gid, self._getgrgid)
+        if name is None:
+            return str(gid) if default is None else default
+        return name
+
+def get_identity_resolver():
+    """This scan's IdentityResolver, loading the account files on first use"""
+    return scan_flight.do("identity_resolver", IdentityResolver)
+
+# -------------------------------------------------------------------
+#  SHARED PROCESS SNAPSHOT
+# -------------------------------------------------------------------
+# psutil resolves 'username' with a pwd lookup per process; on POSIX fetch the
+# raw uids instead and resolve them through the scan's IdentityResolver
+PROCESS_ATTRS = ['pid', 'name', 'uids' if os.name == 'posix' else 'username', 'cpu_percent',
+                 'memory_percent', 'memory_info', 'create_time', 'status', 'cpu_times',
+                 'num_threads', 'exe', 'cmdline', 'ppid']
+
+PROCESS_FIELDS = ("pid", "name", "username", "cpu_percent", "memory_percent", "rss", "cpu_time",
+                  "create_time", "status", "num_threads", "exe", "cmdline", "ppid")
+
+class ProcessRecord:
+    """One process of a snapshot, stored compactly.
+
+    Slots instead of a per-row dict. The strings that repeat across thousands
+    of rows (user, status, name, exe) are interned so all rows share one copy,
+    and cmdline is a tuple. Item access and get() work like the dict records
+    they replace, and to_dict() returns that plain dict form.
+    """
+
+    __slots__ = PROCESS_FIELDS
+
+    def __init__(self, pid, name="", username=None, cpu_percent=0.0, memory_percent=0.0, rss=None,
+                 cpu_time=None, create_time=None, status="unknown", num_threads=None, exe=None,
+                 cmdline=None, ppid=None):
+        self.pid = pid
+        self.name = sys.intern(name) if name else ""
+        self.username = sys.intern(username) if username else username
+        self.cpu_percent = cpu_percent
+        self.memory_percent = memory_percent
+        self.rss = rss
+        self.cpu_time = cpu_time
+        self.create_time = create_time
+        self.status = sys.intern(status) if status else status
+        self.num_threads = num_threads
+        self.exe = sys.intern(exe) if exe else exe
+        self.cmdline = tuple(cmdline) if cmdline is not None else None
+        self.ppid = ppid
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in PROCESS_FIELDS
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in PROCESS_FIELDS else default
+
+    def keys(self):
+        return PROCESS_FIELDS
+
+    def to_dict(self):
+        record = {field: getattr(self, field) for field in PROCESS_FIELDS}
+        if record["cmdline"] is not None:
+            record["cmdline"] = list(record["cmdline"])
+        return record
+
+    def copy(self):
+        clone = ProcessRecord.__new__(ProcessRecord)
+        for field in PROCESS_FIELDS:
+            setattr(clone, field, getattr(self, field))
+        return clone
+
+    def __repr__(self):
+        return f"ProcessRecord(pid={self.pid}, name={self.name!r}, status={self.status!r})"
+
+class ProcessSnapshot:
+    """Single pass over the process table, shared by every process-aware collector.
+
+    Records are ProcessRecords of raw values (no display formatting) so they can be
+    reused by the process table, statistics, health score and graphs. The
+    pid -> (name, ppid, create_time) index built during the same pass resolves
+    parents, ancestry chains and pid joins (e.g. network connections) without
+    touching /proc again.
+    """
+
+    def __init__(self, records, taken_at=None, index=None, cpu_total=None, cpu_per_core=None,
+                 sample_interval=None):
+        self.records = records
+        self.taken_at = taken_at or time.time()
+        self.cpu_total = cpu_total
+        self.cpu_per_core = cpu_per_core or []
+        self.sample_interval = sample_interval
+        self.churn = None
+        if index is None:
+            index = {r["pid"]: (r["name"], r.get("ppid"), r.get("create_time")) for r in records}
+        self.index = index
+
+    @classmethod
+    def capture(cls, interval=None):
+        """Enumerate processes once, with a single shared CPU sampling window.
+
+        CPU is sampled in two phases: every process counter and the system/per-core
+        CPU times are primed first, then after one shared interval all percentages
+        are computed from that same window. On Linux the direct /proc reader is
+        used; elsewhere (or if /proc is unusable) each process is read through
+        psutil under oneshot().
+        """
+        interval = Config.CPU_SAMPLE_INTERVAL if interval is None else interval
+        if Config.PROC_FAST_PATH and ProcReader.available():
+            try:
+                return cls._capture_procfs(interval)
+            except OSError:
+                pass
+        return cls._capture_psutil(interval)
+
+    @staticmethod
+    def _sample_cpu_window(interval, prime):
+        """prime() per-process counters, wait one interval, return system CPU % for that window"""
+        prime_result = prime()
+        cpu_before = psutil.cpu_times()
+        per_core_before = psutil.cpu_times(percpu=True)
+        window_start = time.monotonic()
+
+        time.sleep(interval)
+
+        cpu_total = cpu_times_percent_between(cpu_before, psutil.cpu_times())
+        cpu_per_core = [cpu_times_percent_between(before, after)
+                        for before, after in zip(per_core_before, psutil.cpu_times(percpu=True))]
+        return prime_result, cpu_total, cpu_per_core, time.monotonic() - window_start
+
+    @classmethod
+    def _capture_procfs(cls, interval):
+        # The shared tracker keeps its table between scans, so repeated scans
+        # only fully read processes started since the previous one
+        tracker = get_process_tracker()
+        _, cpu_total, cpu_per_core, sample_interval = cls._sample_cpu_window(interval, tracker.tick)
+        tracker.tick()
+        snapshot = cls(tracker.records(), cpu_total=cpu_total, cpu_per_core=cpu_per_core,
+                       sample_interval=sample_interval)
+        snapshot.churn = tracker.churn_summary()
+        return snapshot
+
+    @classmethod
+    def _capture_psutil(cls, interval):
+        def prime():
+            for proc in psutil.process_iter():
+                try:
+                    proc.cpu_percent(None)
+                except Exception:
+                    continue
+
+        _, cpu_total, cpu_per_core, sample_interval = cls._sample_cpu_window(interval, prime)
+        records = []
+        index = {}
+        for proc in psutil.process_iter():
+            try:
+                with proc.oneshot():
+                    pinfo = proc.as_dict(PROCESS_ATTRS, ad_value=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            except Exception:
+                continue
+
+            record = psutil_process_record(pinfo)
+            records.append(record)
+            index[record["pid"]] = (record["name"], record["ppid"], record["create_time"])
+        return cls(records, index=index, cpu_total=cpu_total, cpu_per_core=cpu_per_core,
+                   sample_interval=sample_interval)
+
+    def __len__(self):
+        return len(self.records)
+
+    def to_dicts(self, records=None):
+        """Display rows (the dicts the HTML/terminal tables render) for records, default all"""
+        processes = []
+        now = datetime.now()
+        for pinfo in self.records if records is None else records:
+            try:
+                # Calculate additional metrics
+                create_time = datetime.fromtimestamp(pinfo.create_time)
+                uptime = now - create_time
+                
+                # Get parent process info from the snapshot's pid index
+                parent = self.parent_of(pinfo.pid)
+                parent_name = parent[1] if parent else "N/A"
+                ancestry = " > ".join(name for _, name in reversed(self.ancestry(pinfo.pid)))
+                if len(ancestry) > 40:
+                    ancestry = "..." + ancestry[-37:]
+                
+                # Format executable path
+                exe_path = "N/A"
+                if pinfo.exe:
+                    if len(pinfo.exe) > 50:
+                        exe_path = "..." + pinfo.exe[-47:]
+                    else:
+                        exe_path = pinfo.exe
+                
+                # Format command line
+                cmd_line = ""
+                if pinfo.cmdline:
+                    cmd_line = ' '.join(pinfo.cmdline[:2])
+                    if len(cmd_line) > 30:
+                        cmd_line = cmd_line[:27] + "..."
+                
+                processes.append({
+                    "PID": pinfo.pid,
+                    "Name": (pinfo.name[:30] + "...") if len(pinfo.name) > 30 else pinfo.name,
+                    "User": pinfo.username or "SYSTEM",
+                    "CPU %": Percent(pinfo.cpu_percent),
+                    "Memory %": Percent(pinfo.memory_percent),
+                    "Memory (RSS)": ByteSize(pinfo.rss) if pinfo.rss is not None else "N/A",
+                    "Threads": pinfo.num_threads if pinfo.num_threads is not None else "N/A",
+                    "Status": pinfo.status,
+                    "Parent": f"{parent_name} ({pinfo.ppid})",
+                    "Ancestry": ancestry or "N/A",
+                    "Uptime": str(uptime).split('.')[0],
+                    "Created": create_time.strftime('%H:%M:%S'),
+                    "Executable": exe_path,
+                    "Command Line": cmd_line
+                })
+            except Exception:
+                continue
+        return processes
+
+    def name_of(self, pid, default="N/A"):
+        entry = self.index.get(pid)
+        return entry[0] if entry else default
+
+    def parent_of(self, pid):
+        """(ppid, parent name) for pid, or None if the parent is gone or its pid was reused"""
+        entry = self.index.get(pid)
+        if not entry or not entry[1]:
+            return None
+        parent = self.index.get(entry[1])
+        if parent is None:
+            return None
+        # A parent created after its child means the ppid has been recycled
+        if parent[2] and entry[2] and parent[2] > entry[2] + 1:
+            return None
+        return entry[1], parent[0]
+
+    def ancestry(self, pid, max_depth=64):
+        """Chain of (pid, name) from the direct parent up to the root"""
+        chain = []
+        seen = {pid}
+        while len(chain) < max_depth:
+            parent = self.parent_of(pid)
+            if parent is None or parent[0] in seen:
+                break
+            chain.append(parent)
+            seen.add(parent[0])
+            pid = parent[0]
+        return chain
+
+    def children_map(self):
+        """ppid -> [child pids], for building process trees"""
+        children = defaultdict(list)
+        for pid, (_, ppid, _) in self.index.items():
+            if ppid is not None:
+                children[ppid].append(pid)
+        return children
+
+    def status_counts(self):
+        return dict(Counter(r["status"] for r in self.records))
+
+    def zombie_count(self):
+        return sum(1 for r in self.records if r["status"] == psutil.STATUS_ZOMBIE)
+
+    def high_cpu_count(self, threshold=50.0):
+        return sum(1 for r in self.records if r["cpu_percent"] > threshold)
+
+def psutil_process_record(pinfo):
+    """Snapshot record from a psutil as_dict(PROCESS_ATTRS) result"""
+    memory_info = pinfo.get('memory_info')
+    cpu_times = pinfo.get('cpu_times')
+    return ProcessRecord(
+        pid=pinfo['pid'],
+        name=pinfo.get('name') or "",
+        username=(get_identity_resolver().user_name(pinfo['uids'].real) if pinfo.get('uids')
+                  else pinfo.get('username')),
+        cpu_percent=pinfo.get('cpu_percent') or 0.0,
+        memory_percent=pinfo.get('memory_percent') or 0.0,
+        rss=memory_info.rss if memory_info else None,
+        cpu_time=(cpu_times.user + cpu_times.system) if cpu_times else None,
+        create_time=pinfo.get('create_time'),
+        status=pinfo.get('status') or "unknown",
+        num_threads=pinfo.get('num_threads'),
+        exe=pinfo.get('exe'),
+        cmdline=pinfo.get('cmdline'),
+        ppid=pinfo.get('ppid')
+    )
+
+# -------------------------------------------------------------------
+#  LINUX /proc FAST PATH
+# -------------------------------------------------------------------
+PROC_STATES = {
+    "R": "running", "S": "sleeping", "D": "disk-sleep", "Z": "zombie", "T": "stopped",
+    "t": "tracing-stop", "X": "dead", "x": "dead", "K": "wake-kill", "W": "waking",
+    "P": "parked", "I": "idle"
+}
+
+class ProcReader:
+    """Bulk process enumeration straight from /proc, bypassing psutil.
+
+    Each process costs three small reads (stat, statm, status) into one reused
+    buffer plus the exe link and cmdline, and only the fields the report needs
+    are parsed. Records match the ones built from psutil.
+    """
+
+    def __init__(self, proc_root="/proc"):
+        self.proc_root = proc_root
+        self._buffer = bytearray(16384)
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.boot_time = self._read_boot_time()
+        self.mem_total = self._read_mem_total()
+
+    @staticmethod
+    def available(proc_root="/proc"):
+        return platform.system() == "Linux" and os.path.exists(os.path.join(proc_root, "self", "stat"))
+
+    def _read(self, path):
+        """Read a (small) /proc file through the shared buffer; return a copy of its contents"""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.readv(fd, [self._buffer])
+            # Files larger than the buffer (long cmdlines) grow it once
+            while size == len(self._buffer):
+                self._buffer.extend(bytes(len(self._buffer)))
+                os.lseek(fd, 0, os.SEEK_SET)
+                size = os.readv(fd, [self._buffer])
+        finally:
+            os.close(fd)
+        # Copy out and release the view at once: a live export would stop the
+        # next long read from growing the buffer (BufferError)
+        with memoryview(self._buffer) as view, view[:size] as data:
+            return bytes(data)
+
+    def _read_boot_time(self):
+        for line in self._read(os.path.join(self.proc_root, "stat")).splitlines():
+            if line.startswith(b"btime"):
+                return float(line.split()[1])
+        return psutil.boot_time()
+
+    def _read_mem_total(self):
+        for line in self._read(os.path.join(self.proc_root, "meminfo")).splitlines():
+            if line.startswith(b"MemTotal:"):
+                return int(line.split()[1]) * 1024
+        return psutil.virtual_memory().total
+
+    def pids(self):
+        return [int(entry) for entry in os.listdir(self.proc_root) if entry.isdigit()]
+
+    def _stat_fields(self, pid):
+        """(comm, fields after comm) from /proc/<pid>/stat"""
+        data = self._read(f"{self.proc_root}/{pid}/stat")
+        open_paren = data.index(b"(")
+        close_paren = data.rindex(b")")
+        return data[open_paren + 1:close_paren], data[close_paren + 2:].split()
+
+    def read_cpu_ticks(self):
+        """{pid: (start_ticks, utime + stime ticks)} - the priming pass of a CPU window"""
+        ticks = {"_time": time.monotonic()}
+        for pid in self.pids():
+            try:
+                _, fields = self._stat_fields(pid)
+                ticks[pid] = (int(fields[19]), int(fields[11]) + int(fields[12]))
+            except (OSError, ValueError, IndexError, BufferError):
+                continue
+        return ticks
+
+    def read_process(self, pid, cpu_before=None, now=None, stat=None):
+        """One snapshot record for pid (raises OSError if it vanished)"""
+        comm, fields = stat or self._stat_fields(pid)
+        state = fields[0].decode('ascii', 'replace')
+        start_ticks = int(fields[19])
+        cpu_ticks = int(fields[11]) + int(fields[12])
+
+        cpu_percent = 0.0
+        if cpu_before:
+            previous = cpu_before.get(pid)
+            elapsed = (now or time.monotonic()) - cpu_before["_time"]
+            if previous and previous[0] == start_ticks and elapsed > 0:
+                cpu_percent = round((cpu_ticks - previous[1]) / self.clock_ticks / elapsed * 100, 1)
+
+        statm = self._read(f"{self.proc_root}/{pid}/statm").split()
+        rss = int(statm[1]) * self.page_size
+
+        uid = None
+        status = self._read(f"{self.proc_root}/{pid}/status")
+        uid_at = status.find(b"\nUid:")
+        if uid_at >= 0:
+            uid = int(status[uid_at + 5:uid_at + 40].split()[0])
+
+        try:
+            cmdline = [arg.decode('utf-8', 'replace')
+                       for arg in self._read(f"{self.proc_root}/{pid}/cmdline").split(b"\0") if arg]
+        except OSError:
+            cmdline = None
+        try:
+            exe = os.readlink(f"{self.proc_root}/{pid}/exe")
+        except FileNotFoundError:
+            exe = ""  # kernel threads have no executable (psutil reports "")
+        except OSError:
+            exe = None
+
+        name = comm.decode('utf-8', 'replace')
+        # comm is truncated to 15 chars; recover the full name like psutil does
+        if len(name) >= 15 and cmdline:
+            full_name = os.path.basename(cmdline[0])
+            if full_name.startswith(name):
+                name = full_name
+
+        return ProcessRecord(
+            pid=pid,
+            name=name,
+            username=get_identity_resolver().user_name(uid),
+            cpu_percent=cpu_percent,
+            memory_percent=rss / self.mem_total * 100 if self.mem_total else 0.0,
+            rss=rss,
+            cpu_time=cpu_ticks / self.clock_ticks,
+            create_time=self.boot_time + start_ticks / self.clock_ticks,
+            status=PROC_STATES.get(state, state),
+            num_threads=int(fields[17]),
+            exe=exe,
+            cmdline=cmdline,
+            ppid=int(fields[1])
+        )
+
+    def read_all(self, cpu_before=None):
+        """Snapshot records for every live pid"""
+        now = time.monotonic()
+        records = []
+        for pid in self.pids():
+            try:
+                records.append(self.read_process(pid, cpu_before, now))
+            except (OSError, ValueError, IndexError, BufferError):
+                continue  # exited mid-read or unreadable
+        return records
+
+class ProcessTracker:
+    """Incremental process table for repeated sampling, keyed by (pid, start time).
+
+    Each tick lists /proc once; only pids not seen before (or whose start time
+    changed, i.e. a recycled pid) get a full read. Known processes just have
+    their counters refreshed from a single stat read, and records of exited processes
+    are dropped. The pids added and removed per tick are the churn statistics.
+    """
+
+    def __init__(self, reader=None, history=None):
+        self.reader = reader or ProcReader()
+        self._entries = {}   # pid -> [start_ticks, cpu_ticks, comm, record]
+        self._lock = threading.Lock()
+        self.last_tick = None
+        self.ticks = 0
+        self.total_spawned = 0
+        self.total_exited = 0
+        self.churn = deque(maxlen=history or Config.SAMPLER_CAPACITY)
+
+    def _refresh(self, pid, entry, elapsed):
+        """Update an existing record in place; False if the pid now belongs to another process"""
+        reader = self.reader
+        comm, fields = reader._stat_fields(pid)
+        start_ticks = int(fields[19])
+        if start_ticks != entry[0] or comm != entry[2]:
+            return False  # recycled pid or exec() - needs a full read
+
+        cpu_ticks = int(fields[11]) + int(fields[12])
+        rss = int(fields[21]) * reader.page_size  # rss pages, so no statm read is needed
+        state = fields[0].decode('ascii', 'replace')
+
+        record = entry[3]
+        record.cpu_percent = (round((cpu_ticks - entry[1]) / reader.clock_ticks / elapsed * 100, 1)
+                              if elapsed > 0 else 0.0)
+        record.cpu_time = cpu_ticks / reader.clock_ticks
+        record.rss = rss
+        record.memory_percent = rss / reader.mem_total * 100 if reader.mem_total else 0.0
+        record.status = PROC_STATES.get(state, state)  # interned table values
+        record.num_threads = int(fields[17])
+        record.ppid = int(fields[1])  # orphans get reparented
+        entry[1] = cpu_ticks
+        return True
+
+    def _read_new(self, pid):
+        comm, fields = self.reader._stat_fields(pid)
+        record = self.reader.read_process(pid, stat=(comm, fields))
+        return [int(fields[19]), int(fields[11]) + int(fields[12]), comm, record]
+
+    def tick(self):
+        """Bring the table up to date; return this tick's churn statistics"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_tick if self.last_tick else 0.0
+            live = set(self.reader.pids())
+
+            exited = [pid for pid in self._entries if pid not in live]
+            for pid in exited:
+                del self._entries[pid]
+
+            spawned = 0
+            for pid in live:
+                entry = self._entries.get(pid)
+                try:
+                    if entry is not None and self._refresh(pid, entry, elapsed):
+                        continue
+                    if entry is not None:
+                        exited.append(pid)  # the old process behind this pid is gone
+                    self._entries[pid] = self._read_new(pid)
+                    spawned += 1
+                except (OSError, ValueError, IndexError, BufferError):
+                    if self._entries.pop(pid, None) is not None and entry is not None:
+                        exited.append(pid)
+
+            first_tick = self.last_tick is None
+            self.last_tick = now
+            self.ticks += 1
+            churn = {
+                "time": time.time(),
+                "interval": elapsed,
+                "processes": len(self._entries),
+                # the first tick only builds the baseline
+                "spawned": 0 if first_tick else spawned,
+                "exited": len(exited)
+            }
+            self.total_spawned += churn["spawned"]
+            self.total_exited += churn["exited"]
+            self.churn.append(churn)
+            return churn
+
+    def records(self):
+        """Copies of the current records (safe to hand to another thread)"""
+        with self._lock:
+            return [entry[3].copy() for entry in self._entries.values()]
+
+    def churn_summary(self):
+        """Spawn/exit totals and per-second rates over the recorded history"""
+        with self._lock:
+            history = list(self.churn)[1:]
+            span = sum(c["interval"] for c in history)
+            return {
+                "ticks": self.ticks,
+                "processes": len(self._entries),
+                "spawned": self.total_spawned,
+                "exited": self.total_exited,
+                "spawn_rate": sum(c["spawned"] for c in history) / span if span else 0.0,
+                "exit_rate": sum(c["exited"] for c in history) / span if span else 0.0
+            }
+
+_process_tracker = None
+_process_tracker_lock = threading.Lock()
+
+def get_process_tracker():
+    """The process-wide ProcessTracker, or None where /proc is not available"""
+    global _process_tracker
+    if not (Config.PROC_FAST_PATH and ProcReader.available()):
+        return None
+    with _process_tracker_lock:
+        if _process_tracker is None:
+            _process_tracker = ProcessTracker()
+        return _process_tracker
+
+def cpu_times_percent_between(before, after):
+    """Busy CPU % between two psutil.cpu_times() samples (same formula as psutil.cpu_percent)"""
+    def split(t):
+        total = sum(t)
+        # guest time is already accounted for in user/nice on Linux
+        total -= getattr(t, 'guest', 0) + getattr(t, 'guest_nice', 0)
+        idle = t.idle + getattr(t, 'iowait', 0)
+        return total, total - idle
+
+    total_before, busy_before = split(before)
+    total_after, busy_after = split(after)
+    total_delta = total_after - total_before
+    if total_delta <= 0:
+        return 0.0
+    busy_delta = max(0.0, busy_after - busy_before)
+    return round(min(100.0, busy_delta / total_delta * 100), 1)
+
+def reset_scan_state():
+    """Forget everything memoized for the previous scan"""
+    scan_flight.reset()
+    with _table_pages_lock:
+        _table_pages.clear()
+
+def get_process_snapshot():
+    """Return this scan's process snapshot, capturing it on first use"""
+    return scan_flight.do("process_snapshot", ProcessSnapshot.capture)
+
+def peek_process_snapshot():
+    """Return this scan's process snapshot if one has been captured, without blocking"""
+    return scan_flight.peek("process_snapshot")
+
+def get_process_records(all_data):
+    """Raw per-process records for a scan: the full snapshot, else parsed table rows"""
+    if all_data.get("process_snapshot"):
+        return all_data["process_snapshot"]
+
+    records = []
+    for p in all_data.get("process_info", []):
         try:
-            pinfo = proc.info
-            
-            # Calculate additional metrics
-            create_time = datetime.fromtimestamp(pinfo['create_time'])
-            uptime = datetime.now() - create_time
-            
-            # Get parent process info
-            parent_name = "N/A"
-            if pinfo['ppid']:
-                try:
-                    parent = psutil.Process(pinfo['ppid'])
-                    parent_name = parent.name()
-                except:
-                    pass
-            
-            # Format memory
-            memory_mb = "N/A"
-            if pinfo.get('memory_info'):
-                memory_mb = f"{pinfo['memory_info'].rss / (1024*1024):.2f}"
-            
-            # Format executable path
-            exe_path = "N/A"
-            if pinfo.get('exe'):
-                if len(pinfo['exe']) > 50:
-                    exe_path = "..." + pinfo['exe'][-47:]
-                else:
-                    exe_path = pinfo['exe']
-            
-            # Format command line
-            cmd_line = ""
-            if pinfo.get('cmdline'):
-                cmd_line = ' '.join(pinfo['cmdline'][:2])
-                if len(cmd_line) > 30:
-                    cmd_line = cmd_line[:27] + "..."
-            
-            processes.append({
-                "PID": pinfo['pid'],
-                "Name": (pinfo['name'][:30] + "...") if len(pinfo['name']) > 30 else pinfo['name'],
-                "User": pinfo['username'] or "SYSTEM",
-                "CPU %": f"{pinfo['cpu_percent']:.2f}",
-                "Memory %": f"{pinfo['memory_percent']:.3f}",
-                "Memory (MB)": memory_mb,
-                "Threads": pinfo.get('num_threads', 'N/A'),
-                "Status": pinfo['status'],
-                "Parent": f"{parent_name} ({pinfo['ppid']})",
-                "Uptime": str(uptime).split('.')[0],
-                "Created": create_time.strftime('%H:%M:%S'),
-                "Executable": exe_path,
-                "Command Line": cmd_line
+            records.append({
+                "pid": p.get("PID"),
+                "name": p.get("Name", "Unknown"),
+                "username": p.get("User"),
+                "cpu_percent": numeric(p.get("CPU %"), 0.0),
+                "memory_percent": numeric(p.get("Memory %"), 0.0),
+                "status": p.get("Status", "UNKNOWN")
             })
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-        except Exception as e:
+        except:
             continue
-    
-    # Sort by CPU usage
-    try:
-        processes.sort(key=lambda x: float(x['CPU %']), reverse=True)
-    except:
-        pass
-    
-    return processes[:100]  # Return top 100 processes
+    return records
+
+def get_detailed_process_info():
+    """Get extremely detailed process information"""
+    snapshot = get_process_snapshot()
+    # Pick the busiest processes on the raw values, then build display rows for those only
+    return snapshot.to_dicts(top_n(snapshot.records, "process_info", key=lambda r: r.cpu_percent))
 
 def get_network_analysis_extended():
     """Get comprehensive network analysis"""
@@ -497,16 +2212,16 @@ def get_network_analysis_extended():
     
     # Network interfaces
     try:
-        addrs = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
-        io_counters = psutil.net_io_counters(pernic=True)
+        addrs = scan_query(psutil.net_if_addrs)
+        stats = scan_query(psutil.net_if_stats)
+        io_counters = scan_query(psutil.net_io_counters, pernic=True)
         
         for interface in addrs:
             iface_info = {
                 "Interface": interface,
-                "Status": "UP" if interface in stats and stats[interface].isup else "DOWN",
+                "Status": LinkState.UP if interface in stats and stats[interface].isup else LinkState.DOWN,
                 "MTU": stats[interface].mtu if interface in stats else "N/A",
-                "Speed": f"{stats[interface].speed} Mbps" if interface in stats and stats[interface].speed > 0 else "N/A",
+                "Speed": Mbps(stats[interface].speed) if interface in stats and stats[interface].speed > 0 else "N/A",
                 "MAC": "N/A",
                 "IPv4": [],
                 "IPv6": []
@@ -528,14 +2243,14 @@ def get_network_analysis_extended():
             if interface in io_counters:
                 io = io_counters[interface]
                 iface_info.update({
-                    "Bytes Sent": format_bytes(io.bytes_sent),
-                    "Bytes Recv": format_bytes(io.bytes_recv),
-                    "Packets Sent": f"{io.packets_sent:,}",
-                    "Packets Recv": f"{io.packets_recv:,}",
-                    "Errors In": f"{io.errin:,}",
-                    "Errors Out": f"{io.errout:,}",
-                    "Dropped In": f"{io.dropin:,}",
-                    "Dropped Out": f"{io.dropout:,}"
+                    "Bytes Sent": ByteSize(io.bytes_sent),
+                    "Bytes Recv": ByteSize(io.bytes_recv),
+                    "Packets Sent": Count(io.packets_sent),
+                    "Packets Recv": Count(io.packets_recv),
+                    "Errors In": Count(io.errin),
+                    "Errors Out": Count(io.errout),
+                    "Dropped In": Count(io.dropin),
+                    "Dropped Out": Count(io.dropout)
                 })
             
             # Join lists to strings
@@ -554,6 +2269,7 @@ def get_network_analysis_extended():
     # Active connections
     try:
         connections = []
+        snapshot = get_process_snapshot()
         for conn in psutil.net_connections(kind='inet'):
             try:
                 if conn.status == 'ESTABLISHED':
@@ -562,20 +2278,22 @@ def get_network_analysis_extended():
                         "Local": f"{conn.laddr.ip}:{conn.laddr.port}",
                         "Remote": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
                         "Status": conn.status,
-                        "PID": conn.pid
+                        "PID": conn.pid,
+                        "Process": snapshot.name_of(conn.pid) if conn.pid else "N/A"
                     })
             except:
                 continue
         
         # Add connections as separate section
-        for i, conn in enumerate(connections[:20]):  # Limit to 20 connections
+        for i, conn in enumerate(page_rows(connections, "network_connections")):
             network_info.append({
                 "Interface": f"CONN_{i+1}",
                 "Protocol": conn["Protocol"],
                 "Local": conn["Local"],
                 "Remote": conn["Remote"],
                 "Status": conn["Status"],
-                "PID": conn["PID"]
+                "PID": conn["PID"],
+                "Process": conn["Process"]
             })
     except:
         pass
@@ -596,13 +2314,13 @@ def get_security_audit():
             security_info.append({
                 "Security Feature": "Admin Privileges",
                 "Status": "Yes" if is_admin else "No",
-                "Risk": "High" if is_admin else "Low"
+                "Risk": RiskLevel.HIGH if is_admin else RiskLevel.LOW
             })
         except:
             security_info.append({
                 "Security Feature": "Admin Privileges",
                 "Status": "Unknown",
-                "Risk": "Unknown"
+                "Risk": RiskLevel.UNKNOWN
             })
         
         # Try to check firewall
@@ -612,19 +2330,19 @@ def get_security_audit():
                 security_info.append({
                     "Security Feature": "Firewall",
                     "Status": "Enabled",
-                    "Risk": "Low"
+                    "Risk": RiskLevel.LOW
                 })
             else:
                 security_info.append({
                     "Security Feature": "Firewall",
                     "Status": "Disabled",
-                    "Risk": "High"
+                    "Risk": RiskLevel.HIGH
                 })
         except:
             security_info.append({
                 "Security Feature": "Firewall",
                 "Status": "Unknown",
-                "Risk": "Medium"
+                "Risk": RiskLevel.MEDIUM
             })
     else:
         # For non-Windows systems
@@ -633,7 +2351,7 @@ def get_security_audit():
             security_info.append({
                 "Security Feature": "Root Privileges",
                 "Status": "Yes" if is_admin else "No",
-                "Risk": "High" if is_admin else "Low"
+                "Risk": RiskLevel.HIGH if is_admin else RiskLevel.LOW
             })
         except:
             pass
@@ -641,11 +2359,188 @@ def get_security_audit():
         security_info.append({
             "Security Feature": "Platform",
             "Status": f"{platform.system()}",
-            "Risk": "N/A"
+            "Risk": RiskLevel.NOT_APPLICABLE
         })
     
     return security_info
 
+# -------------------------------------------------------------------
+#  NATIVE PACKAGE DATABASE READERS
+# -------------------------------------------------------------------
+PackageRecord = namedtuple("PackageRecord", ["name", "version", "arch", "installed_size", "status"])
+
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+RPMDB_SQLITE_PATHS = ["/var/lib/rpm/rpmdb.sqlite", "/usr/lib/sysimage/rpm/rpmdb.sqlite"]
+RPMDB_LEGACY_PATHS = ["/var/lib/rpm/Packages", "/usr/lib/sysimage/rpm/Packages.db"]
+
+_package_inventory_cache = {}
+_package_inventory_lock = threading.Lock()
+
+def read_dpkg_status(path=DPKG_STATUS_PATH):
+    """Stream /var/lib/dpkg/status into PackageRecords (installed size in bytes)"""
+    records = []
+    name = version = arch = status = None
+    size = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            first = line[:1]
+            if first in (b' ', b'\t'):
+                continue  # continuation line (Description, Conffiles, ...)
+            if first == b'\n':
+                if name is not None:
+                    records.append(PackageRecord(name, version or "", arch or "", size, status or ""))
+                name = version = arch = status = None
+                size = 0
+                continue
+            if first == b'P' and line.startswith(b'Package: '):
+                name = line[9:].strip().decode('utf-8', 'replace')
+            elif first == b'V' and line.startswith(b'Version: '):
+                version = line[9:].strip().decode('utf-8', 'replace')
+            elif first == b'A' and line.startswith(b'Architecture: '):
+                arch = line[14:].strip().decode('ascii', 'replace')
+            elif first == b'S' and line.startswith(b'Status: '):
+                # "want flag state" - report the state word (installed, config-files, ...)
+                status = line[8:].split()[-1].decode('ascii', 'replace')
+            elif first == b'I' and line.startswith(b'Installed-Size: '):
+                try:
+                    size = int(line[16:]) * 1024
+                except ValueError:
+                    size = 0
+    if name is not None:
+        records.append(PackageRecord(name, version or "", arch or "", size, status or ""))
+    return records
+
+# RPM header tags / types used by the native reader
+RPMTAG_NAME, RPMTAG_VERSION, RPMTAG_RELEASE, RPMTAG_EPOCH = 1000, 1001, 1002, 1003
+RPMTAG_SIZE, RPMTAG_ARCH, RPMTAG_LONGSIZE = 1009, 1022, 5009
+RPM_INT32_TYPE, RPM_INT64_TYPE, RPM_STRING_TYPE = 4, 5, 6
+_RPM_WANTED_TAGS = {RPMTAG_NAME, RPMTAG_VERSION, RPMTAG_RELEASE, RPMTAG_EPOCH,
+                    RPMTAG_SIZE, RPMTAG_ARCH, RPMTAG_LONGSIZE}
+
+def parse_rpm_header(blob):
+    """Decode the few tags we need from one rpmdb header blob"""
+    index_count, data_length = struct.unpack_from(">II", blob, 0)
+    data_start = 8 + index_count * 16
+    values = {}
+    for i in range(index_count):
+        tag, tag_type, offset, count = struct.unpack_from(">iiii", blob, 8 + i * 16)
+        if tag not in _RPM_WANTED_TAGS:
+            continue
+        pos = data_start + offset
+        if tag_type == RPM_STRING_TYPE:
+            end = blob.index(b'\0', pos)
+            values[tag] = blob[pos:end].decode('utf-8', 'replace')
+        elif tag_type == RPM_INT32_TYPE:
+            values[tag] = struct.unpack_from(">I", blob, pos)[0]
+        elif tag_type == RPM_INT64_TYPE:
+            values[tag] = struct.unpack_from(">Q", blob, pos)[0]
+    return values
+
+def read_rpmdb_sqlite(path):
+    """Read installed packages straight from an rpmdb.sqlite database"""
+    records = []
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5)
+    try:
+        for (blob,) in conn.execute("SELECT blob FROM Packages"):
+            try:
+                tags = parse_rpm_header(bytes(blob))
+            except (struct.error, ValueError):
+                continue
+            if RPMTAG_NAME not in tags:
+                continue
+            version = f"{tags.get(RPMTAG_VERSION, '')}-{tags.get(RPMTAG_RELEASE, '')}"
+            if tags.get(RPMTAG_EPOCH):
+                version = f"{tags[RPMTAG_EPOCH]}:{version}"
+            records.append(PackageRecord(tags[RPMTAG_NAME], version, tags.get(RPMTAG_ARCH, ""),
+                                         tags.get(RPMTAG_LONGSIZE, tags.get(RPMTAG_SIZE, 0)), "installed"))
+    finally:
+        conn.close()
+    return records
+
+def read_rpm_query():
+    """Fallback for Berkeley DB / NDB rpm databases: one 'rpm -qa' with a compact format (None if it failed)"""
+    output = run_command_with_timeout(
+        "rpm -qa --queryformat '%{NAME}\\t%|EPOCH?{%{EPOCH}:}|%{VERSION}-%{RELEASE}\\t%{ARCH}\\t%{SIZE}\\n'", 30)
+    if output.startswith("["):
+        return None  # timed out, cancelled or failed to start
+    records = []
+    for line in output.splitlines():
+        parts = line.split('\t')
+        if len(parts) == 4:
+            try:
+                size = int(parts[3])
+            except ValueError:
+                size = 0
+            records.append(PackageRecord(parts[0], parts[1], parts[2], size, "installed"))
+    return records or None
+
+def _package_db_signature(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_ino, st.st_size]
+
+def _load_package_inventory(path, reader):
+    """Run reader(path) unless the in-process or on-disk copy for the same DB signature is current.
+
+    A failed or empty read returns None and is not cached, so the next scan tries again.
+    """
+    signature = _package_db_signature(path)
+    with _package_inventory_lock:
+        cached = _package_inventory_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        cache_file = os.path.join(Config.CACHE_DIR, "packages_" + hashlib.sha1(path.encode()).hexdigest()[:12] + ".json")
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get("signature") == signature:
+                records = [PackageRecord(*row) for row in stored["records"]]
+                _package_inventory_cache[path] = (signature, records)
+                return records
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+        records = reader(path)
+        if not records:
+            return None
+        _package_inventory_cache[path] = (signature, records)
+        try:
+            os.makedirs(Config.CACHE_DIR, exist_ok=True)
+            tmp_file = cache_file + f".{os.getpid()}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"path": path, "signature": signature, "records": records}, f, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+        return records
+
+def get_package_inventory():
+    """(source, [PackageRecord]) for the native package manager, or (None, []) if none is readable"""
+    if os.path.exists(DPKG_STATUS_PATH):
+        try:
+            records = _load_package_inventory(DPKG_STATUS_PATH, read_dpkg_status)
+            if records:
+                return "dpkg", records
+        except OSError:
+            pass
+    for path in RPMDB_SQLITE_PATHS:
+        if os.path.exists(path):
+            try:
+                records = _load_package_inventory(path, read_rpmdb_sqlite)
+                if records:
+                    return "rpm", records
+            except (OSError, sqlite3.Error):
+                pass
+    for path in RPMDB_LEGACY_PATHS:
+        if os.path.exists(path):
+            try:
+                records = _load_package_inventory(path, lambda _: read_rpm_query())
+                if records:
+                    return "rpm", records
+            except OSError:
+                pass
+    return None, []
+
 def get_installed_software_extended():
     """Get detailed installed software information"""
     software_list = []
@@ -731,20 +2626,17 @@ def get_installed_software_extended():
         try:
             # Try to get installed packages
             if platform.system() == "Linux":
-                output = run_command_with_timeout("dpkg-query -l | tail -n +6 | head -20", 10)
-                if output:
-                    lines = output.split('\n')
-                    for line in lines:
-                        if line.strip():
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                software_list.append({
-                                    "Name": parts[1][:50],
-                                    "Version": parts[2],
-                                    "Publisher": "System Package",
-                                    "Install Date": "N/A",
-                                    "Install Location": "N/A"
-                                })
+                # Complete inventory straight from the package database
+                source, packages = get_package_inventory()
+                for package in packages:
+                    software_list.append({
+                        "Name": package.name[:50],
+                        "Version": package.version,
+                        "Architecture": package.arch,
+                        "Installed Size": ByteSize(package.installed_size),
+                        "Status": package.status,
+                        "Publisher": f"System Package ({source})"
+                    })
             elif platform.system() == "Darwin":  # macOS
                 output = run_command_with_timeout("system_profiler SPApplicationsDataType | grep -A2 'Location:' | head -30", 10)
                 if output:
@@ -772,16 +2664,16 @@ def get_installed_software_extended():
                 "Publisher": "N/A"
             })
     
-    # Remove duplicates
+    # Remove duplicates (multi-arch packages share a name)
     seen = set()
     unique_software = []
     for item in software_list:
-        identifier = item["Name"]
+        identifier = (item["Name"], item.get("Architecture"))
         if identifier not in seen:
             seen.add(identifier)
             unique_software.append(item)
     
-    return unique_software[:50]
+    return page_rows(unique_software, "installed_software")
 
 def get_system_services_extended():
     """Get detailed service information"""
@@ -830,7 +2722,7 @@ def get_system_services_extended():
         # For Linux systems
         try:
             if platform.system() == "Linux":
-                output = run_command_with_timeout("systemctl list-units --type=service --all --no-pager | head -30", 10)
+                output = run_command_with_timeout("systemctl list-units --type=service --all --no-pager", 10)
                 if output:
                     lines = output.split('\n')
                     for line in lines[1:]:  # Skip header
@@ -855,7 +2747,7 @@ def get_system_services_extended():
                 "Start Mode": "N/A"
             })
     
-    return services[:30]
+    return page_rows(services, "system_services")
 
 def get_startup_programs():
     """Get startup programs"""
@@ -879,7 +2771,7 @@ def get_startup_programs():
                                 startup_programs.append({
                                     "Name": file[:30],
                                     "Path": (full_path[:50] + "...") if len(full_path) > 50 else full_path,
-                                    "Size": format_bytes(file_size),
+                                    "Size": ByteSize(file_size),
                                     "Modified": mod_time.strftime('%Y-%m-%d'),
                                     "Type": "Startup"
                                 })
@@ -905,7 +2797,7 @@ def get_startup_programs():
                         startup_programs.append({
                             "Name": os.path.basename(path)[:30],
                             "Path": path[:50],
-                            "Size": format_bytes(file_size),
+                            "Size": ByteSize(file_size),
                             "Modified": mod_time.strftime('%Y-%m-%d'),
                             "Type": "Startup Script"
                         })
@@ -913,7 +2805,7 @@ def get_startup_programs():
                         pass
                 elif os.path.isdir(path):
                     try:
-                        for file in os.listdir(path)[:5]:  # Limit to 5 files
+                        for file in sorted(os.listdir(path)):
                             full_path = os.path.join(path, file)
                             if os.path.isfile(full_path):
                                 file_size = os.path.getsize(full_path)
@@ -921,14 +2813,14 @@ def get_startup_programs():
                                 startup_programs.append({
                                     "Name": file[:30],
                                     "Path": (full_path[:50] + "...") if len(full_path) > 50 else full_path,
-                                    "Size": format_bytes(file_size),
+                                    "Size": ByteSize(file_size),
                                     "Modified": mod_time.strftime('%Y-%m-%d'),
                                     "Type": "Startup"
                                 })
                     except:
                         pass
     
-    return startup_programs[:20]
+    return page_rows(startup_programs, "startup_programs")
 
 def get_system_environment_extended():
     """Get comprehensive environment variables"""
@@ -945,10 +2837,10 @@ def get_system_environment_extended():
                     "Type": "System"
                 })
         
-        # Path variable broken down (limited)
+        # Path variable broken down
         if 'PATH' in os.environ:
             paths = os.environ['PATH'].split(os.pathsep)
-            for i, path in enumerate(paths[:5]):  # First 5 paths only
+            for i, path in enumerate(paths):
                 env_vars.append({
                     "Variable": f"PATH[{i}]",
                     "Value": (path[:100] + "...") if len(path) > 100 else path,
@@ -961,7 +2853,7 @@ def get_system_environment_extended():
             "Type": "Error"
         })
     
-    return env_vars[:30]
+    return page_rows(env_vars, "environment_vars")
 
 def get_hardware_temperatures():
     """Get hardware temperatures if available"""
@@ -975,9 +2867,9 @@ def get_hardware_temperatures():
                     temps.append({
                         "Sensor": name[:20],
                         "Label": (entry.label[:20] + "...") if entry.label and len(entry.label) > 20 else entry.label or "N/A",
-                        "Current": f"{entry.current}°C",
-                        "High": f"{entry.high}°C" if entry.high else "N/A",
-                        "Critical": f"{entry.critical}°C" if entry.critical else "N/A"
+                        "Current": Celsius(entry.current),
+                        "High": Celsius(entry.high) if entry.high else "N/A",
+                        "Critical": Celsius(entry.critical) if entry.critical else "N/A"
                     })
     except:
         pass
@@ -991,7 +2883,7 @@ def get_hardware_temperatures():
             "Critical": "N/A"
         })
     
-    return temps[:15]
+    return page_rows(temps, "hardware_temps")
 
 def get_system_logs_extended():
     """Get system logs"""
@@ -999,7 +2891,7 @@ def get_system_logs_extended():
     
     try:
         # Recent events using psutil
-        boot_time = psutil.boot_time()
+        boot_time = scan_query(psutil.boot_time)
         logs.append({
             "Time": datetime.fromtimestamp(boot_time).strftime('%Y-%m-%d %H:%M:%S'),
             "Event": "System Boot",
@@ -1046,28 +2938,45 @@ def get_performance_metrics():
     metrics = []
     
     try:
-        # CPU Metrics
-        cpu_percent = psutil.cpu_percent(interval=0.5, percpu=False)
-        try:
-            cpu_percent_per_core = psutil.cpu_percent(interval=0.5, percpu=True)
-            core_details = ", ".join([f"{p}%" for p in cpu_percent_per_core[:4]])  # First 4 cores only
+        # CPU Metrics - averaged from the background sampler, never blocking here
+        cpu_summary = metrics_sampler.summary("cpu")
+        if cpu_summary:
+            window = cpu_summary["samples"] * metrics_sampler.interval
+            metrics.append({
+                "Metric": "CPU Usage",
+                "Value": Percent(cpu_summary['mean']),
+                "Details": f"p95: {cpu_summary['p95']:.1f}%, max: {cpu_summary['max']:.1f}% over {window:.0f}s"
+            })
+            cpu_percent_per_core = [metrics_sampler.summary(f"cpu_core_{core}")["mean"]
+                                    for core in range(metrics_sampler.cores)]
+        else:
+            # Sampler not running - fall back to the snapshot's shared sampling window
+            snapshot = get_process_snapshot()
+            metrics.append({
+                "Metric": "CPU Usage",
+                "Value": Percent(snapshot.cpu_total),
+                "Details": f"Sampled over {snapshot.sample_interval:.2f}s"
+            })
+            cpu_percent_per_core = snapshot.cpu_per_core
+
+        if cpu_percent_per_core:
+            core_details = ", ".join([f"{p:.1f}%" for p in cpu_percent_per_core[:4]])  # First 4 cores only
             if len(cpu_percent_per_core) > 4:
                 core_details += f" ... (+{len(cpu_percent_per_core)-4} more)"
-        except:
-            core_details = "N/A"
-        
-        metrics.append({
-            "Metric": "CPU Usage",
-            "Value": f"{cpu_percent}%",
-            "Details": f"Cores: {core_details}"
-        })
+            metrics.append({
+                "Metric": "CPU Per Core",
+                "Value": f"{len(cpu_percent_per_core)} cores",
+                "Details": core_details
+            })
         
         # Memory Metrics
         memory = psutil.virtual_memory()
+        memory_summary = metrics_sampler.summary("memory")
         metrics.append({
             "Metric": "Memory Usage",
-            "Value": f"{memory.percent}%",
+            "Value": Percent(memory.percent),
             "Details": f"{format_bytes(memory.used)} / {format_bytes(memory.total)}"
+                       + (f", p95: {memory_summary['p95']:.1f}%" if memory_summary else "")
         })
         
         # Swap Metrics
@@ -1075,7 +2984,7 @@ def get_performance_metrics():
         if swap.total > 0:
             metrics.append({
                 "Metric": "Swap Usage",
-                "Value": f"{swap.percent}%",
+                "Value": Percent(swap.percent),
                 "Details": f"{format_bytes(swap.used)} / {format_bytes(swap.total)}"
             })
         
@@ -1085,29 +2994,40 @@ def get_performance_metrics():
             if disk_io:
                 metrics.append({
                     "Metric": "Disk Read",
-                    "Value": format_bytes(disk_io.read_bytes),
+                    "Value": ByteSize(disk_io.read_bytes),
                     "Details": f"{disk_io.read_count:,} operations"
                 })
                 metrics.append({
                     "Metric": "Disk Write",
-                    "Value": format_bytes(disk_io.write_bytes),
+                    "Value": ByteSize(disk_io.write_bytes),
                     "Details": f"{disk_io.write_count:,} operations"
                 })
         except:
             pass
         
+        # I/O rates from the sampler
+        for series, label in (("disk_read", "Disk Read Rate"), ("disk_write", "Disk Write Rate"),
+                              ("net_sent", "Network Send Rate"), ("net_recv", "Network Receive Rate")):
+            rate = metrics_sampler.summary(series)
+            if rate:
+                metrics.append({
+                    "Metric": label,
+                    "Value": ByteRate(rate['mean']),
+                    "Details": f"p95: {format_bytes(rate['p95'])}/s, peak: {format_bytes(rate['max'])}/s"
+                })
+        
         # Network I/O
         try:
             net_io = psutil.net_io_counters()
             if net_io:
                 metrics.append({
                     "Metric": "Network Sent",
-                    "Value": format_bytes(net_io.bytes_sent),
+                    "Value": ByteSize(net_io.bytes_sent),
                     "Details": f"{net_io.packets_sent:,} packets"
                 })
                 metrics.append({
                     "Metric": "Network Received",
-                    "Value": format_bytes(net_io.bytes_recv),
+                    "Value": ByteSize(net_io.bytes_recv),
                     "Details": f"{net_io.packets_recv:,} packets"
                 })
         except:
@@ -1115,12 +3035,20 @@ def get_performance_metrics():
         
         # Process count
         try:
-            process_count = len(psutil.pids())
+            snapshot = get_process_snapshot()
+            process_count = len(snapshot)
             metrics.append({
                 "Metric": "Running Processes",
-                "Value": process_count,
+                "Value": Count(process_count),
                 "Details": f"System processes: {process_count}"
             })
+            if snapshot.churn and snapshot.churn["ticks"] > 1:
+                metrics.append({
+                    "Metric": "Process Churn",
+                    "Value": f"{snapshot.churn['spawn_rate']:.1f} spawned/s",
+                    "Details": f"{snapshot.churn['spawned']:,} spawned, {snapshot.churn['exited']:,} exited "
+                               f"over {snapshot.churn['ticks']} samples"
+                })
         except:
             pass
         
@@ -1180,30 +3108,27 @@ def get_user_accounts_extended():
         # For non-Windows systems
         try:
             current_user = getpass.getuser()
+            identity = get_identity_resolver()
             users.append({
                 "Username": current_user,
                 "Full Name": "Current User",
+                "Group": identity.group_name(os.getgid()),
                 "Active": "Yes",
                 "Last Logon": "Now"
             })
             
-            # Try to get other users from /etc/passwd (Linux)
+            # Other users from the scan's parsed /etc/passwd (Linux)
             if platform.system() == "Linux":
                 try:
-                    with open('/etc/passwd', 'r') as f:
-                        lines = f.readlines()
-                        for line in lines[:10]:  # First 10 users only
-                            parts = line.split(':')
-                            if len(parts) >= 5:
-                                username = parts[0]
-                                fullname = parts[4].split(',')[0]
-                                if username != current_user and username not in ['root', 'daemon', 'bin']:
-                                    users.append({
-                                        "Username": username[:20],
-                                        "Full Name": fullname[:30],
-                                        "Active": "Yes",
-                                        "Last Logon": "N/A"
-                                    })
+                    for entry in identity.users.values():
+                        if entry.name != current_user and entry.name not in ['root', 'daemon', 'bin']:
+                            users.append({
+                                "Username": entry.name[:20],
+                                "Full Name": entry.gecos.split(',')[0][:30],
+                                "Group": identity.group_name(entry.gid),
+                                "Active": "Yes",
+                                "Last Logon": "N/A"
+                            })
                 except:
                     pass
         except:
@@ -1214,7 +3139,7 @@ def get_user_accounts_extended():
                 "Last Logon": "N/A"
             })
     
-    return users[:15]
+    return page_rows(users, "user_accounts")
 
 def get_system_drivers_extended():
     """Get detailed driver information"""
@@ -1237,9 +3162,6 @@ def get_system_drivers_extended():
                                 "State": parts[-2][:15]
                             })
             
-            # Limit to 20 drivers
-            drivers = drivers[:20]
-            
         except Exception as e:
             drivers.append({
                 "Module Name": f"Error: {str(e)[:30]}",
@@ -1251,7 +3173,7 @@ def get_system_drivers_extended():
         # For Linux systems
         try:
             if platform.system() == "Linux":
-                output = run_command_with_timeout("lsmod | head -20", 10)
+                output = run_command_with_timeout("lsmod", 10)
                 if output:
                     lines = output.split('\n')
                     for line in lines[1:]:  # Skip header
@@ -1276,7 +3198,7 @@ def get_system_drivers_extended():
                 "Start Mode": "N/A"
             })
     
-    return drivers
+    return page_rows(drivers, "system_drivers")
 
 def get_wifi_networks_extended():
     """Get detailed WiFi network information"""
@@ -1295,10 +3217,11 @@ def get_wifi_networks_extended():
                         if profile_name:
                             profiles.append(profile_name)
                 
-                # Get details for each profile (limited to 5)
-                for profile in profiles[:5]:
+                # Get details for each profile (limited to 5), queried concurrently
+                profile_outputs = run_commands_with_timeout(
+                    [f'netsh wlan show profile name="{profile}"' for profile in profiles[:5]], 10)
+                for profile, profile_output in zip(profiles[:5], profile_outputs):
                     try:
-                        profile_output = run_command_with_timeout(f'netsh wlan show profile name="{profile}"', 10)
                         
                         details = {}
                         if profile_output:
@@ -1371,140 +3294,284 @@ def get_wifi_networks_extended():
 # -------------------------------------------------------------------
 #  STATISTICS AND GRAPH FUNCTIONS
 # -------------------------------------------------------------------
+class SnapshotMemo:
+    """One cached result per scan, reused while the input tables are the same objects"""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self._inputs = None
+        self._value = None
+        self._lock = threading.Lock()
+
+    def get(self, all_data, compute):
+        inputs = tuple(all_data.get(key) for key in self.keys)
+        with self._lock:
+            if self._inputs is not None and all(a is b for a, b in zip(self._inputs, inputs)):
+                return self._value
+        value = compute(all_data)
+        with self._lock:
+            self._inputs, self._value = inputs, value
+        return value
+
+# -------------------------------------------------------------------
+#  HEALTH RULE ENGINE
+# -------------------------------------------------------------------
+# Each rule reads one metric and walks its bands in order: the first
+# (limit, points, severity) whose limit the value exceeds applies. Metrics are
+# either a number or a list of (subject, value) pairs scored one by one, with
+# the rule's total clamped to +/- cap. The bands, weights and +10 bonus are
+# exactly the original calculate_health_score's; metrics without a rule
+# (temperature, process counts) are gathered for the scan history only.
+HealthRule = namedtuple("HealthRule", "name metric bands cap message")
+HealthReport = namedtuple("HealthReport", "score hits")
+
+HEALTH_BASE_SCORE = 85
+HEALTH_RULES = (
+    HealthRule("Memory", "memory_usage", ((90, -20, "CRITICAL"), (80, -10, "WARNING"), (70, -5, "NOTICE")),
+               None, "Memory usage at {value:.1f}%"),
+    HealthRule("Disk", "disk_usage", ((95, -15, "CRITICAL"), (90, -10, "WARNING"), (85, -5, "NOTICE")),
+               None, "Disk {subject} at {value:.1f}%"),
+    HealthRule("Security", "high_risk", ((0, -5, "WARNING"),),
+               None, "High-risk setting: {subject}"),
+    HealthRule("CPU", "cpu_usage", ((90, -15, "CRITICAL"), (80, -10, "WARNING"), (70, -5, "NOTICE")),
+               None, "CPU usage at {value:.1f}%"),
+    HealthRule("Headroom", "headroom", ((0, 10, "OK"),),
+               None, "Memory below 50% and no disk above 90%"),
+)
+
+def gather_health_metrics(all_data):
+    """Typed inputs for HEALTH_RULES (plus history-only metrics), from a single pass over each table"""
+    metrics = {"memory_usage": None, "disk_usage": [], "high_risk": [], "cpu_usage": None,
+               "temperature": [], "zombie_count": None, "high_cpu_processes": None, "headroom": 0}
+
+    for item in all_data.get("hardware_info", []):
+        usage = numeric(item.get("Usage"))
+        if usage is None:
+            continue
+        if item.get("Category") == "MEMORY":
+            metrics["memory_usage"] = usage
+        elif item.get("Category") == "DISK":
+            metrics["disk_usage"].append((item.get("Device", "Unknown"), usage))
+
+    for item in all_data.get("security_audit", []):
+        if item.get("Risk") == RiskLevel.HIGH:
+            metrics["high_risk"].append((item.get("Security Feature", "Unknown"), 1))
+
+    # CPU - the same "CPU Usage" figure the report shows (the sampler mean when it runs)
+    for item in all_data.get("performance_metrics", []):
+        if item.get("Metric") == "CPU Usage" and numeric(item.get("Value")) is not None:
+            metrics["cpu_usage"] = numeric(item.get("Value"))
+
+    for item in all_data.get("hardware_temps", []):
+        current = numeric(item.get("Current"))
+        if current is not None:
+            metrics["temperature"].append((f"{item.get('Sensor')}/{item.get('Label')}", current))
+
+    # Process health from the scan's process snapshot
+    processes = get_process_records(all_data)
+    if processes:
+        zombies = high_cpu = 0
+        for p in processes:
+            if p.get("status") == psutil.STATUS_ZOMBIE:
+                zombies += 1
+            if (p.get("cpu_percent") or 0) > 50:
+                high_cpu += 1
+        metrics["zombie_count"] = zombies
+        metrics["high_cpu_processes"] = high_cpu
+
+    # Bonus for good conditions: memory under half full and no disk above 90%
+    disk_values = [usage for _, usage in metrics["disk_usage"]]
+    if metrics["memory_usage"] is not None and metrics["memory_usage"] < 50 and disk_values \
+            and max(disk_values) <= 90:
+        metrics["headroom"] = 1
+    return metrics
+
+def evaluate_health_rules(metrics, rules=HEALTH_RULES, base_score=HEALTH_BASE_SCORE):
+    """Score plus the list of rule hits for one set of health metrics"""
+    score = base_score
+    hits = []
+    for rule in rules:
+        value = metrics.get(rule.metric)
+        if value is None:
+            continue
+        total = 0
+        for subject, item_value in (value if isinstance(value, list) else [(None, value)]):
+            for limit, points, severity in rule.bands:
+                if item_value > limit:
+                    total += points
+                    hits.append({
+                        "Rule": rule.name,
+                        "Severity": severity,
+                        "Points": f"{points:+d}",
+                        "Finding": rule.message.format(subject=subject, value=item_value)
+                    })
+                    break
+        if rule.cap is not None:
+            total = max(-rule.cap, min(rule.cap, total))
+        score += total
+    return HealthReport(max(0, min(100, score)), hits)
+
+health_memo = SnapshotMemo(("hardware_info", "security_audit", "performance_metrics",
+                            "hardware_temps", "process_snapshot", "process_info"))
+
+def evaluate_health(all_data):
+    """HealthReport for a scan (memoized per scan snapshot)"""
+    def compute(data):
+        try:
+            return evaluate_health_rules(gather_health_metrics(data))
+        except Exception:
+            return HealthReport(HEALTH_BASE_SCORE, [])  # Default if calculation fails
+    return health_memo.get(all_data, compute)
+
 def calculate_health_score(all_data):
     """Calculate system health score based on collected data"""
-    score = 85  # Base score
-    
-    try:
-        # Check memory usage
-        for item in all_data.get("hardware_info", []):
-            if item.get("Category") == "MEMORY" and "Usage" in item:
-                usage_str = item["Usage"]
-                if "%" in usage_str:
-                    try:
-                        usage = float(usage_str.replace("%", "").strip())
-                        if usage > 90:
-                            score -= 20
-                        elif usage > 80:
-                            score -= 10
-                        elif usage > 70:
-                            score -= 5
-                    except:
-                        pass
-        
-        # Check disk usage
-        for item in all_data.get("hardware_info", []):
-            if item.get("Category") == "DISK" and "Usage" in item:
-                usage_str = item["Usage"]
-                if "%" in usage_str:
-                    try:
-                        usage = float(usage_str.replace("%", "").strip())
-                        if usage > 95:
-                            score -= 15
-                        elif usage > 90:
-                            score -= 10
-                        elif usage > 85:
-                            score -= 5
-                    except:
-                        pass
-        
-        # Check security
-        for item in all_data.get("security_audit", []):
-            if item.get("Risk") == "High":
-                score -= 5
-        
-        # Check CPU usage from performance metrics
-        for item in all_data.get("performance_metrics", []):
-            if item.get("Metric") == "CPU Usage":
-                value_str = item.get("Value", "0%")
-                if "%" in value_str:
-                    try:
-                        cpu_usage = float(value_str.replace("%", ""))
-                        if cpu_usage > 90:
-                            score -= 15
-                        elif cpu_usage > 80:
-                            score -= 10
-                        elif cpu_usage > 70:
-                            score -= 5
-                    except:
-                        pass
-        
-        # Bonus for good conditions
-        # Check if memory usage is low
-        memory_ok = False
-        for item in all_data.get("hardware_info", []):
-            if item.get("Category") == "MEMORY" and "Usage" in item:
-                usage_str = item["Usage"]
-                if "%" in usage_str:
-                    try:
-                        if float(usage_str.replace("%", "")) < 50:
-                            memory_ok = True
-                    except:
-                        pass
-        
-        # Check if disk usage is reasonable
-        disk_ok = True
-        disk_count = 0
-        for item in all_data.get("hardware_info", []):
-            if item.get("Category") == "DISK" and "Usage" in item:
-                usage_str = item["Usage"]
-                if "%" in usage_str:
-                    try:
-                        if float(usage_str.replace("%", "")) > 90:
-                            disk_ok = False
-                        disk_count += 1
-                    except:
-                        pass
-        
-        if memory_ok and disk_ok and disk_count > 0:
-            score += 10
-        
-        # Ensure score is within bounds
-        score = max(0, min(100, score))
-        
-    except:
-        score = 85  # Default if calculation fails
-    
-    return score
+    return evaluate_health(all_data).score
+
+class ProcessColumns:
+    """Process table as parallel typed columns, built in one pass over the records.
+
+    cpu/memory/rss are array('d') columns; status and user are small integer
+    codes into the status/user name lists, which is what the group-bys run on.
+    """
+
+    def __init__(self, processes):
+        self.cpu = array('d')
+        self.memory = array('d')
+        self.rss = array('d')
+        self.status_codes = array('l')
+        self.user_codes = array('l')
+        self.statuses = []
+        self.users = []
+        status_index = {}
+        user_index = {}
+        for p in processes:
+            if type(p) is ProcessRecord:
+                cpu, memory, rss, status, user = p.cpu_percent, p.memory_percent, p.rss, p.status, p.username
+            else:
+                cpu, memory, rss = p.get("cpu_percent"), p.get("memory_percent"), p.get("rss")
+                status, user = p.get("status"), p.get("username")
+            self.cpu.append(cpu or 0.0)
+            self.memory.append(memory or 0.0)
+            self.rss.append(rss or 0.0)
+            status = status or "UNKNOWN"
+            code = status_index.get(status)
+            if code is None:
+                code = status_index[status] = len(self.statuses)
+                self.statuses.append(status)
+            self.status_codes.append(code)
+            user = user or "SYSTEM"
+            code = user_index.get(user)
+            if code is None:
+                code = user_index[user] = len(self.users)
+                self.users.append(user)
+            self.user_codes.append(code)
+
+    def __len__(self):
+        return len(self.cpu)
+
+def _percentile_sorted(values, percent):
+    """Linear-interpolated percentile of an already sorted sequence (NumPy's default method)"""
+    if not values:
+        return 0.0
+    rank = (len(values) - 1) * percent / 100.0
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+def _column_summary_numpy(column, percentiles):
+    values = np.frombuffer(column, dtype=np.float64)
+    points = np.percentile(values, percentiles)
+    return {
+        "mean": float(values.mean()),
+        "max": float(values.max()),
+        "percentiles": {p: float(v) for p, v in zip(percentiles, points)}
+    }
+
+def _column_summary_array(column, percentiles):
+    ordered = sorted(column)
+    return {
+        "mean": math.fsum(ordered) / len(ordered),
+        "max": ordered[-1],
+        "percentiles": {p: _percentile_sorted(ordered, p) for p in percentiles}
+    }
+
+def _group_by(columns, codes, names, use_numpy):
+    """{name: {"count", "cpu", "memory", "rss"}} totals per status/user code"""
+    groups = len(names)
+    if use_numpy:
+        index = np.frombuffer(codes, dtype=np.int64 if codes.itemsize == 8 else np.int32)
+        counts = np.bincount(index, minlength=groups)
+        cpu = np.bincount(index, weights=np.frombuffer(columns.cpu, dtype=np.float64), minlength=groups)
+        memory = np.bincount(index, weights=np.frombuffer(columns.memory, dtype=np.float64), minlength=groups)
+        rss = np.bincount(index, weights=np.frombuffer(columns.rss, dtype=np.float64), minlength=groups)
+        totals = zip(counts.tolist(), cpu.tolist(), memory.tolist(), rss.tolist())
+    else:
+        counts, cpu, memory, rss = [0] * groups, [0.0] * groups, [0.0] * groups, [0.0] * groups
+        for code, c, m, r in zip(codes, columns.cpu, columns.memory, columns.rss):
+            counts[code] += 1
+            cpu[code] += c
+            memory[code] += m
+            rss[code] += r
+        totals = zip(counts, cpu, memory, rss)
+    return {name: {"count": count, "cpu": c, "memory": m, "rss": r}
+            for name, (count, c, m, r) in zip(names, totals)}
+
+def _cpu_histogram(column, bins, use_numpy):
+    """Counts of processes per equal-width CPU % bin over 0-100 (the last bin takes anything above)"""
+    if use_numpy:
+        values = np.clip(np.frombuffer(column, dtype=np.float64), 0, 100)
+        counts, _ = np.histogram(values, bins=bins, range=(0, 100))
+        counts = counts.tolist()
+    else:
+        counts = [0] * bins
+        width = 100.0 / bins
+        for value in column:
+            counts[min(bins - 1, max(0, int(value // width)))] += 1
+    width = 100 / bins
+    return [(f"{i * width:g}-{(i + 1) * width:g}%", count) for i, count in enumerate(counts)]
+
+def compute_process_statistics(processes, use_numpy=None):
+    """Means, percentiles, CPU histogram and per-status/per-user totals for a process table"""
+    use_numpy = (Config.STATS_USE_NUMPY and NUMPY_AVAILABLE) if use_numpy is None else use_numpy
+    columns = processes if isinstance(processes, ProcessColumns) else ProcessColumns(processes)
+    if not len(columns):
+        return {}
+
+    summarize = _column_summary_numpy if use_numpy else _column_summary_array
+    percentiles = list(Config.STATS_PERCENTILES)
+    cpu = summarize(columns.cpu, percentiles)
+    memory = summarize(columns.memory, percentiles)
+    by_status = _group_by(columns, columns.status_codes, columns.statuses, use_numpy)
+    return {
+        "process_count": len(columns),
+        "avg_cpu_usage": cpu["mean"],
+        "max_cpu_usage": cpu["max"],
+        "cpu_percentiles": cpu["percentiles"],
+        "avg_memory_usage": memory["mean"],
+        "max_memory_usage": memory["max"],
+        "memory_percentiles": memory["percentiles"],
+        "total_rss": sum(group["rss"] for group in by_status.values()),
+        "cpu_histogram": _cpu_histogram(columns.cpu, Config.STATS_HISTOGRAM_BINS, use_numpy),
+        "process_status_dist": {status: group["count"] for status, group in by_status.items()},
+        "process_by_status": by_status,
+        "process_by_user": _group_by(columns, columns.user_codes, columns.users, use_numpy)
+    }
+
+statistics_memo = SnapshotMemo(("process_snapshot", "process_info", "hardware_info", "network_info",
+                                "installed_software", "system_services", "user_accounts", "table_pages"))
 
 def calculate_system_statistics(all_data):
-    """Calculate comprehensive system statistics"""
+    """Calculate comprehensive system statistics (memoized per scan snapshot)"""
+    return statistics_memo.get(all_data, _calculate_system_statistics)
+
+def _calculate_system_statistics(all_data):
     stats = {}
     
-    # Process statistics
-    processes = all_data.get("process_info", [])
+    # Process statistics (whole snapshot, not just the displayed table)
+    processes = get_process_records(all_data)
     if processes:
         try:
-            cpu_usages = []
-            memory_usages = []
-            for p in processes:
-                if "CPU %" in p:
-                    try:
-                        cpu_usages.append(float(p["CPU %"].replace("%", "")))
-                    except:
-                        pass
-                if "Memory %" in p:
-                    try:
-                        memory_usages.append(float(p["Memory %"].replace("%", "")))
-                    except:
-                        pass
-            
-            if cpu_usages:
-                stats["process_count"] = len(processes)
-                stats["avg_cpu_usage"] = statistics.mean(cpu_usages) if cpu_usages else 0
-                stats["max_cpu_usage"] = max(cpu_usages) if cpu_usages else 0
-            
-            if memory_usages:
-                stats["avg_memory_usage"] = statistics.mean(memory_usages) if memory_usages else 0
-                stats["max_memory_usage"] = max(memory_usages) if memory_usages else 0
-            
-            # Process status distribution
-            status_counts = {}
-            for p in processes:
-                status = p.get("Status", "UNKNOWN")
-                status_counts[status] = status_counts.get(status, 0) + 1
-            stats["process_status_dist"] = status_counts
-            
+            stats.update(compute_process_statistics(processes))
         except:
             pass
     
@@ -1513,33 +3580,22 @@ def calculate_system_statistics(all_data):
     if hardware:
         try:
             # Disk statistics
-            disks = [h for h in hardware if h.get("Category") == "DISK"]
-            if disks:
-                disk_usages = []
-                for disk in disks:
-                    usage_str = disk.get("Usage", "0%")
-                    if "%" in usage_str:
-                        try:
-                            usage = float(usage_str.replace("%", ""))
-                            disk_usages.append(usage)
-                        except:
-                            pass
-                
-                if disk_usages:
-                    stats["avg_disk_usage"] = statistics.mean(disk_usages)
-                    stats["max_disk_usage"] = max(disk_usages)
-                    stats["disk_count"] = len(disks)
+            disk_usages = array('d')
+            disk_count = 0
+            for item in hardware:
+                category = item.get("Category")
+                usage = numeric(item.get("Usage"))
+                if category == "DISK":
+                    disk_count += 1
+                    if usage is not None:
+                        disk_usages.append(usage)
+                elif category == "MEMORY" and usage is not None and "memory_usage" not in stats:
+                    stats["memory_usage"] = usage
             
-            # Memory statistics
-            memory = [h for h in hardware if h.get("Category") == "MEMORY"]
-            if memory:
-                mem = memory[0]
-                usage_str = mem.get("Usage", "0%")
-                if "%" in usage_str:
-                    try:
-                        stats["memory_usage"] = float(usage_str.replace("%", ""))
-                    except:
-                        pass
+            if disk_usages:
+                stats["avg_disk_usage"] = math.fsum(disk_usages) / len(disk_usages)
+                stats["max_disk_usage"] = max(disk_usages)
+                stats["disk_count"] = disk_count
         except:
             pass
     
@@ -1547,16 +3603,26 @@ def calculate_system_statistics(all_data):
     network = all_data.get("network_info", [])
     if network:
         try:
-            active_interfaces = len([n for n in network if n.get("Status") == "UP"])
+            active_interfaces = 0
+            bytes_sent = bytes_recv = 0
+            for n in network:
+                if n.get("Status") == LinkState.UP:
+                    active_interfaces += 1
+                bytes_sent += numeric(n.get("Bytes Sent"), 0)
+                bytes_recv += numeric(n.get("Bytes Recv"), 0)
             stats["active_network_interfaces"] = active_interfaces
             stats["total_network_interfaces"] = len(network)
+            stats["network_bytes_sent"] = bytes_sent
+            stats["network_bytes_recv"] = bytes_recv
         except:
             pass
     
     # Software statistics
     software = all_data.get("installed_software", [])
     if software:
-        stats["installed_software_count"] = len(software)
+        # The table may hold one page; count the whole inventory
+        page = all_data.get("table_pages", {}).get("installed_software")
+        stats["installed_software_count"] = page["total"] if page else len(software)
     
     # Service statistics
     services = all_data.get("system_services", [])
@@ -1589,15 +3655,20 @@ def generate_statistics_summary(all_data):
     
     # Performance Statistics
     if "avg_cpu_usage" in stats:
-        summary.append({"Category": "PERFORMANCE", "Metric": "Avg CPU Usage", "Value": f"{stats['avg_cpu_usage']:.1f}%"})
+        summary.append({"Category": "PERFORMANCE", "Metric": "Avg CPU Usage", "Value": Percent(stats['avg_cpu_usage'])})
     if "max_cpu_usage" in stats:
-        summary.append({"Category": "PERFORMANCE", "Metric": "Max CPU Usage", "Value": f"{stats['max_cpu_usage']:.1f}%"})
+        summary.append({"Category": "PERFORMANCE", "Metric": "Max CPU Usage", "Value": Percent(stats['max_cpu_usage'])})
+    if "cpu_percentiles" in stats and 95 in stats["cpu_percentiles"]:
+        summary.append({"Category": "PERFORMANCE", "Metric": "Process CPU p95", "Value": Percent(stats['cpu_percentiles'][95])})
+    if stats.get("process_by_user"):
+        user, totals = max(stats["process_by_user"].items(), key=lambda item: item[1]["rss"])
+        summary.append({"Category": "PERFORMANCE", "Metric": "Top Memory User", "Value": f"{user} ({format_bytes(totals['rss'])})"})
     if "avg_memory_usage" in stats:
-        summary.append({"Category": "PERFORMANCE", "Metric": "Avg Memory Usage", "Value": f"{stats['avg_memory_usage']:.2f}%"})
+        summary.append({"Category": "PERFORMANCE", "Metric": "Avg Memory Usage", "Value": Percent(stats['avg_memory_usage'])})
     if "memory_usage" in stats:
-        summary.append({"Category": "PERFORMANCE", "Metric": "Current Memory Usage", "Value": f"{stats['memory_usage']:.1f}%"})
+        summary.append({"Category": "PERFORMANCE", "Metric": "Current Memory Usage", "Value": Percent(stats['memory_usage'])})
     if "avg_disk_usage" in stats:
-        summary.append({"Category": "PERFORMANCE", "Metric": "Avg Disk Usage", "Value": f"{stats['avg_disk_usage']:.1f}%"})
+        summary.append({"Category": "PERFORMANCE", "Metric": "Avg Disk Usage", "Value": Percent(stats['avg_disk_usage'])})
     
     # Network Statistics
     if "active_network_interfaces" in stats:
@@ -1611,11 +3682,11 @@ def generate_statistics_summary(all_data):
     summary.append({"Category": "HEALTH", "Metric": "System Health Score", "Value": f"{health_score}/100"})
     
     # Add risk assessment
-    risk_level = "LOW"
+    risk_level = RiskLevel.LOW
     if health_score < 60:
-        risk_level = "HIGH"
+        risk_level = RiskLevel.HIGH
     elif health_score < 80:
-        risk_level = "MEDIUM"
+        risk_level = RiskLevel.MEDIUM
     summary.append({"Category": "HEALTH", "Metric": "Risk Level", "Value": risk_level})
     
     return summary
@@ -1693,15 +3764,12 @@ def generate_cpu_usage_graph(processes):
     
     # Get top 8 processes by CPU usage
     try:
-        top_processes = sorted(processes, 
-                              key=lambda x: float(x.get("CPU %", "0").replace("%", "")), 
-                              reverse=True)[:8]
+        top_processes = heapq.nlargest(8, processes, key=lambda x: x.get("cpu_percent") or 0.0)
         
         graph_data = {}
         for proc in top_processes:
-            name = proc.get("Name", "Unknown")
-            cpu_usage = float(proc.get("CPU %", "0").replace("%", ""))
-            graph_data[name[:20]] = cpu_usage
+            name = proc.get("name") or "Unknown"
+            graph_data[name[:20]] = round(proc.get("cpu_percent") or 0.0, 2)
         
         return generate_bar_graph(graph_data, "Top Processes by CPU Usage", width=40)
     except:
@@ -1714,15 +3782,12 @@ def generate_memory_usage_graph(processes):
     
     # Get top 8 processes by memory usage
     try:
-        top_processes = sorted(processes, 
-                              key=lambda x: float(x.get("Memory %", "0").replace("%", "")), 
-                              reverse=True)[:8]
+        top_processes = heapq.nlargest(8, processes, key=lambda x: x.get("memory_percent") or 0.0)
         
         graph_data = {}
         for proc in top_processes:
-            name = proc.get("Name", "Unknown")
-            mem_usage = float(proc.get("Memory %", "0").replace("%", ""))
-            graph_data[name[:20]] = mem_usage
+            name = proc.get("name") or "Unknown"
+            graph_data[name[:20]] = round(proc.get("memory_percent") or 0.0, 3)
         
         return generate_bar_graph(graph_data, "Top Processes by Memory Usage", width=40)
     except:
@@ -1740,13 +3805,9 @@ def generate_disk_usage_graph(hardware_info):
     graph_data = {}
     for disk in disks:
         device = disk.get("Device", "Unknown")
-        usage_str = disk.get("Usage", "0%")
-        if "%" in usage_str:
-            try:
-                usage = float(usage_str.replace("%", ""))
-                graph_data[device[-20:]] = usage
-            except:
-                pass
+        usage = numeric(disk.get("Usage"))
+        if usage is not None:
+            graph_data[device[-20:]] = usage
     
     if graph_data:
         return generate_bar_graph(graph_data, "Disk Usage by Device", width=40)
@@ -1775,9 +3836,9 @@ def generate_network_activity_graph(network_info):
     graph_data = {}
     for iface in interfaces[:6]:  # Limit to 6 interfaces
         name = iface.get("Interface", "Unknown")
-        status = iface.get("Status", "DOWN")
+        status = iface.get("Status", LinkState.DOWN)
         # Convert status to numeric for graphing
-        value = 100 if status == "UP" else 10
+        value = 100 if status == LinkState.UP else 10
         graph_data[name[:15]] = value
     
     if graph_data:
@@ -1826,7 +3887,7 @@ def get_system_graphs(all_data):
     graphs = []
     
     # Process graphs
-    processes = all_data.get("process_info", [])
+    processes = get_process_records(all_data)
     if processes:
         cpu_graph = generate_cpu_usage_graph(processes)
         if cpu_graph:
@@ -1871,72 +3932,238 @@ def get_health_color(score):
 # -------------------------------------------------------------------
 #  HTML GENERATION FUNCTIONS
 # -------------------------------------------------------------------
-def generate_section_html(section_name, data):
-    """Generate HTML for a specific section"""
+# Report assets are embedded so the page renders without any network access
+REPORT_ICON = ("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 16 16'%3E"
+               "%3Crect width='16' height='16' rx='2' fill='%23000'/%3E"
+               "%3Cpath d='M3 4l4 4-4 4M8 12h5' stroke='%230f0' stroke-width='2' fill='none'/%3E%3C/svg%3E")
+
+# Attribute values and CSS a browser would fetch: src/href/url()/@import pointing off the page
+REMOTE_REFERENCE_RE = re.compile(
+    r"""(?:\b(?:src|href|action|poster|data)\s*=\s*["']?|url\(\s*["']?|@import\s+(?:url\(\s*)?["']?)"""
+    r"""((?:[a-z][a-z0-9+.-]*:)?//[^"')\s>]+)""", re.IGNORECASE)
+
+def remote_references(html):
+    """Sorted distinct URLs in html that a browser would try to load over the network"""
+    return sorted(set(REMOTE_REFERENCE_RE.findall(html)))
+
+# Report sections in page order: all_data key -> title
+REPORT_SECTIONS = OrderedDict([
+    ("system_info", "SYSTEM OVERVIEW"),
+    ("hardware_info", "HARDWARE INFORMATION"),
+    ("process_info", "RUNNING PROCESSES"),
+    ("network_info", "NETWORK ANALYSIS"),
+    ("security_audit", "SECURITY AUDIT"),
+    ("installed_software", "INSTALLED SOFTWARE"),
+    ("system_services", "SYSTEM SERVICES"),
+    ("startup_programs", "STARTUP PROGRAMS"),
+    ("environment_vars", "ENVIRONMENT VARIABLES"),
+    ("hardware_temps", "HARDWARE TEMPERATURES"),
+    ("system_logs", "SYSTEM LOGS"),
+    ("performance_metrics", "PERFORMANCE METRICS"),
+    ("user_accounts", "USER ACCOUNTS"),
+    ("system_drivers", "SYSTEM DRIVERS"),
+    ("wifi_networks", "WIFI NETWORKS"),
+    ("collection_status", "COLLECTION STATUS"),
+])
+
+def report_section_title(all_data, data_key):
+    """Section title, with the row range when the table was paged"""
+    title = REPORT_SECTIONS[data_key]
+    page = all_data.get("table_pages", {}).get(data_key)
+    if page:
+        title += f" (ROWS {page['first']}-{page['last']} OF {page['total']})"
+    return title
+
+# Index = code used for status cells in virtualized tables' embedded JSON
+STATUS_CLASSES = ("", "status-active", "status-critical", "status-warning")
+STATUS_CLASS_CODES = {name: code for code, name in enumerate(STATUS_CLASSES)}
+
+def status_class(cell):
+    """CSS class for a status/state/risk cell's text, or ''"""
+    cell_lower = cell.lower()
+    if any(good_word in cell_lower for good_word in ['active', 'enabled', 'yes', 'true', 'running', 'low']):
+        return "status-active"
+    if any(bad_word in cell_lower for bad_word in ['inactive', 'disabled', 'no', 'false', 'stopped', 'high', 'critical']):
+        return "status-critical"
+    if 'warning' in cell_lower or 'medium' in cell_lower:
+        return "status-warning"
+    return ""
+
+def _script_json(value):
+    """Compact JSON that is safe inside a <script> element"""
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).replace("<", "\\u003c")
+
+class ReportPayload:
+    """Compact-mode report data: table JSON deflated as it is produced, plus the page body, CSS and JS"""
+    
+    def __init__(self):
+        self.body = []  # page markup, small once the tables are in the payload
+        self._compressor = zlib.compressobj(9)
+        self._chunks = []
+        self._pending = []
+        self._pending_size = 0
+        self.tables = 0
+        self.write('{"tables":[')
+    
+    def write(self, text):
+        # Batch small writes; deflate is far faster fed in large blocks
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= Config.HTML_WRITE_BUFFER:
+            self._deflate_pending()
+    
+    def _deflate_pending(self):
+        self._chunks.append(self._compressor.compress(''.join(self._pending).encode('utf-8')))
+        self._pending = []
+        self._pending_size = 0
+    
+    def start_table(self):
+        """Index of a new table; its JSON object follows through write()"""
+        if self.tables:
+            self.write(',')
+        self.tables += 1
+        return self.tables - 1
+    
+    def finish(self, style, script):
+        """Close the payload and return it as base64 text"""
+        self.write('],"body":' + json.dumps(''.join(self.body)) + ',"style":' + json.dumps(style)
+                   + ',"script":' + json.dumps(script) + '}')
+        self._deflate_pending()
+        self._chunks.append(self._compressor.flush())
+        return base64.b64encode(b''.join(self._chunks)).decode('ascii')
+
+def _sort_key(value):
+    """JSON sort key for a cell: its finite number (int when whole), else None"""
+    key = numeric(value)
+    if key is None or not math.isfinite(key):
+        return None
+    return int(key) if float(key).is_integer() else key
+
+def write_virtual_table(write, headers, status_columns, data, payload=None):
+    """Write a table as JSON rows plus numeric sort keys, inline or into payload; the page renders it virtually
+
+    Inline tables stream one JSON array per row. Payload tables are written column by column,
+    which deflates much better since neighbouring values are alike.
+    """
+    keys = [[] for _ in headers]
+    # Columns whose keys are just their integer text need no key array; natural sort handles them
+    text_keyed = [True] * len(headers)
+    columns = [[] for _ in headers] if payload else None
+    classes = {index: [] for index, header in enumerate(headers) if header in status_columns}
+    
+    write('<div class="virtual-table"' + (f' data-payload="{payload.start_table()}">' if payload else '>'))
+    write(f'<div class="vt-toolbar"><input class="vt-filter" type="search" placeholder="> FILTER {len(data):,} ROWS">'
+          '<span class="vt-count"></span></div>')
+    write('<div class="scroll-container vt-viewport"><table class="vt-table">')
+    write('<thead><tr>' + ''.join(f'<th>{header}</th>' for header in headers) + '</tr></thead>')
+    write('<tbody></tbody></table></div>')
+    if not payload:
+        write('<script type="application/json" class="vt-data">{"rows":[')
+    for row_index, row in enumerate(data):
+        cells = []
+        for index, header in enumerate(headers):
+            value = row.get(header, '')
+            cell = str(value)
+            cells.append(cell)
+            sort_key = _sort_key(value)
+            keys[index].append(sort_key)
+            if text_keyed[index] and sort_key is not None and (type(sort_key) is not int or cell != str(sort_key)):
+                text_keyed[index] = False
+            if index in classes:
+                classes[index].append(STATUS_CLASS_CODES[status_class(cell)])
+        if payload:
+            for column, cell in zip(columns, cells):
+                column.append(cell)
+        else:
+            write((',' if row_index else '') + _script_json(cells))
+    
+    # Sort keys only for columns that need them, one array per column
+    numeric_keys = {index: column for index, column in enumerate(keys)
+                    if not text_keyed[index] and any(key is not None for key in column)}
+    tail = '"keys":' + _script_json(numeric_keys) + ',"classes":' + _script_json(classes) + '}'
+    if payload:
+        payload.write('{"columns":[' + ','.join(_script_json(column) for column in columns) + '],' + tail)
+        write('</div>')
+    else:
+        write('],' + tail + '</script></div>')
+
+def write_section_html(write, section_name, data, payload=None):
+    """Write one report section through write(), a row at a time; tables go into payload if given"""
     if not data:
-        return f"""
+        write(f"""
         <div class="section">
             <h2>> {section_name}</h2>
             <p style="color: #006600; text-align: center; padding: 20px;">> NO DATA AVAILABLE</p>
         </div>
-        """
+        """)
+        return
     
-    html = f"""
+    write(f"""
     <div class="section">
         <h2>> {section_name}</h2>
-    """
+    """)
     
     if isinstance(data, list) and len(data) > 0:
         # Determine if it's a key-value list or table data
         if isinstance(data[0], list) and len(data[0]) == 2:
             # Key-value format (for system_info)
-            html += '<table>'
+            write('<table>')
             for item in data:
                 if len(item) == 2:
                     key, value = item
-                    html += f'''
+                    write(f'''
                     <tr>
                         <td style="width: 30%;"><span style="color: #00ff00;">></span> {key}</td>
                         <td style="width: 70%;">{value}</td>
                     </tr>
-                    '''
-            html += '</table>'
+                    ''')
+            write('</table>')
         elif isinstance(data[0], dict):
             # Table format
-            if data:
-                headers = list(data[0].keys())
-                html += '<div class="scroll-container"><table>'
-                html += '<thead><tr>' + ''.join(f'<th>{header}</th>' for header in headers) + '</tr></thead>'
-                html += '<tbody>'
-                
-                for row in data:
-                    html += '<tr>'
-                    for header in headers:
-                        cell = str(row.get(header, ''))
-                        cell_class = ""
-                        
-                        # Apply status classes
-                        cell_lower = cell.lower()
-                        header_lower = header.lower()
-                        
-                        if any(status_word in header_lower for status_word in ['status', 'state', 'active', 'enabled', 'risk']):
-                            if any(good_word in cell_lower for good_word in ['active', 'enabled', 'yes', 'true', 'running', 'low']):
-                                cell_class = "status-active"
-                            elif any(bad_word in cell_lower for bad_word in ['inactive', 'disabled', 'no', 'false', 'stopped', 'high', 'critical']):
-                                cell_class = "status-critical"
-                            elif 'warning' in cell_lower or 'medium' in cell_lower:
-                                cell_class = "status-warning"
-                        
-                        if cell_class:
-                            html += f'<td class="{cell_class}">{cell}</td>'
-                        else:
-                            html += f'<td>{cell}</td>'
-                    html += '</tr>'
-                
-                html += '</tbody></table></div>'
+            headers = list(data[0].keys())
+            # Status colouring only applies to these columns; decide once per table
+            status_columns = {header for header in headers
+                              if any(status_word in header.lower()
+                                     for status_word in ['status', 'state', 'active', 'enabled', 'risk'])}
+            if payload or len(data) > Config.HTML_VIRTUAL_ROWS:
+                write_virtual_table(write, headers, status_columns, data, payload)
+                write('</div>')
+                return
+            
+            write('<div class="scroll-container"><table>')
+            write('<thead><tr>' + ''.join(f'<th>{header}</th>' for header in headers) + '</tr></thead>')
+            write('<tbody>')
+            
+            for row in data:
+                cells = ['<tr>']
+                for header in headers:
+                    value = row.get(header, '')
+                    cell = str(value)
+                    cell_class = ""
+                    # Typed numbers sort on their raw value, not the formatted text
+                    sort_key = numeric(value)
+                    sort_attr = f' data-sort="{sort_key!r}"' if sort_key is not None else ""
+                    
+                    # Apply status classes
+                    if header in status_columns:
+                        cell_class = status_class(cell)
+                    
+                    if cell_class:
+                        cells.append(f'<td class="{cell_class}"{sort_attr}>{cell}</td>')
+                    else:
+                        cells.append(f'<td{sort_attr}>{cell}</td>')
+                cells.append('</tr>')
+                write(''.join(cells))
+            
+            write('</tbody></table></div>')
     
-    html += '</div>'
-    return html
+    write('</div>')
+
+def generate_section_html(section_name, data, payload=None):
+    """Generate HTML for a specific section"""
+    parts = []
+    write_section_html(parts.append, section_name, data, payload)
+    return ''.join(parts)
 
 def generate_statistics_html(stats_data, health_score):
     """Generate HTML for statistics dashboard"""
@@ -1972,21 +4199,16 @@ def generate_statistics_html(stats_data, health_score):
             value = stat.get("Value", "")
             
             # Determine color based on value
-            value_str = str(value)
             value_color = "#00ff00"  # Default green
             
-            if "%" in value_str:
-                try:
-                    num_value = float(value_str.replace("%", ""))
-                    if "Usage" in metric or "CPU" in metric or "Memory" in metric:
-                        if num_value < 60:
-                            value_color = "#00ff00"  # Green
-                        elif num_value < 80:
-                            value_color = "#ffff00"  # Yellow
-                        else:
-                            value_color = "#ff0000"  # Red
-                except:
-                    pass
+            if isinstance(value, Percent):
+                if "Usage" in metric or "CPU" in metric or "Memory" in metric:
+                    if value < 60:
+                        value_color = "#00ff00"  # Green
+                    elif value < 80:
+                        value_color = "#ffff00"  # Yellow
+                    else:
+                        value_color = "#ff0000"  # Red
             
             html += f"""
             <div class="stat-card">
@@ -2033,13 +4255,21 @@ def generate_graphs_html(graphs_data):
     
     return html
 
-def generate_html_with_graphs(all_data, health_score, timestamp):
-    """Generate HTML content with graphs"""
+def write_html_report(out, all_data, health_score, timestamp, compact=None):
+    """Stream the full HTML report with graphs to the text file out, section by section"""
+    write = out.write
+    if compact is None:
+        compact = Config.HTML_COMPACT
+    payload = ReportPayload() if compact else None
     
     health_color = get_health_color(health_score)
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    hostname = socket.gethostname() if hasattr(socket, 'gethostname') else "Unknown"
-    platform_info = platform.platform() if hasattr(platform, 'platform') else "Unknown"
+    # Scan details come from the snapshot so a re-rendered report shows the original scan
+    meta = all_data.get("scan_meta") or scan_metadata()
+    current_time = meta["started"]
+    completed_time = meta.get("finished", current_time)
+    hostname = meta["hostname"]
+    platform_info = meta["platform"]
+    scan_user = meta["user"]
     
     # Get statistics and graphs
     stats_data = get_comprehensive_statistics(all_data)
@@ -2048,14 +4278,20 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
     # Generate graphs HTML
     graphs_html = generate_graphs_html(graphs_data)
     stats_html = generate_statistics_html(stats_data, health_score)
+    health_hits = evaluate_health(all_data).hits or [
+        {"Rule": "All", "Severity": "OK", "Points": "+0", "Finding": "No health rule triggered"}]
+    findings_html = generate_section_html("HEALTH FINDINGS", health_hits, payload)
     
-    html = f"""<!DOCTYPE html>
+    write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <link rel="icon" type="image/svg+xml" href="{REPORT_ICON}">
     <title>System Intelligence Report with Analytics</title>
-    <style>
+""")
+    
+    style = f"""
         * {{
             margin: 0;
             padding: 0;
@@ -2298,12 +4534,64 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
             text-shadow: 0 0 3px #ff0000;
         }}
 
-        .scroll-container {{
-            overflow-x: auto;
-            margin: 15px 0;
-            border: 1px solid #003300;
-            padding: 5px;
-            background: rgba(0, 5, 0, 0.5);
+        .scroll-container {{
+            overflow-x: auto;
+            margin: 15px 0;
+            border: 1px solid #003300;
+            padding: 5px;
+            background: rgba(0, 5, 0, 0.5);
+        }}
+
+        .vt-toolbar {{
+            display: flex;
+            align-items: center;
+            gap: 15px;
+            margin-top: 15px;
+        }}
+
+        .vt-filter {{
+            background: rgba(0, 5, 0, 0.8);
+            border: 1px solid #003300;
+            color: #00ff00;
+            font-family: inherit;
+            padding: 6px 10px;
+            width: 320px;
+        }}
+
+        .vt-count {{
+            color: #006600;
+            font-size: 0.8em;
+        }}
+
+        .vt-viewport {{
+            max-height: 600px;
+            overflow-y: auto;
+        }}
+
+        .vt-table {{
+            margin-top: 0;
+        }}
+
+        .vt-table th {{
+            position: sticky;
+            top: 0;
+        }}
+
+        .vt-table td {{
+            white-space: nowrap;
+        }}
+
+        .vt-table tr:nth-child(even) {{
+            background: none;
+        }}
+
+        .vt-table tr.vt-alt {{
+            background: rgba(0, 15, 0, 0.3);
+        }}
+
+        .vt-table tr.vt-spacer td {{
+            padding: 0;
+            border: 0;
         }}
 
         .footer {{
@@ -2379,10 +4667,17 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
             background: {health_color};
             transition: width 0.5s ease;
         }}
-    </style>
-</head>
+"""
+    if not payload:
+        write(f"    <style>{style}    </style>\n")
+    
+    write("""</head>
 <body>
-    <div class="matrix-bg"></div>
+""")
+    if payload:
+        page_write, write = write, payload.body.append
+    
+    write(f"""    <div class="matrix-bg"></div>
     <div class="scan-line"></div>
     
     <div class="container">
@@ -2402,51 +4697,37 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
             {stats_html}
         </div>
 
+        {findings_html}
+
         <!-- System Graphs -->
         <div class="section">
             <h2>> SYSTEM ANALYTICS & VISUALIZATIONS</h2>
             {graphs_html}
         </div>
-"""
-    
-    # Section names mapping
-    section_names = {
-        "system_info": "SYSTEM OVERVIEW",
-        "hardware_info": "HARDWARE INFORMATION", 
-        "process_info": "RUNNING PROCESSES",
-        "network_info": "NETWORK ANALYSIS",
-        "security_audit": "SECURITY AUDIT",
-        "installed_software": "INSTALLED SOFTWARE",
-        "system_services": "SYSTEM SERVICES",
-        "startup_programs": "STARTUP PROGRAMS",
-        "environment_vars": "ENVIRONMENT VARIABLES",
-        "hardware_temps": "HARDWARE TEMPERATURES",
-        "system_logs": "SYSTEM LOGS",
-        "performance_metrics": "PERFORMANCE METRICS",
-        "user_accounts": "USER ACCOUNTS",
-        "system_drivers": "SYSTEM DRIVERS",
-        "wifi_networks": "WIFI NETWORKS"
-    }
+""")
     
     # Add all data sections
-    for data_key, section_name in section_names.items():
-        section_data = all_data.get(data_key, [])
-        html += generate_section_html(section_name, section_data)
+    for data_key in REPORT_SECTIONS:
+        write_section_html(write, report_section_title(all_data, data_key), all_data.get(data_key, []), payload)
     
     # Add footer
-    html += f"""
+    write(f"""
         <div class="footer">
-            <p>> SCAN COMPLETED: {datetime.now().strftime('%H:%M:%S')}</p>
+            <p>> SCAN COMPLETED: {completed_time.split()[-1]}</p>
             <p>> ENHANCED SYSTEM ANALYTICS | STATISTICAL VISUALIZATION ENGINE</p>
-            <p>> REPORT ID: {timestamp} | GENERATED BY: {getpass.getuser()}</p>
+            <p>> REPORT ID: {timestamp} | GENERATED BY: {scan_user}</p>
             <p>> SABARI425 ORGANIZATION | ANALYTICS LEVEL: MAXIMUM</p>
         </div>
     </div>
-    
-    <script>
-        // Simple table sorting
-        document.addEventListener('DOMContentLoaded', function() {{
-            const tables = document.querySelectorAll('table');
+""")
+    
+    # payload holds the compact-mode tables; None when they are inline in the page
+    if payload:
+        write = page_write
+    script = f"""
+        function startReport(payload) {{
+            // Simple table sorting
+            const tables = document.querySelectorAll('table:not(.vt-table)');
             tables.forEach(table => {{
                 const headers = table.querySelectorAll('th');
                 headers.forEach((header, index) => {{
@@ -2465,10 +4746,11 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
                 const rows = Array.from(tbody.querySelectorAll('tr'));
                 
                 const isNumeric = (text) => !isNaN(parseFloat(text)) && isFinite(text);
+                const sortText = (cell) => cell ? (cell.dataset.sort ?? cell.textContent.trim()) : '';
                 
                 rows.sort((a, b) => {{
-                    const aText = a.cells[column]?.textContent.trim() || '';
-                    const bText = b.cells[column]?.textContent.trim() || '';
+                    const aText = sortText(a.cells[column]);
+                    const bText = sortText(b.cells[column]);
                     
                     if (isNumeric(aText) && isNumeric(bText)) {{
                         return parseFloat(aText) - parseFloat(bText);
@@ -2484,6 +4766,116 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
                 rows.forEach(row => tbody.appendChild(row));
             }}
             
+            // Virtualized tables: rows live in the embedded JSON, only the visible slice is in the DOM
+            const STATUS_CLASSES = {_script_json(STATUS_CLASSES)};
+            const collator = new Intl.Collator(undefined, {{ numeric: true }});
+            document.querySelectorAll('.virtual-table').forEach(initVirtualTable);
+            
+            function initVirtualTable(container) {{
+                const data = payload ? payload.tables[+container.dataset.payload]
+                                     : JSON.parse(container.querySelector('.vt-data').textContent);
+                const rows = data.rows || data.columns[0].map((_, i) => data.columns.map(column => column[i]));
+                const viewport = container.querySelector('.vt-viewport');
+                const tbody = container.querySelector('tbody');
+                const filter = container.querySelector('.vt-filter');
+                const count = container.querySelector('.vt-count');
+                const headers = container.querySelectorAll('th');
+                let order = rows.map((_, i) => i);
+                let view = order;
+                let haystack = null;
+                let rowHeight = 0;
+                let sortColumn = -1;
+                let sortDirection = 1;
+                let pending = false;
+                
+                function spacer(height) {{
+                    const tr = document.createElement('tr');
+                    tr.className = 'vt-spacer';
+                    const td = document.createElement('td');
+                    td.colSpan = headers.length;
+                    td.style.height = height + 'px';
+                    tr.appendChild(td);
+                    return tr;
+                }}
+                
+                function render() {{
+                    pending = false;
+                    const height = rowHeight || 32;
+                    const first = Math.max(0, Math.floor(viewport.scrollTop / height) - 10);
+                    const last = Math.min(view.length, first + Math.ceil(viewport.clientHeight / height) + 20);
+                    const fragment = document.createDocumentFragment();
+                    fragment.appendChild(spacer(first * height));
+                    for (let n = first; n < last; n++) {{
+                        const i = view[n];
+                        const tr = document.createElement('tr');
+                        if (n % 2) tr.className = 'vt-alt';
+                        rows[i].forEach((text, column) => {{
+                            const td = document.createElement('td');
+                            td.textContent = text;
+                            const codes = data.classes[column];
+                            if (codes && codes[i]) td.className = STATUS_CLASSES[codes[i]];
+                            tr.appendChild(td);
+                        }});
+                        fragment.appendChild(tr);
+                    }}
+                    fragment.appendChild(spacer((view.length - last) * height));
+                    tbody.replaceChildren(fragment);
+                    count.textContent = '> SHOWING ' + view.length.toLocaleString() + ' OF ' + rows.length.toLocaleString() + ' ROWS';
+                    
+                    // Measure the real row height once, then lay out again with it
+                    if (!rowHeight && last > first) {{
+                        rowHeight = tbody.children[1].getBoundingClientRect().height || height;
+                        if (rowHeight !== height) schedule();
+                    }}
+                }}
+                
+                function schedule() {{
+                    if (!pending) {{
+                        pending = true;
+                        requestAnimationFrame(render);
+                    }}
+                }}
+                
+                // Numbers compare on their sort keys and come before text; text uses natural order
+                function compare(a, b) {{
+                    const keys = data.keys[sortColumn];
+                    if (keys) {{
+                        const x = keys[a];
+                        const y = keys[b];
+                        if (x !== null && y !== null) return (x - y) * sortDirection;
+                        if (x !== null) return -1;
+                        if (y !== null) return 1;
+                    }}
+                    return collator.compare(rows[a][sortColumn], rows[b][sortColumn]) * sortDirection;
+                }}
+                
+                function applyFilter() {{
+                    const term = filter.value.trim().toLowerCase();
+                    if (!term) {{
+                        view = order;
+                    }} else {{
+                        if (!haystack) haystack = rows.map(row => row.join('\\n').toLowerCase());
+                        view = order.filter(i => haystack[i].includes(term));
+                    }}
+                    viewport.scrollTop = 0;
+                    schedule();
+                }}
+                
+                headers.forEach((header, column) => {{
+                    header.style.cursor = 'pointer';
+                    header.title = 'Click to sort';
+                    header.addEventListener('click', () => {{
+                        sortDirection = sortColumn === column ? -sortDirection : 1;
+                        sortColumn = column;
+                        order.sort(compare);
+                        applyFilter();
+                    }});
+                }});
+                filter.addEventListener('input', applyFilter);
+                viewport.addEventListener('scroll', schedule);
+                render();
+            }}
+            
             // Animate health meter
             const healthFill = document.querySelector('.health-fill');
             if (healthFill) {{
@@ -2492,17 +4884,1291 @@ def generate_html_with_graphs(all_data, health_score, timestamp):
                     healthFill.style.width = score + '%';
                 }}, 500);
             }}
-        }});
+        }}
+"""
+    if payload:
+        write(f"""
+    <script type="application/octet-stream" id="report-payload">{payload.finish(style, script)}</script>
+    <script>
+        // Inflate the payload, then install its CSS and JS and hand it the table data
+        (async () => {{
+            const encoded = document.getElementById('report-payload').textContent;
+            const bytes = Uint8Array.from(atob(encoded), c => c.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+            const payload = JSON.parse(await new Response(stream).text());
+            document.body.insertAdjacentHTML('afterbegin', payload.body);
+            const style = document.createElement('style');
+            style.textContent = payload.style;
+            document.head.appendChild(style);
+            const script = document.createElement('script');
+            script.textContent = payload.script;
+            document.body.appendChild(script);
+            startReport(payload);
+        }})();
+    </script>
+""")
+    else:
+        write(f"""
+    <script>{script}
+        document.addEventListener('DOMContentLoaded', () => startReport(null));
     </script>
-</body>
+""")
+    write("""</body>
 </html>
-"""
+""")
+
+def generate_html_with_graphs(all_data, health_score, timestamp, compact=None):
+    """Generate HTML content with graphs as one string"""
+    out = io.StringIO()
+    write_html_report(out, all_data, health_score, timestamp, compact)
+    return out.getvalue()
+
+def write_report_file(path, writer, *args):
+    """Run writer(f, *args) on a buffered file at path; the file only appears once complete"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=Config.HTML_WRITE_BUFFER) as f:
+            writer(f, *args)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def save_html_report(path, all_data, health_score, timestamp, compact=None):
+    """Stream the HTML report to path"""
+    write_report_file(path, write_html_report, all_data, health_score, timestamp, compact)
+
+# -------------------------------------------------------------------
+#  SCAN SNAPSHOTS & RENDER-ONLY MODE
+# -------------------------------------------------------------------
+# A snapshot is NDJSON: a header line, then one line per table row, or one
+# "value" line for anything that is not a list. Typed cells are tagged as
+# {"$": type, "v": raw value} so a reloaded scan renders exactly like the live
+# one. Paths ending in .gz are gzip-compressed.
+SNAPSHOT_FORMAT = "sys-scanner-snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_TYPES = {cls.__name__: cls for cls in (Percent, ByteSize, ByteRate, Mbps, Celsius, Count, Seconds,
+                                                LinkState, RiskLevel)}
+
+_SNAPSHOT_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+def encode_snapshot_value(value):
+    """JSON-ready form of an all_data value, typed cells tagged"""
+    kind = type(value)
+    if kind in _SNAPSHOT_PLAIN_TYPES:
+        return value
+    if SNAPSHOT_TYPES.get(kind.__name__) is kind:
+        raw = value.value if isinstance(value, Enum) else (float(value) if isinstance(value, float) else int(value))
+        return {"$": kind.__name__, "v": raw}
+    if isinstance(value, ProcessRecord):
+        return {"$": "ProcessRecord", "v": encode_snapshot_value(value.to_dict())}
+    if isinstance(value, dict):
+        # Most cells are plain; only call back in for the typed ones
+        encoded = {str(key): item if type(item) in _SNAPSHOT_PLAIN_TYPES else encode_snapshot_value(item)
+                   for key, item in value.items()}
+        return {"$": "dict", "v": encoded} if "$" in encoded else encoded
+    if isinstance(value, (list, tuple)):
+        return [encode_snapshot_value(item) for item in value]
+    if isinstance(value, datetime):
+        return {"$": "datetime", "v": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float)):
+        return (str if isinstance(value, str) else float if isinstance(value, float) else int)(value)
+    return str(value)
+
+def _decode_snapshot_object(obj):
+    """json object_hook undoing encode_snapshot_value's tags; inner objects arrive already decoded"""
+    tag = obj.get("$")
+    if tag is None:
+        return obj
+    raw = obj.get("v")
+    if tag == "ProcessRecord":
+        return ProcessRecord(**raw)
+    if tag == "datetime":
+        return datetime.fromisoformat(raw)
+    cls = SNAPSHOT_TYPES.get(tag)
+    return cls(raw) if cls else raw
+
+def _open_snapshot(path, mode, compressed=None):
+    if path.endswith(".gz") if compressed is None else compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6)
+    return open(path, mode, encoding="utf-8")
+
+def save_snapshot(path, all_data):
+    """Persist all_data as a typed NDJSON snapshot, row by row"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    try:
+        with _open_snapshot(tmp_path, "w", compressed=path.endswith(".gz")) as f:
+            f.write(dumps({"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION,
+                           "saved": datetime.now().isoformat(timespec="seconds")}) + "\n")
+            for key, value in all_data.items():
+                if isinstance(value, list) and value:
+                    for row in value:
+                        f.write(dumps({"section": key, "row": encode_snapshot_value(row)}) + "\n")
+                else:
+                    f.write(dumps({"section": key, "value": encode_snapshot_value(value)}) + "\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def load_snapshot(path):
+    """all_data as saved by save_snapshot"""
+    all_data = {}
+    with _open_snapshot(path, "r") as f:
+        try:
+            header = json.loads(f.readline() or "null")
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a scanner snapshot")
+        if header.get("version", 0) > SNAPSHOT_VERSION:
+            raise ValueError(f"snapshot version {header['version']} is newer than this scanner supports")
+        loads = json.JSONDecoder(object_hook=_decode_snapshot_object).decode
+        for line in f:
+            if not line.strip():
+                continue
+            entry = loads(line)
+            if "row" in entry:
+                all_data.setdefault(entry["section"], []).append(entry["row"])
+            else:
+                all_data[entry["section"]] = entry.get("value")
+    return all_data
+
+def _text_table(rows):
+    """tabulate() text for a section's key-value list or list of row dicts"""
+    if isinstance(rows[0], dict):
+        headers = list(rows[0].keys())
+        cells = [[str(row.get(header, '')) for header in headers] for row in rows]
+    else:
+        headers = ()
+        cells = [[str(cell) for cell in row] for row in rows]
+    return tabulate(cells, headers=headers, tablefmt="github" if headers else "plain", disable_numparse=True)
+
+def write_text_report(out, all_data, health_score, timestamp):
+    """Plain-text report: scan details, statistics, health findings, then every section"""
+    meta = all_data.get("scan_meta") or scan_metadata()
+    out.write(f"SYSTEM INTELLIGENCE ANALYTICS - {meta['hostname']}\n")
+    out.write(f"Scan time: {meta['started']} | Platform: {meta['platform']} | Report ID: {timestamp}\n")
+    out.write(f"Health score: {health_score}/100\n")
+    
+    sections = [("STATISTICS", get_comprehensive_statistics(all_data)),
+                ("HEALTH FINDINGS", evaluate_health(all_data).hits)]
+    sections += [(report_section_title(all_data, key), all_data.get(key, [])) for key in REPORT_SECTIONS]
+    for title, rows in sections:
+        out.write(f"\n> {title}\n")
+        out.write((_text_table(rows) if rows else "NO DATA AVAILABLE") + "\n")
+
+def _json_report_default(value):
+    if isinstance(value, ProcessRecord):
+        return value.to_dict()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def write_json_report(out, all_data, health_score, timestamp):
+    """Machine-readable report: raw numbers, no display formatting"""
+    report = {
+        "report_id": timestamp,
+        "scan": all_data.get("scan_meta") or scan_metadata(),
+        "health": {"score": health_score, "findings": evaluate_health(all_data).hits},
+        "statistics": get_comprehensive_statistics(all_data),
+        "sections": {key: all_data.get(key, []) for key in REPORT_SECTIONS},
+        "table_pages": all_data.get("table_pages", {}),
+        "processes": get_process_records(all_data),
+    }
+    json.dump(report, out, indent=1, ensure_ascii=False, default=_json_report_default)
+    out.write("\n")
+
+REPORT_RENDERERS = OrderedDict([
+    ("html", (".html", write_html_report)),
+    ("text", (".txt", write_text_report)),
+    ("json", (".json", write_json_report)),
+])
+
+def render_snapshot(snapshot_path, fmt="html", output=None):
+    """Render entry point: build an HTML/text/JSON report from a snapshot file without scanning"""
+    extension, writer = REPORT_RENDERERS[fmt]
+    start = time.perf_counter()
+    all_data = load_snapshot(snapshot_path)
+    loaded = time.perf_counter()
     
-    return html
+    health_score = calculate_health_score(all_data)
+    timestamp = (all_data.get("scan_meta") or {}).get("report_id") or datetime.now().strftime('%Y%m%d_%H%M%S')
+    if output is None:
+        base = snapshot_path[:-3] if snapshot_path.endswith(".gz") else snapshot_path
+        output = os.path.splitext(base)[0].replace("_Snapshot_", "_Report_") + extension
+    if output == "-":
+        writer(sys.stdout, all_data, health_score, timestamp)
+    else:
+        write_report_file(output, writer, all_data, health_score, timestamp)
+    done = time.perf_counter()
+    
+    if output != "-":
+        print_status(f"Rendered {fmt} report: {output}", "SUCCESS",
+                     f"load {(loaded - start) * 1000:.0f} ms, render {(done - loaded) * 1000:.0f} ms")
+    return output
+
+# -------------------------------------------------------------------
+#  COMPRESSED SERIES ARCHIVE
+# -------------------------------------------------------------------
+# Gorilla encoding (Facebook's in-memory TSDB): millisecond timestamps as
+# delta-of-delta with variable-width buckets, values as the XOR of each float
+# with the previous one, storing only the meaningful bits. Regular sampling
+# costs ~1 bit per timestamp and slowly changing values a few bits each.
+class BitWriter:
+    """Append-only big-endian bit stream"""
+
+    def __init__(self):
+        self._out = bytearray()
+        self._acc = 0
+        self._bits = 0
+
+    def write(self, value, nbits):
+        self._acc = (self._acc << nbits) | value
+        self._bits += nbits
+        if self._bits >= 64:
+            spare = self._bits & 7
+            self._out += (self._acc >> spare).to_bytes(self._bits >> 3, 'big')
+            self._acc &= (1 << spare) - 1
+            self._bits = spare
+
+    def getvalue(self):
+        pad = -self._bits % 8
+        return bytes(self._out) + ((self._acc << pad).to_bytes((self._bits + pad) >> 3, 'big') if self._bits else b'')
+
+class BitReader:
+    """Reads fields of up to 64 bits from a byte buffer"""
+
+    def __init__(self, data):
+        self._data = bytes(data) + bytes(9)  # slack so every read can take 9 bytes
+        self.pos = 0
+
+    def read(self, nbits):
+        index = self.pos >> 3
+        chunk = int.from_bytes(self._data[index:index + 9], 'big')
+        self.pos += nbits
+        return (chunk >> (72 - (self.pos - (index << 3)))) & ((1 << nbits) - 1)
+
+# (prefix, prefix bits, value bits) for delta-of-delta ranges; the last bucket takes anything
+_DOD_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12), (0b1111, 4, 64))
+
+def gorilla_encode(timestamps_ms, values):
+    """Encode int millisecond timestamps and floats into one Gorilla block payload"""
+    writer = BitWriter()
+    count = len(timestamps_ms)
+    if not count:
+        return b''
+    bits = struct.unpack(f'<{count}Q', struct.pack(f'<{count}d', *values))
+    writer.write(bits[0], 64)
+    if count > 1:
+        delta = timestamps_ms[1] - timestamps_ms[0]
+        writer.write(delta & 0xFFFFFFFFFFFFFFFF, 64)
+    leading, trailing = 65, 0
+    previous_bits = bits[0]
+    for i in range(1, count):
+        if i > 1:
+            new_delta = timestamps_ms[i] - timestamps_ms[i - 1]
+            dod = new_delta - delta
+            delta = new_delta
+            if dod == 0:
+                writer.write(0, 1)
+            else:
+                for prefix, prefix_bits, value_bits in _DOD_BUCKETS:
+                    if -(1 << (value_bits - 1)) < dod <= (1 << (value_bits - 1)) or value_bits == 64:
+                        writer.write(prefix, prefix_bits)
+                        writer.write(dod & ((1 << value_bits) - 1), value_bits)
+                        break
+        
+        xor = bits[i] ^ previous_bits
+        previous_bits = bits[i]
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+        new_leading = min(31, 64 - xor.bit_length())
+        new_trailing = (xor & -xor).bit_length() - 1
+        if new_leading >= leading and new_trailing >= trailing:
+            # Fits the previous meaningful-bit window
+            writer.write(0b10, 2)
+            writer.write(xor >> trailing, 64 - leading - trailing)
+        else:
+            leading, trailing = new_leading, new_trailing
+            length = 64 - leading - trailing
+            writer.write(0b11, 2)
+            writer.write(leading, 5)
+            writer.write(length & 63, 6)  # 64 is stored as 0
+            writer.write(xor >> trailing, length)
+    return writer.getvalue()
+
+def gorilla_decode(payload, count, first_ms):
+    """Inverse of gorilla_encode: ([timestamps_ms], [values])"""
+    if not count:
+        return [], []
+    reader = BitReader(payload)
+    read = reader.read
+    timestamps = [first_ms]
+    bits = [read(64)]
+    delta = 0
+    if count > 1:
+        delta = read(64)
+        if delta >= 1 << 63:
+            delta -= 1 << 64
+    leading = trailing = 0
+    previous_bits = bits[0]
+    timestamp = first_ms
+    for i in range(1, count):
+        if i > 1:
+            if read(1):
+                for prefix_bits, value_bits in ((1, 7), (1, 9), (1, 12), (0, 64)):
+                    if not prefix_bits or not read(1):
+                        break
+                dod = read(value_bits)
+                if dod > 1 << (value_bits - 1):
+                    dod -= 1 << value_bits
+                delta += dod
+        timestamp += delta
+        timestamps.append(timestamp)
+        
+        if read(1):
+            if read(1):
+                leading = read(5)
+                length = read(6) or 64
+                trailing = 64 - leading - length
+            previous_bits ^= read(64 - leading - trailing) << trailing
+        bits.append(previous_bits)
+    return timestamps, list(struct.unpack(f'<{count}d', struct.pack(f'<{count}Q', *bits)))
+
+SERIES_FILE_MAGIC = b"SSGS\x01"
+# Per block: point count, payload bytes, first and last timestamp (ms)
+SERIES_BLOCK_HEADER = struct.Struct("<IIqq")
+SeriesBlock = namedtuple("SeriesBlock", "offset count size first_ms last_ms")
+
+class GorillaSeriesFile:
+    """Append-only file of Gorilla blocks for one series.
+
+    Blocks are written whole and never change, so readers mmap the file, walk
+    the fixed-size headers and decode only the blocks overlapping the requested
+    time range. Timestamps are kept to the millisecond.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def blocks(self):
+        """SeriesBlock for every complete block in the file"""
+        try:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size <= len(SERIES_FILE_MAGIC):
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return list(self._walk(mapped))
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _walk(mapped):
+        if mapped[:len(SERIES_FILE_MAGIC)] != SERIES_FILE_MAGIC:
+            raise ValueError("not a series archive file")
+        offset = len(SERIES_FILE_MAGIC)
+        end = len(mapped)
+        while offset + SERIES_BLOCK_HEADER.size <= end:
+            count, size, first_ms, last_ms = SERIES_BLOCK_HEADER.unpack_from(mapped, offset)
+            if offset + SERIES_BLOCK_HEADER.size + size > end:
+                break  # block cut short by an interrupted write
+            yield SeriesBlock(offset, count, size, first_ms, last_ms)
+            offset += SERIES_BLOCK_HEADER.size + size
+
+    def append(self, points):
+        """Append (unix time, value) points in time order; points not after the stored ones are skipped"""
+        blocks = self.blocks()
+        last_ms = blocks[-1].last_ms if blocks else None
+        timestamps, values = [], []
+        for timestamp, value in points:
+            timestamp_ms = int(round(timestamp * 1000))
+            if last_ms is None or timestamp_ms > last_ms:
+                timestamps.append(timestamp_ms)
+                values.append(float(value))
+                last_ms = timestamp_ms
+        if not timestamps:
+            return 0
+        
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(SERIES_FILE_MAGIC)
+            for start in range(0, len(timestamps), Config.SERIES_BLOCK_POINTS):
+                chunk_times = timestamps[start:start + Config.SERIES_BLOCK_POINTS]
+                payload = gorilla_encode(chunk_times, values[start:start + Config.SERIES_BLOCK_POINTS])
+                f.write(SERIES_BLOCK_HEADER.pack(len(chunk_times), len(payload), chunk_times[0], chunk_times[-1]))
+                f.write(payload)
+        return len(timestamps)
+
+    def read(self, start=None, end=None):
+        """Lazily yield (unix time, value) between start and end, decoding only overlapping blocks"""
+        start_ms = None if start is None else start * 1000
+        end_ms = None if end is None else end * 1000
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            if os.fstat(f.fileno()).st_size <= len(SERIES_FILE_MAGIC):
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for block in self._walk(mapped):
+                    if (start_ms is not None and block.last_ms < start_ms) or \
+                            (end_ms is not None and block.first_ms > end_ms):
+                        continue
+                    payload_start = block.offset + SERIES_BLOCK_HEADER.size
+                    timestamps, values = gorilla_decode(mapped[payload_start:payload_start + block.size],
+                                                        block.count, block.first_ms)
+                    for timestamp_ms, value in zip(timestamps, values):
+                        if (start_ms is None or timestamp_ms >= start_ms) and \
+                                (end_ms is None or timestamp_ms <= end_ms):
+                            yield timestamp_ms / 1000, value
+
+    def prune(self, before):
+        """Drop whole blocks that end before unix time `before`"""
+        blocks = self.blocks()
+        keep = [block for block in blocks if block.last_ms >= before * 1000]
+        if len(keep) == len(blocks):
+            return 0
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(self.path, 'rb') as source, open(tmp_path, 'wb') as target:
+            target.write(SERIES_FILE_MAGIC)
+            for block in keep:
+                source.seek(block.offset)
+                target.write(source.read(SERIES_BLOCK_HEADER.size + block.size))
+        os.replace(tmp_path, self.path)
+        return len(blocks) - len(keep)
+
+class SeriesArchive:
+    """Long-term raw sampler series: one GorillaSeriesFile per host and metric"""
+
+    def __init__(self, root=None):
+        self.root = root or Config.SERIES_ARCHIVE_DIR
+
+    def series(self, metric, host=None):
+        safe = lambda name: re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+        return GorillaSeriesFile(os.path.join(self.root, safe(host or socket.gethostname()), safe(metric) + ".gts"))
+
+    def append(self, points, host=None, now=None):
+        """Archive (metric, unix time, value) points; returns how many were new"""
+        by_metric = defaultdict(list)
+        for metric, timestamp, value in points:
+            by_metric[metric].append((timestamp, value))
+        cutoff = (now or time.time()) - Config.SERIES_ARCHIVE_DAYS * 86400
+        appended = 0
+        for metric, series_points in by_metric.items():
+            series = self.series(metric, host)
+            series_points.sort()
+            appended += series.append(series_points)
+            series.prune(cutoff)
+        return appended
+
+    def read(self, metric, start=None, end=None, host=None):
+        return self.series(metric, host).read(start, end)
+
+series_archive = SeriesArchive()
+
+HISTORY_RESOLUTIONS = OrderedDict([("hour", 3600), ("day", 86400)])
+HISTORY_STATS = ("mean", "min", "max", "p50", "p95", "p99", "count")
+
+def scan_history_points(all_data, health_score, when):
+    """(metric, unix time, value) points describing one scan"""
+    metrics = gather_health_metrics(all_data)
+    points = [("health_score", when, health_score),
+              ("process_count", when, len(get_process_records(all_data)))]
+    for name in ("memory_usage", "cpu_usage", "zombie_count", "high_cpu_processes"):
+        if metrics[name] is not None:
+            points.append((name, when, metrics[name]))
+    for name in ("disk_usage", "temperature"):
+        points.extend((f"{name}:{subject}", when, value) for subject, value in metrics[name])
+    return points
+
+class HistoryStore:
+    """Local time-series history of scans in SQLite (WAL mode).
+
+    Raw points live in `samples`, clustered on (host, metric, timestamp). Each
+    write re-aggregates the hour and day buckets it touched into `rollups`
+    (count/mean/min/max/p50/p95/p99), so trend queries read a few hundred
+    precomputed rows instead of raw data. Retention then drops raw points,
+    hourly and daily rollups and per-scan tables after Config.HISTORY_*_DAYS.
+    Buckets are UTC-aligned.
+    """
+
+    def __init__(self, path=None, host=None):
+        self.path = path or Config.HISTORY_PATH
+        self.host = host or socket.gethostname()
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            with self._lock:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS scans (
+                        id INTEGER PRIMARY KEY,
+                        host TEXT NOT NULL,
+                        timestamp REAL NOT NULL,
+                        report_id TEXT,
+                        health_score INTEGER);
+                    CREATE INDEX IF NOT EXISTS idx_scans_host_time ON scans(host, timestamp);
+                    CREATE TABLE IF NOT EXISTS scan_tables (
+                        scan_id INTEGER NOT NULL,
+                        section TEXT NOT NULL,
+                        row_count INTEGER NOT NULL,
+                        data BLOB NOT NULL,
+                        PRIMARY KEY (scan_id, section));
+                    CREATE TABLE IF NOT EXISTS samples (
+                        host TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        timestamp REAL NOT NULL,
+                        value REAL NOT NULL,
+                        PRIMARY KEY (host, metric, timestamp)) WITHOUT ROWID;
+                    CREATE TABLE IF NOT EXISTS rollups (
+                        host TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        resolution INTEGER NOT NULL,
+                        bucket INTEGER NOT NULL,
+                        count INTEGER NOT NULL,
+                        mean REAL, min REAL, max REAL, p50 REAL, p95 REAL, p99 REAL,
+                        PRIMARY KEY (host, metric, resolution, bucket)) WITHOUT ROWID;
+                """)
+                conn.commit()
+                self._initialized = True
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def record_points(self, points, host=None, now=None):
+        """Store (metric, unix time, value) points and refresh their rollups; returns the count stored"""
+        conn = self._connect()
+        try:
+            count = self._insert_points(conn, host or self.host, points, now or time.time())
+            conn.commit()
+            return count
+        finally:
+            conn.close()
+
+    def record_scan(self, all_data, health_score, sampler=None, now=None):
+        """Store one scan: its metrics, the sampler's buffered series and its tables"""
+        now = now or time.time()
+        meta = all_data.get("scan_meta") or {}
+        points = scan_history_points(all_data, health_score, now)
+        sampler_points = sampler.points() if sampler is not None else []
+        points.extend(sampler_points)
+        
+        conn = self._connect()
+        try:
+            scan_id = conn.execute("INSERT INTO scans (host, timestamp, report_id, health_score) VALUES (?, ?, ?, ?)",
+                                   (self.host, now, meta.get("report_id"), health_score)).lastrowid
+            for section in REPORT_SECTIONS:
+                rows = all_data.get(section)
+                if rows:
+                    data = zlib.compress(json.dumps(encode_snapshot_value(rows), separators=(',', ':')).encode('utf-8'))
+                    conn.execute("INSERT OR REPLACE INTO scan_tables VALUES (?, ?, ?, ?)",
+                                 (scan_id, section, len(rows), data))
+            count = self._insert_points(conn, self.host, points, now)
+            conn.commit()
+        finally:
+            conn.close()
+        
+        # Raw sampler series outlive the raw SQLite window in the compressed archive
+        if sampler_points and Config.SERIES_ARCHIVE_ENABLED:
+            series_archive.append(sampler_points, host=self.host, now=now)
+        return count
+
+    def _insert_points(self, conn, host, points, now):
+        touched = {}
+        rows = []
+        for metric, timestamp, value in points:
+            if value is None or not math.isfinite(value):
+                continue
+            rows.append((host, metric, float(timestamp), float(value)))
+            low, high = touched.get(metric, (timestamp, timestamp))
+            touched[metric] = (min(low, timestamp), max(high, timestamp))
+        conn.executemany("INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?)", rows)
+        for metric, (low, high) in touched.items():
+            self._rollup(conn, host, metric, low, high, now)
+        self._apply_retention(conn, now)
+        return len(rows)
+
+    def _rollup(self, conn, host, metric, low, high, now):
+        """Recompute every hour/day bucket of metric overlapping [low, high] from raw points"""
+        raw_cutoff = now - Config.HISTORY_RAW_DAYS * 86400
+        for resolution in HISTORY_RESOLUTIONS.values():
+            # Buckets that began before the raw cutoff have lost points; keep their rollups as they are
+            first = max(int(low // resolution), math.ceil(raw_cutoff / resolution)) * resolution
+            last = int(high // resolution) * resolution
+            if first > last:
+                continue
+            buckets = defaultdict(list)
+            for timestamp, value in conn.execute(
+                    "SELECT timestamp, value FROM samples WHERE host = ? AND metric = ? AND timestamp >= ? "
+                    "AND timestamp < ?", (host, metric, first, last + resolution)):
+                buckets[int(timestamp // resolution) * resolution].append(value)
+            conn.executemany("INSERT OR REPLACE INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             [(host, metric, resolution, bucket) + self._aggregate(values)
+                              for bucket, values in buckets.items()])
+
+    @staticmethod
+    def _aggregate(values):
+        values.sort()
+        return (len(values), math.fsum(values) / len(values), values[0], values[-1],
+                _percentile_sorted(values, 50), _percentile_sorted(values, 95), _percentile_sorted(values, 99))
+
+    def _apply_retention(self, conn, now):
+        conn.execute("DELETE FROM samples WHERE timestamp < ?", (now - Config.HISTORY_RAW_DAYS * 86400,))
+        conn.execute("DELETE FROM rollups WHERE resolution = ? AND bucket < ?",
+                     (HISTORY_RESOLUTIONS["hour"], now - Config.HISTORY_HOURLY_DAYS * 86400))
+        conn.execute("DELETE FROM rollups WHERE resolution = ? AND bucket < ?",
+                     (HISTORY_RESOLUTIONS["day"], now - Config.HISTORY_DAILY_DAYS * 86400))
+        conn.execute("DELETE FROM scan_tables WHERE scan_id IN (SELECT id FROM scans WHERE timestamp < ?)",
+                     (now - Config.HISTORY_TABLE_DAYS * 86400,))
+        conn.execute("DELETE FROM scans WHERE timestamp < ?", (now - Config.HISTORY_DAILY_DAYS * 86400,))
+
+    def query(self, metric, stat="p95", resolution="day", days=90, host=None, now=None):
+        """[(bucket start, value)] for one metric, e.g. CPU p95 per day over the last 90 days"""
+        if stat not in HISTORY_STATS:
+            raise ValueError(f"unknown statistic {stat!r}; use one of {', '.join(HISTORY_STATS)}")
+        since = (now or time.time()) - days * 86400
+        conn = self._connect()
+        try:
+            return conn.execute(f"SELECT bucket, {stat} FROM rollups WHERE host = ? AND metric = ? "
+                                "AND resolution = ? AND bucket >= ? ORDER BY bucket",
+                                (host or self.host, metric, HISTORY_RESOLUTIONS[resolution],
+                                 since - since % HISTORY_RESOLUTIONS[resolution])).fetchall()
+        finally:
+            conn.close()
+
+    def metrics(self, host=None):
+        """Metric names with history for host"""
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute("SELECT DISTINCT metric FROM rollups WHERE host = ? ORDER BY metric",
+                                                   (host or self.host,))]
+        finally:
+            conn.close()
+
+    def scan_table(self, scan_id, section):
+        """Typed rows of one stored scan table, or None"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT data FROM scan_tables WHERE scan_id = ? AND section = ?",
+                               (scan_id, section)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'), object_hook=_decode_snapshot_object)
+
+history_store = HistoryStore()
+
+def show_history(metric, stat="p95", resolution="day", days=90):
+    """Print one metric's trend from the history store"""
+    if metric == "list":
+        names = history_store.metrics()
+        print(tabulate([[name] for name in names], headers=["Metric"], tablefmt="github") if names
+              else "No history recorded yet")
+        return
+    start = time.perf_counter()
+    rows = history_store.query(metric, stat, resolution, days)
+    elapsed = time.perf_counter() - start
+    bucket_format = '%Y-%m-%d' if resolution == "day" else '%Y-%m-%d %H:00'
+    print(tabulate([[time.strftime(bucket_format, time.gmtime(bucket)), f"{value:.2f}" if stat != "count" else value]
+                    for bucket, value in rows],
+                   headers=[f"{resolution.title()} (UTC)", f"{metric} {stat}"], tablefmt="github"))
+    print_status(f"{len(rows)} {resolution} bucket(s) over {days} days", "INFO", f"query {elapsed * 1000:.1f} ms")
+
+# -------------------------------------------------------------------
+#  BENCHMARKS
+# -------------------------------------------------------------------
+def build_synthetic_procfs(root, count, first_pid=100000):
+    """Write a fake /proc tree with `count` processes that both psutil and ProcReader can read"""
+    os.makedirs(root, exist_ok=True)
+    for name in ("stat", "meminfo"):
+        shutil.copyfile(f"/proc/{name}", os.path.join(root, name))
+    for pid in range(first_pid, first_pid + count):
+        proc_dir = os.path.join(root, str(pid))
+        os.mkdir(proc_dir)
+        ppid = 1 if pid == first_pid else first_pid + (pid - first_pid) // 8
+        with open(os.path.join(proc_dir, "stat"), "w") as f:
+            f.write(f"{pid} (worker-{pid % 997}) S {ppid} {pid} {pid} 0 -1 4194560 100 0 0 0 "
+                    f"{pid % 300} {pid % 70} 0 0 20 0 {1 + pid % 4} 0 {1000 + pid} 10000000 500 "
+                    + "0 " * 32 + "0\n")
+        with open(os.path.join(proc_dir, "statm"), "w") as f:
+            f.write(f"2000 {100 + pid % 900} 300 10 0 400 0\n")
+        with open(os.path.join(proc_dir, "status"), "w") as f:
+            f.write(f"Name:\tworker-{pid % 997}\nState:\tS (sleeping)\nTgid:\t{pid}\nPid:\t{pid}\n"
+                    f"PPid:\t{ppid}\nUid:\t0\t0\t0\t0\nGid:\t0\t0\t0\t0\nThreads:\t{1 + pid % 4}\n"
+                    f"voluntary_ctxt_switches:\t1\nnonvoluntary_ctxt_switches:\t1\n")
+        with open(os.path.join(proc_dir, "cmdline"), "wb") as f:
+            f.write(f"/usr/bin/worker\0--id\0{pid}\0".encode())
+        os.symlink("/usr/bin/worker", os.path.join(proc_dir, "exe"))
+
+def benchmark_process_enumeration(counts=(1000, 10000, 50000)):
+    """psutil vs direct /proc enumeration on synthetic process tables"""
+    if not ProcReader.available():
+        print_status("The /proc benchmark needs Linux", "WARNING")
+        return []
+
+    rows = []
+    original_procfs = psutil.PROCFS_PATH
+    for count in counts:
+        root = tempfile.mkdtemp(prefix="sys_scanner_procfs_")
+        try:
+            print_status(f"Building synthetic /proc with {count:,} processes...", "DATA")
+            build_synthetic_procfs(root, count)
+
+            psutil.PROCFS_PATH = root
+            start = time.perf_counter()
+            psutil_records = []
+            for pid in psutil.pids():
+                try:
+                    proc = psutil.Process(pid)
+                    with proc.oneshot():
+                        psutil_records.append(psutil_process_record(proc.as_dict(PROCESS_ATTRS, ad_value=None)))
+                except psutil.Error:
+                    continue
+            psutil_time = time.perf_counter() - start
+            psutil.PROCFS_PATH = original_procfs
+
+            start = time.perf_counter()
+            fast_records = ProcReader(root).read_all()
+            fast_time = time.perf_counter() - start
+
+            rows.append([f"{count:,}", len(psutil_records), f"{psutil_time:.3f}", len(fast_records),
+                         f"{fast_time:.3f}", f"{fast_time / max(1, len(fast_records)) * 1e6:.1f}",
+                         f"{psutil_time / fast_time:.1f}x" if fast_time else "N/A"])
+        finally:
+            psutil.PROCFS_PATH = original_procfs
+            shutil.rmtree(root, ignore_errors=True)
+
+    print(tabulate(rows, headers=["Processes", "psutil rows", "psutil (s)", "/proc rows", "/proc (s)",
+                                  "/proc us/proc", "Speedup"], tablefmt="github"))
+    return rows
+
+def benchmark_process_tracker(counts=(1000, 10000, 50000), churn_fraction=0.01):
+    """Full /proc walk vs incremental ProcessTracker ticks with a small fraction of churn"""
+    if not ProcReader.available():
+        print_status("The process tracker benchmark needs Linux", "WARNING")
+        return []
+
+    rows = []
+    for count in counts:
+        root = tempfile.mkdtemp(prefix="sys_scanner_procfs_")
+        try:
+            print_status(f"Building synthetic /proc with {count:,} processes...", "DATA")
+            build_synthetic_procfs(root, count)
+            reader = ProcReader(root)
+
+            start = time.perf_counter()
+            reader.read_all()
+            full_time = time.perf_counter() - start
+
+            tracker = ProcessTracker(ProcReader(root))
+            tracker.tick()
+            start = time.perf_counter()
+            tracker.tick()
+            steady_time = time.perf_counter() - start
+
+            # Replace a slice of the table: the oldest pids exit, as many new ones start
+            changed = max(1, int(count * churn_fraction))
+            staging = tempfile.mkdtemp(prefix="sys_scanner_spawn_")
+            build_synthetic_procfs(staging, changed, first_pid=100000 + count)
+            for pid in range(100000, 100000 + changed):
+                shutil.rmtree(os.path.join(root, str(pid)))
+            for pid in range(100000 + count, 100000 + count + changed):
+                os.rename(os.path.join(staging, str(pid)), os.path.join(root, str(pid)))
+            shutil.rmtree(staging, ignore_errors=True)
+
+            start = time.perf_counter()
+            churn = tracker.tick()
+            churn_time = time.perf_counter() - start
+
+            rows.append([f"{count:,}", f"{full_time:.3f}", f"{steady_time:.3f}",
+                         f"{churn['spawned']}/{churn['exited']}", f"{churn_time:.3f}",
+                         f"{full_time / churn_time:.1f}x" if churn_time else "N/A"])
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    print(tabulate(rows, headers=["Processes", "Full walk (s)", "Tick, no churn (s)",
+                                  "Spawned/exited", "Tick with churn (s)", "Speedup"], tablefmt="github"))
+    return rows
+
+def _synthetic_process_fields(i):
+    """Field values for synthetic process i, built fresh like parsed /proc data"""
+    return dict(pid=100000 + i, name="worker-" + str(i % 300), username="user" + str(i % 5),
+                cpu_percent=(i % 97) / 10.0, memory_percent=(i % 89) / 100.0, rss=4096 * (i % 5000),
+                cpu_time=i / 100.0, create_time=1.7e9 + i, status="sleep" + "ing",
+                num_threads=1 + i % 4, exe="/usr/bin/worker-" + str(i % 300),
+                cmdline=["/usr/bin/worker-" + str(i % 300), "--id", str(i)], ppid=1 + i // 8)
+
+def _traced_size(build):
+    """Bytes still allocated by build()'s result"""
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+def benchmark_process_records(counts=(1000, 10000, 30000)):
+    """Memory per process row: display dicts vs raw dicts vs slotted ProcessRecords"""
+    rows = []
+    for count in counts:
+        dict_size = _traced_size(lambda: [_synthetic_process_fields(i) for i in range(count)])
+        record_size = _traced_size(lambda: [ProcessRecord(**_synthetic_process_fields(i)) for i in range(count)])
+        snapshot = ProcessSnapshot([ProcessRecord(**_synthetic_process_fields(i)) for i in range(count)])
+        display_size = _traced_size(snapshot.to_dicts)
+        rows.append([f"{count:,}", f"{display_size / count:.0f}", f"{dict_size / count:.0f}",
+                     f"{record_size / count:.0f}", format_bytes(dict_size), format_bytes(record_size),
+                     f"{dict_size / record_size:.1f}x"])
+
+    print(tabulate(rows, headers=["Processes", "Display dict B/row", "Raw dict B/row", "ProcessRecord B/row",
+                                  "Raw dicts", "ProcessRecords", "Saving"], tablefmt="github"))
+    return rows
+
+def benchmark_statistics(counts=(10000, 100000, 500000)):
+    """Per-process statistics: list + statistics module vs the array and NumPy engines"""
+    rows = []
+    for count in counts:
+        records = [ProcessRecord(**_synthetic_process_fields(i)) for i in range(count)]
+
+        start = time.perf_counter()
+        cpu_usages = [p["cpu_percent"] for p in records if p.get("cpu_percent") is not None]
+        memory_usages = [p["memory_percent"] for p in records if p.get("memory_percent") is not None]
+        baseline = (sum(cpu_usages) / len(cpu_usages), max(cpu_usages), sum(memory_usages) / len(memory_usages),
+                    max(memory_usages), Counter(p.get("status") for p in records))
+        baseline_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columns = ProcessColumns(records)
+        columns_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compute_process_statistics(columns, use_numpy=False)
+        array_time = time.perf_counter() - start
+
+        numpy_time = None
+        if NUMPY_AVAILABLE:
+            start = time.perf_counter()
+            compute_process_statistics(columns, use_numpy=True)
+            numpy_time = time.perf_counter() - start
+
+        rows.append([f"{count:,}", f"{baseline_time * 1000:.1f}", f"{columns_time * 1000:.1f}",
+                     f"{array_time * 1000:.1f}", f"{numpy_time * 1000:.1f}" if numpy_time is not None else "N/A"])
+
+    print(tabulate(rows, headers=["Processes", "Lists: mean/max/status (ms)", "Build columns (ms)",
+                                  "array engine, full stats (ms)", "NumPy engine, full stats (ms)"],
+                   tablefmt="github"))
+    print_status("Engine stats add p50/p95/p99, a CPU histogram and per-status/per-user totals", "INFO")
+    return rows
+
+def _reset_peak_rss():
+    """Reset the peak-RSS counter where the kernel allows it; return the current RSS"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+    return psutil.Process().memory_info().rss
+
+def _peak_rss():
+    """Peak resident set size of this process in bytes"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def run_forked(func, *args):
+    """Run func(*args) in a forked child so its memory peak is its own; returns the JSON-able result"""
+    if not hasattr(os, "fork"):
+        return func(*args)
+    sys.stdout.flush()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        status = 0
+        try:
+            payload = json.dumps(func(*args))
+        except BaseException as e:
+            payload = json.dumps({"error": str(e)})
+            status = 1
+        with os.fdopen(write_fd, "w") as pipe:
+            pipe.write(payload)
+        os._exit(status)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        payload = pipe.read()
+    os.waitpid(pid, 0)
+    return json.loads(payload) if payload else {"error": "benchmark child exited without a result"}
+
+def _html_render_trial(count, mode):
+    """Render a report with `count` process rows in mode memory/stream/compact; time, peak RSS and size.
+
+    "memory" is the current writer into one in-memory string (generate_html_with_graphs),
+    written out afterwards; it is not the old html += builder, which no longer exists.
+    """
+    snapshot = ProcessSnapshot([ProcessRecord(**_synthetic_process_fields(i)) for i in range(count)])
+    all_data = {"process_snapshot": snapshot.records, "process_info": snapshot.to_dicts()}
+    fd, path = tempfile.mkstemp(prefix="sys_scanner_report_", suffix=".html")
+    os.close(fd)
+    try:
+        baseline = _reset_peak_rss()
+        start = time.perf_counter()
+        if mode != "memory":
+            save_html_report(path, all_data, 85, "benchmark", compact=(mode == "compact"))
+        else:
+            html_content = generate_html_with_graphs(all_data, 85, "benchmark", compact=False)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+        elapsed = time.perf_counter() - start
+        return {"seconds": elapsed, "peak": _peak_rss() - baseline, "size": os.path.getsize(path)}
+    finally:
+        os.remove(path)
+
+def benchmark_html_report(counts=(1000, 10000, 100000)):
+    """In-memory vs streamed vs compact HTML report: time, peak RSS and size, each run in its own child"""
+    rows = []
+    for count in counts:
+        print_status(f"Rendering {count:,}-row reports...", "DATA")
+        runs = [run_forked(_html_render_trial, count, mode) for mode in ("memory", "stream", "compact")]
+        errors = [run["error"] for run in runs if "error" in run]
+        if errors:
+            print_status(f"{count:,} rows: {errors[0]}", "ERROR")
+            continue
+        memory_run, stream_run, compact_run = runs
+        rows.append([f"{count:,}", format_bytes(stream_run["size"]),
+                     f"{memory_run['seconds']:.2f}", format_bytes(memory_run["peak"]),
+                     f"{stream_run['seconds']:.2f}", format_bytes(stream_run["peak"]),
+                     f"{compact_run['seconds']:.2f}", format_bytes(compact_run["size"]),
+                     f"{stream_run['size'] / compact_run['size']:.1f}x"])
+
+    print(tabulate(rows, headers=["Rows", "Report size", "In-memory (s)", "In-memory peak RSS",
+                                  "Streamed (s)", "Streamed peak RSS", "Compact (s)", "Compact size",
+                                  "Size saving"], tablefmt="github"))
+    print_status("Peak RSS is measured from just before rendering, with the input data already built", "INFO")
+    print_status("In-memory = the same section writer into one string, then written; "
+                 "the old html += builder is not re-run", "INFO")
+    return rows
+
+def isolate_network():
+    """Move this process into an empty network namespace (Linux); True if outbound connects now fail"""
+    if CTYPES_AVAILABLE and sys.platform.startswith("linux"):
+        CLONE_NEWUSER, CLONE_NEWNET = 0x10000000, 0x40000000
+        libc = ctypes.CDLL(None, use_errno=True)
+        for flags in (CLONE_NEWNET, CLONE_NEWUSER | CLONE_NEWNET):
+            if libc.unshare(flags) == 0:
+                break
+    try:
+        socket.create_connection(("1.1.1.1", 443), timeout=1).close()
+        return False
+    except OSError:
+        return True
+
+def _offline_render_trial(count, compact):
+    """Render a report with networking disabled; time, size and the remote URLs it references"""
+    isolated = isolate_network()
+    snapshot = ProcessSnapshot([ProcessRecord(**_synthetic_process_fields(i)) for i in range(count)])
+    all_data = {"process_snapshot": snapshot.records, "process_info": snapshot.to_dicts()}
+    start = time.perf_counter()
+    html_content = generate_html_with_graphs(all_data, 85, "benchmark", compact=compact)
+    elapsed = time.perf_counter() - start
+    return {"isolated": isolated, "seconds": elapsed, "size": len(html_content.encode("utf-8")),
+            "remote": remote_references(html_content)}
+
+def benchmark_offline_report(count=1000):
+    """Confirm inline and compact reports render offline and reference nothing off the page"""
+    rows = []
+    for compact in (False, True):
+        run = run_forked(_offline_render_trial, count, compact)
+        if "error" in run:
+            print_status(f"{'compact' if compact else 'inline'} report: {run['error']}", "ERROR")
+            continue
+        rows.append(["compact" if compact else "inline", "yes" if run["isolated"] else "NO",
+                     f"{run['seconds'] * 1000:.0f}", format_bytes(run["size"]), len(run["remote"])])
+        for url in run["remote"]:
+            print_status(f"Remote reference: {url}", "WARNING")
+
+    print(tabulate(rows, headers=["Report", "Network disabled", "Render (ms)", "Size", "Remote references"],
+                   tablefmt="github"))
+    if rows and all(row[4] == 0 for row in rows):
+        print_status("Reports load no fonts, icons or scripts from the network", "SUCCESS")
+    return rows
+
+def benchmark_snapshot_render(counts=(1000, 10000, 100000)):
+    """Save/load a scan snapshot and render it to each format, without scanning"""
+    rows = []
+    for count in counts:
+        snapshot = ProcessSnapshot([ProcessRecord(**_synthetic_process_fields(i)) for i in range(count)])
+        all_data = {"scan_meta": scan_metadata(), "process_snapshot": snapshot.records,
+                    "process_info": snapshot.to_dicts()}
+        root = tempfile.mkdtemp(prefix="sys_scanner_snapshot_")
+        try:
+            path = os.path.join(root, "System_Analytics_Snapshot_benchmark.ndjson.gz")
+            start = time.perf_counter()
+            save_snapshot(path, all_data)
+            save_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            load_snapshot(path)
+            load_time = time.perf_counter() - start
+            
+            render_times = []
+            for fmt in REPORT_RENDERERS:
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    render_snapshot(path, fmt)
+                render_times.append(time.perf_counter() - start)
+            rows.append([f"{count:,}", format_bytes(os.path.getsize(path)), f"{save_time * 1000:.0f}",
+                         f"{load_time * 1000:.0f}"] + [f"{seconds * 1000:.0f}" for seconds in render_times])
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    print(tabulate(rows, headers=["Processes", "Snapshot (gz)", "Save (ms)", "Load (ms)"]
+                   + [f"Load + {fmt} (ms)" for fmt in REPORT_RENDERERS], tablefmt="github"))
+    return rows
+
+def benchmark_history_store(days=90, metrics=8, interval=300):
+    """Ingest `days` of synthetic samples day by day, then time rollup queries against raw aggregation"""
+    root = tempfile.mkdtemp(prefix="sys_scanner_history_")
+    try:
+        store = HistoryStore(os.path.join(root, "history.sqlite3"), host="bench-host")
+        names = ["cpu"] + [f"metric_{n}" for n in range(1, metrics)]
+        end = (int(time.time()) // 86400) * 86400
+        start_time = end - days * 86400
+        total = 0
+        start = time.perf_counter()
+        for day in range(days):
+            day_start = start_time + day * 86400
+            points = [(name, timestamp, (timestamp // interval * 7919 + index * 31) % 1000 / 10.0)
+                      for index, name in enumerate(names)
+                      for timestamp in range(day_start, day_start + 86400, interval)]
+            total += store.record_points(points, now=day_start + 86400)
+        ingest_time = time.perf_counter() - start
+        
+        def timed(func, repeat=20):
+            begin = time.perf_counter()
+            for _ in range(repeat):
+                result = func()
+            return result, (time.perf_counter() - begin) / repeat * 1000
+        
+        daily, daily_ms = timed(lambda: store.query("cpu", "p95", "day", days, now=end))
+        hourly, hourly_ms = timed(lambda: store.query("cpu", "p95", "hour", 7, now=end))
+        
+        def raw_daily_p95():
+            conn = store._connect()
+            try:
+                buckets = defaultdict(list)
+                for timestamp, value in conn.execute("SELECT timestamp, value FROM samples WHERE host = ? AND "
+                                                     "metric = ? AND timestamp >= ?",
+                                                     ("bench-host", "cpu", end - Config.HISTORY_RAW_DAYS * 86400)):
+                    buckets[int(timestamp // 86400)].append(value)
+                return {bucket: _percentile_sorted(sorted(values), 95) for bucket, values in buckets.items()}
+            finally:
+                conn.close()
+        raw, raw_ms = timed(raw_daily_p95, repeat=5)
+        
+        size = sum(os.path.getsize(os.path.join(root, name)) for name in os.listdir(root))
+        rows = [[f"{total:,}", f"{total / ingest_time:,.0f}", format_bytes(size),
+                 f"{len(daily)} / {daily_ms:.2f}", f"{len(hourly)} / {hourly_ms:.2f}",
+                 f"{len(raw)} / {raw_ms:.1f}"]]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(tabulate(rows, headers=["Points ingested", "Points/s", "Store size",
+                                  f"CPU p95/day, {days}d (rows / ms)", "CPU p95/hour, 7d (rows / ms)",
+                                  f"Raw p95/day, {Config.HISTORY_RAW_DAYS}d (rows / ms)"], tablefmt="github"))
+    print_status(f"Raw points kept {Config.HISTORY_RAW_DAYS} days; older days answer from rollups only", "INFO")
+    return rows
+
+def _synthetic_sampler_series(count, interval=0.5, seed=25):
+    """Sampler-like series: jittered half-second ticks, a 1-decimal CPU walk, slow memory, bursty disk writes"""
+    rng = random.Random(seed)
+    start = time.time() - count * interval
+    timestamps = [start + index * interval + rng.uniform(-0.002, 0.002) for index in range(count)]
+    cpu, memory, series = 20.0, 55.0, {"cpu": [], "memory": [], "disk_write": []}
+    for _ in range(count):
+        cpu = min(100.0, max(0.0, cpu + rng.choice((-1.5, -0.5, 0.0, 0.0, 0.5, 1.5))))
+        if rng.random() < 0.05:
+            memory = min(100.0, max(0.0, memory + rng.choice((-0.1, 0.1))))
+        series["cpu"].append(round(cpu, 1))
+        series["memory"].append(round(memory, 1))
+        series["disk_write"].append(float(rng.randrange(4096, 8 << 20, 4096)) if rng.random() < 0.1 else 0.0)
+    return timestamps, series
+
+def benchmark_series_archive(counts=(100000, 1000000)):
+    """Bytes per point and decode throughput of Gorilla blocks against JSON and SQLite rows"""
+    rows = []
+    for count in counts:
+        timestamps, series = _synthetic_sampler_series(count)
+        points = [(metric, timestamp, value) for metric, values in series.items()
+                  for timestamp, value in zip(timestamps, values)]
+        total = len(points)
+        root = tempfile.mkdtemp(prefix="sys_scanner_series_")
+        try:
+            # Plain JSON: one [time, value] list per metric
+            encoded = json.dumps({metric: [[timestamp, value] for timestamp, value in zip(timestamps, values)]
+                                  for metric, values in series.items()}, separators=(',', ':'))
+            start = time.perf_counter()
+            json.loads(encoded)
+            rows.append([f"{total:,}", "JSON", f"{len(encoded) / total:.2f}",
+                         f"{total / (time.perf_counter() - start):,.0f}", "-"])
+            del encoded
+            
+            # SQLite rows shaped like the history store's raw samples
+            db_path = os.path.join(root, "samples.sqlite3")
+            conn = sqlite3.connect(db_path)
+            conn.execute("CREATE TABLE samples (host TEXT, metric TEXT, timestamp REAL, value REAL, "
+                         "PRIMARY KEY (host, metric, timestamp)) WITHOUT ROWID")
+            conn.executemany("INSERT INTO samples VALUES ('bench-host', ?, ?, ?)", points)
+            conn.commit()
+            conn.execute("VACUUM")
+            start = time.perf_counter()
+            read = sum(1 for metric in series for _ in conn.execute(
+                "SELECT timestamp, value FROM samples WHERE host = 'bench-host' AND metric = ?", (metric,)))
+            sqlite_rate = read / (time.perf_counter() - start)
+            hour_start = timestamps[-1] - 3600
+            start = time.perf_counter()
+            recent = conn.execute("SELECT timestamp, value FROM samples WHERE host = 'bench-host' AND "
+                                  "metric = 'cpu' AND timestamp >= ?", (hour_start,)).fetchall()
+            sqlite_hour_ms = (time.perf_counter() - start) * 1000
+            conn.close()
+            rows.append([f"{total:,}", "SQLite rows", f"{os.path.getsize(db_path) / total:.2f}",
+                         f"{sqlite_rate:,.0f}", f"{len(recent):,} / {sqlite_hour_ms:.1f}"])
+            
+            # Gorilla blocks, written in scan-sized batches like the live archive
+            archive = SeriesArchive(os.path.join(root, "series"))
+            batch = 3600 * len(series)
+            for offset in range(0, total, batch):
+                archive.append(sorted(points[offset:offset + batch], key=lambda point: point[1]),
+                               host="bench-host", now=timestamps[-1])
+            size = sum(os.path.getsize(archive.series(metric, "bench-host").path) for metric in series)
+            start = time.perf_counter()
+            read = sum(1 for metric in series for _ in archive.read(metric, host="bench-host"))
+            gorilla_rate = read / (time.perf_counter() - start)
+            start = time.perf_counter()
+            recent = list(archive.read("cpu", start=hour_start, host="bench-host"))
+            gorilla_hour_ms = (time.perf_counter() - start) * 1000
+            rows.append([f"{total:,}", "Gorilla blocks", f"{size / total:.2f}",
+                         f"{gorilla_rate:,.0f}", f"{len(recent):,} / {gorilla_hour_ms:.1f}"])
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    print(tabulate(rows, headers=["Points", "Format", "Bytes/point", "Full decode points/s",
+                                  "Last hour of cpu (points / ms)"], tablefmt="github"))
+    print_status(f"Gorilla blocks hold {Config.SERIES_BLOCK_POINTS} points; range reads decode only "
+                 "the blocks they overlap", "INFO")
+    return rows
+
+BENCHMARKS = OrderedDict([
+    ("proc", benchmark_process_enumeration),
+    ("tracker", benchmark_process_tracker),
+    ("records", benchmark_process_records),
+    ("stats", benchmark_statistics),
+    ("html", benchmark_html_report),
+    ("offline", benchmark_offline_report),
+    ("snapshot", benchmark_snapshot_render),
+    ("history", benchmark_history_store),
+    ("series", benchmark_series_archive),
+])
+
+def run_benchmark(name):
+    """Run one named benchmark (or all of them)"""
+    names = list(BENCHMARKS) if name == "all" else [name]
+    for bench_name in names:
+        print_status(f"Benchmark: {bench_name}", "STATS")
+        BENCHMARKS[bench_name]()
+        print()
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="System Scanner - Ultimate Analytics Edition")
+    parser.add_argument("--benchmark", choices=list(BENCHMARKS) + ["all"],
+                        help="run a performance benchmark instead of a scan")
+    parser.add_argument("--full-tables", action="store_true",
+                        help="export every row of every table instead of one page")
+    parser.add_argument("--compact", action="store_true",
+                        help="embed report tables as one compressed payload (much smaller file)")
+    parser.add_argument("--page", type=int, default=1, metavar="N",
+                        help="which page of each table to report (default: 1)")
+    parser.add_argument("--render", metavar="SNAPSHOT",
+                        help="build a report from a saved scan snapshot instead of scanning")
+    parser.add_argument("--format", choices=list(REPORT_RENDERERS), default="html",
+                        help="report format for --render (default: html)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="where --render writes the report ('-' for stdout; default: next to the snapshot)")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="don't save the raw scan snapshot next to the report")
+    parser.add_argument("--history", metavar="METRIC",
+                        help="show a metric's trend from the scan history ('list' for metric names)")
+    parser.add_argument("--stat", choices=HISTORY_STATS, default="p95",
+                        help="statistic for --history (default: p95)")
+    parser.add_argument("--resolution", choices=list(HISTORY_RESOLUTIONS), default="day",
+                        help="bucket size for --history (default: day)")
+    parser.add_argument("--days", type=int, default=90,
+                        help="how far back --history looks (default: 90)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="don't record this scan in the history store")
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                        help="keep sampling the process table every SECONDS instead of writing a report")
+    args, _ = parser.parse_known_args(argv)
+    return args
 
 # -------------------------------------------------------------------
 #  MAIN EXECUTION FUNCTIONS
 # -------------------------------------------------------------------
+def watch_processes(interval, top=10):
+    """Daemon mode: refresh the process table incrementally and print churn + top CPU each tick"""
+    tracker = get_process_tracker()
+    if tracker is None:
+        print_status("Watch mode needs Linux /proc", "ERROR")
+        return
+
+    print_status(f"Watching processes every {interval:g}s (Ctrl+C to stop)", "INFO")
+    tracker.tick()
+    try:
+        while True:
+            time.sleep(interval)
+            start = time.perf_counter()
+            churn = tracker.tick()
+            tick_time = time.perf_counter() - start
+
+            busiest = heapq.nlargest(top, tracker.records(), key=lambda r: r["cpu_percent"])
+            print()
+            print_status(f"{datetime.now().strftime('%H:%M:%S')}  {churn['processes']} processes, "
+                         f"+{churn['spawned']} spawned, -{churn['exited']} exited "
+                         f"(tick {tick_time * 1000:.1f} ms)", "STATS")
+            print(tabulate([[r["pid"], r["name"][:30], f"{r['cpu_percent']:.1f}", f"{r['memory_percent']:.1f}",
+                             r["status"]] for r in busiest],
+                           headers=["PID", "Name", "CPU %", "Memory %", "Status"], tablefmt="simple"))
+    except KeyboardInterrupt:
+        summary = tracker.churn_summary()
+        print()
+        print_status(f"Stopped after {summary['ticks']} ticks: {summary['spawned']:,} spawned "
+                     f"({summary['spawn_rate']:.2f}/s), {summary['exited']:,} exited", "INFO")
+
 def print_banner():
     """Display professional hacker-style System Scanner banner"""
     banner = f"""
@@ -2586,6 +6252,11 @@ def display_statistics_preview(all_data):
         if "running_services" in stats:
             print_colored(f"    Running Services: {stats['running_services']}/{stats.get('total_services', 0)}", Colors.CYAN)
         
+        # Health rule hits
+        for hit in evaluate_health(all_data).hits:
+            print_colored(f"    [{hit['Severity']}] {hit['Rule']}: {hit['Finding']} ({hit['Points']})",
+                          Colors.YELLOW if hit["Points"].startswith("-") else Colors.CYAN)
+        
         print("\n")
         
         # Display graphs in terminal
@@ -2593,7 +6264,7 @@ def display_statistics_preview(all_data):
         print("\n")
         
         # CPU Usage Graph
-        processes = all_data.get("process_info", [])
+        processes = get_process_records(all_data)
         if processes:
             cpu_graph = generate_cpu_usage_graph(processes)
             if cpu_graph:
@@ -2621,9 +6292,25 @@ def display_statistics_preview(all_data):
         if health_graph:
             print_colored(health_graph, Colors.GREEN)
 
+def scan_metadata(started=None):
+    """Who/where/when of a scan, kept with its data so re-rendered reports show the original scan"""
+    started = started or datetime.now()
+    try:
+        user = getpass.getuser()
+    except:
+        user = "Unknown"
+    return {
+        "hostname": socket.gethostname() if hasattr(socket, 'gethostname') else "Unknown",
+        "platform": platform.platform() if hasattr(platform, 'platform') else "Unknown",
+        "user": user,
+        "report_id": started.strftime('%Y%m%d_%H%M%S'),
+        "started": started.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
 def collect_all_data():
     """Collect all system data"""
-    all_data = {}
+    all_data = {"scan_meta": scan_metadata()}
+    reset_scan_state()
     
     collection_functions = {
         "system_info": get_comprehensive_system_info,
@@ -2643,19 +6330,75 @@ def collect_all_data():
         "wifi_networks": get_wifi_networks_extended
     }
     
-    for name, func in collection_functions.items():
-        try:
-            print_status(f"Collecting {name.replace('_', ' ')}...", "DATA", "Please wait")
-            all_data[name] = func()
-            print_status(f"Collected {len(all_data[name]) if isinstance(all_data[name], list) else 'data'} items", "SUCCESS", name)
-        except Exception as e:
-            print_status(f"Failed to collect {name}: {str(e)[:50]}", "ERROR")
-            all_data[name] = [{"Error": f"Collection failed: {str(e)[:50]}"}]
+    def report_progress(name, result, info):
+        if info["state"] == "Completed":
+            count = len(result) if isinstance(result, list) else 'data'
+            print_status(f"Collected {count} items", "SUCCESS", f"{name} in {info['duration']:.2f}s")
+        elif info["state"] == "Timed Out":
+            print_status(f"Timed out collecting {name.replace('_', ' ')}", "WARNING", f"deadline {info['timeout']}s")
+        else:
+            print_status(f"Failed to collect {name}: {str(info['error'])[:50]}", "ERROR")
+
+    metrics_sampler.start()
+    collector = DataCollector()
+    print_status(f"Collecting {len(collection_functions)} sections in parallel...", "DATA",
+                 f"{min(collector.max_workers, len(collection_functions))} workers")
+    all_data.update(collector.collect_parallel(collection_functions, on_complete=report_progress))
+    all_data["collection_status"] = collector.get_status_table()
+
+    # Sampler averages/percentiles for the health score
+    all_data["metrics_summary"] = metrics_sampler.summaries()
+
+    # Raw process records shared by statistics, health score and graphs
+    snapshot = peek_process_snapshot()
+    if snapshot is not None:
+        all_data["process_snapshot"] = snapshot.records
+
+    all_data["table_pages"] = get_table_pages()
+    if all_data["table_pages"]:
+        print_status(f"{len(all_data['table_pages'])} table(s) show one page of rows "
+                     "(--page N for others, --full-tables for everything)", "INFO",
+                     ", ".join(f"{name}: {page['last'] - page['first'] + 1}/{page['total']}"
+                               for name, page in all_data["table_pages"].items()))
+    if collector.timed_out:
+        print_status(f"{len(collector.timed_out)} section(s) timed out: {', '.join(collector.timed_out)}", "WARNING")
+    if command_cache.hits:
+        print_status(f"Reused {command_cache.hits} cached command result(s)", "INFO", command_cache.path)
+    if command_runner.reaped_total:
+        print_status(f"Reaped {command_runner.reaped_total} stray command process(es) after timeouts", "WARNING")
+    print_status(f"Data collection finished in {collector.elapsed:.2f}s", "SUCCESS")
+    all_data["scan_meta"]["finished"] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     return all_data
 
 def main():
+    args = parse_arguments()
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+    if args.watch:
+        watch_processes(args.watch)
+        return
+    Config.FULL_TABLES = args.full_tables
+    Config.HTML_COMPACT = args.compact
+    Config.TABLE_PAGE = max(1, args.page)
+    Config.SAVE_SNAPSHOT = not args.no_snapshot
+    Config.HISTORY_ENABLED = not args.no_history
+    if args.history:
+        try:
+            show_history(args.history, args.stat, args.resolution, args.days)
+        except (sqlite3.Error, OSError) as e:
+            print_status(f"Could not read scan history: {str(e)}", "ERROR")
+        return
+    if args.render:
+        try:
+            render_snapshot(args.render, args.format, args.output)
+        except (OSError, ValueError) as e:
+            print_status(f"Could not render {args.render}: {str(e)}", "ERROR")
+        return
+    
     print_banner()
+    metrics_sampler.start()
     
     try:
         # Simulate scanning steps
@@ -2693,20 +6436,33 @@ def main():
         if not os.path.exists(downloads_folder):
             downloads_folder = os.getcwd()
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = all_data["scan_meta"]["report_id"]
         html_filename = f"System_Analytics_Report_{timestamp}.html"
         html_path = os.path.join(downloads_folder, html_filename)
         
+        # Raw snapshot first, so the scan can be re-rendered even if the report fails
+        if Config.SAVE_SNAPSHOT:
+            snapshot_path = os.path.join(downloads_folder, f"System_Analytics_Snapshot_{timestamp}.ndjson.gz")
+            try:
+                save_snapshot(snapshot_path, all_data)
+                print_status(f"Scan snapshot saved: {snapshot_path}", "SUCCESS",
+                             f"re-render with --render {snapshot_path}")
+            except (OSError, TypeError, ValueError) as e:
+                print_status(f"Could not save scan snapshot: {str(e)}", "WARNING")
+        
         # Health score calculation
         health_score = calculate_health_score(all_data)
         
-        # Generate HTML content with graphs
-        html_content = generate_html_with_graphs(all_data, health_score, timestamp)
+        if Config.HISTORY_ENABLED:
+            try:
+                stored = history_store.record_scan(all_data, health_score, metrics_sampler)
+                print_status(f"Recorded {stored} metric point(s) in scan history", "SUCCESS", history_store.path)
+            except (sqlite3.Error, OSError) as e:
+                print_status(f"Could not record scan history: {str(e)}", "WARNING")
         
-        # Write to file
+        # Stream the HTML report with graphs to file
         try:
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            save_html_report(html_path, all_data, health_score, timestamp)
             
             print_status(f"Analytics report generated successfully: {html_path}", "SUCCESS")
             
@@ -2764,6 +6520,8 @@ def main():
         import traceback
         traceback.print_exc()
     
+    metrics_sampler.stop()
+    
     # Keep window open if run directly
     if platform.system() == "Windows":
         try:
@@ -9,7 +9,7 @@ import re
 import json
 import time
 import threading
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
 
 # -------------------------------------------------------------------
@@ -50,7 +50,7 @@ class Config:
 # -------------------------------------------------------------------
 class SystemMonitor:
     def __init__(self):
-        self.performance_log = []
+        self.performance_log = deque(maxlen=Config.MAX_LOG_ENTRIES)
         self.security_events = []
         self.start_time = datetime.now()
 
@@ -61,8 +61,6 @@ class SystemMonitor:
             "value": value
         }
         self.performance_log.append(entry)
-        if len(self.performance_log) > Config.MAX_LOG_ENTRIES:
-            self.performance_log.pop(0)
 
     def log_security_event(self, event_type, description):
         event = {
@@ -844,7 +842,7 @@ def generate_json_report():
         },
         "system_health": {
             "score": get_system_health_score(),
-            "performance_log": monitor.performance_log[-10:],  # Last 10 entries
+            "performance_log": list(monitor.performance_log)[-10:],  # Last 10 entries
             "security_events": monitor.security_events[-5:]  # Last 5 events
         },
         "sections": {
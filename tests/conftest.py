@@ -0,0 +1,28 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(name):
+    """Import one of the standalone scanner scripts by file name (without running main)"""
+    if name in sys.modules:
+        return sys.modules[name]
+    argv = sys.argv
+    sys.argv = [name]  # some scripts read their arguments at import time
+    try:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, name + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.argv = argv
+    return module
+
+
+@pytest.fixture(scope="session")
+def v19():
+    return load_script("sys_d_v19")
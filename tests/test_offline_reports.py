@@ -0,0 +1,55 @@
+import re
+
+import pytest
+
+from conftest import load_script
+
+COLLECTORS = [
+    "get_device_specifications", "get_hardware_details", "get_advanced_storage_details",
+    "get_comprehensive_graphics_info", "get_network_analysis", "get_network_connections",
+    "get_comprehensive_wifi_analysis", "get_users_information", "get_system_services",
+    "get_installed_software", "get_system_drivers", "get_security_information", "get_power_management",
+    "get_system_environment_vars", "get_system_uptime_analysis", "get_system_logs",
+    "get_event_logs_summary", "get_advanced_system_details", "get_system_performance",
+    "get_task_manager_details",
+]
+
+# Carries the keys of every section layout (tables, performance cards)
+STUB_ROW = {"Category": "STUB", "Detail": "value", "Metric": "CPU Usage", "Value": "5%", "Details": "stub"}
+
+# The inline SVG icon's namespace is an identifier, not something the browser fetches
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+
+@pytest.fixture(params=["sys_d_v17", "sys_d_sh_v15"])
+def report_html(request, monkeypatch, tmp_path):
+    """Render the script's HTML report from a stub dataset and return (module, html)"""
+    module = load_script(request.param)
+    for name in COLLECTORS:
+        monkeypatch.setattr(module, name, lambda: [dict(STUB_ROW)])
+    monkeypatch.setattr(module, "get_system_health_score", lambda: 90)
+    monkeypatch.setattr(module, "get_downloads_folder", lambda: str(tmp_path))
+    monkeypatch.setattr(module, "print_banner", lambda: None)
+    monkeypatch.setattr(module, "simulate_scan_step", lambda *args, **kwargs: None)
+
+    with open(module.generate_html_report(), encoding="utf-8") as f:
+        return module, f.read()
+
+
+def test_report_has_no_remote_references(report_html, v19):
+    _, html = report_html
+    assert v19.remote_references(html) == []
+    urls = set(re.findall(r"""https?://[^\s"'<>)]+""", html)) - {SVG_NAMESPACE}
+    assert urls == set()
+    assert "@import" not in html
+
+
+def test_report_embeds_icon_and_font_fallback(report_html):
+    module, html = report_html
+    assert f'<link rel="icon" type="image/svg+xml" href="{module.REPORT_ICON}">' in html
+    assert "REPORT_ICON" not in html and "REPORT_MONO_FALLBACK" not in html
+
+    # The matrix canvas font is concatenated into the JS, not formatted
+    font_line = re.search(r"ctx\.font = (.*);", html).group(1)
+    assert font_line.endswith(f'''px '{font_line.split("'")[1]}', {module.REPORT_MONO_FALLBACK}"''')
+    assert font_line.startswith('charSize + "px ')
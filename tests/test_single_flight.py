@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+
+class Result:
+    def __init__(self, ok):
+        self.ok = ok
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def start_waiter(flight, key, func, **kwargs):
+    """Run flight.do in a thread once key is in flight; returns (thread, outcome dict)"""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["value"] = flight.do(key, func, **kwargs)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    time.sleep(0.05)  # let the waiter join the in-flight call
+    return thread, outcome
+
+
+def test_failed_leader_releases_waiters(v19):
+    flight = v19.SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(2)
+        raise OSError("boom")
+
+    leader, leader_outcome = start_waiter(flight, "cmd", failing, memoize_if=lambda r: r.ok)
+    wait_until(lambda: "cmd" in flight._inflight)
+    waiter, outcome = start_waiter(flight, "cmd", lambda: Result(True), memoize_if=lambda r: r.ok)
+    release.set()
+    leader.join(2)
+    waiter.join(2)
+
+    assert not waiter.is_alive()
+    assert isinstance(outcome["error"], OSError)
+    assert isinstance(leader_outcome["error"], OSError)
+    # Nothing left in flight, so the next identical call runs instead of hanging
+    assert flight.do("cmd", lambda: Result(True), memoize_if=lambda r: r.ok).ok
+
+
+def test_unmemoized_result_is_not_reused(v19):
+    flight = v19.SingleFlight()
+    assert not flight.do("cmd", lambda: Result(False), memoize_if=lambda r: r.ok).ok
+    assert flight.do("cmd", lambda: Result(True), memoize_if=lambda r: r.ok).ok
+
+
+def test_cancelled_async_leader_lets_waiter_retry(v19):
+    flight = v19.SingleFlight()
+    started = asyncio.Event()
+    calls = []
+
+    async def query(tag):
+        calls.append(tag)
+        started.set()
+        await asyncio.sleep(0 if tag == "waiter" else 10)
+        return Result(True)
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do_async("cmd", query, "leader", memoize_if=lambda r: r.ok))
+        await started.wait()
+        waiter = asyncio.ensure_future(flight.do_async("cmd", query, "waiter", memoize_if=lambda r: r.ok))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.wait_for(waiter, 2)
+
+    assert asyncio.run(scenario()).ok
+    assert calls == ["leader", "waiter"]
+
+
+def test_reset_wakes_waiters_of_a_stuck_call(v19):
+    flight = v19.SingleFlight()
+    release = threading.Event()
+
+    def stuck():
+        release.wait(5)
+        return "stale"
+
+    leader, _ = start_waiter(flight, "cmd", stuck)
+    wait_until(lambda: "cmd" in flight._inflight)
+    waiter, outcome = start_waiter(flight, "cmd", lambda: "fresh")
+
+    flight.reset()
+    waiter.join(2)
+    assert outcome == {"value": "fresh"}
+    assert flight.do("cmd", lambda: "other") == "fresh"
+
+    # The abandoned leader finishing later must not clobber the new scan's result
+    release.set()
+    leader.join(2)
+    assert flight.peek("cmd") == "fresh"